@@ -0,0 +1,346 @@
+"""
+python -m scripts.gambling_simulator
+python -m scripts.gambling_simulator --rounds 5000000 --games blackjack,baccarat --stand-on 16
+python -m scripts.gambling_simulator --bet 1000000000000 --engine-rounds 0
+
+gamblingSettings 의 배율/세금/잭팟 확률로 게임을 오프라인에서 돌려 본다.
+게임마다 NumPy 로 rounds 판을 한 번에 계산해서 기대값(EV), 표준편차, 하우스 엣지, 세금을 보여주고,
+잭팟은 한 서버의 잭팟 풀을 따라가며 당첨금이 얼마나 빠져나가는지(drain)를 계산한다.
+--engine-rounds 만큼은 봇이 실제로 쓰는 GamblingEngine 함수로 한 판씩 돌려서
+엔진 처리량(rounds/s)을 재고, EV 가 벡터 계산과 맞는지 확인한다.
+
+EV/표준편차/세금은 모두 베팅금 1 기준이다. 이기면 베팅금을 돌려받지 않고 bet × 배율(세후)을 더하고,
+지면 베팅금을 잃는다 (봇과 같다).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import GamblingEngine
+from src.config.settings.gamblingSettings import (
+    INCOME_TAX_BRACKETS,
+    SECURITIES_TRANSACTION_TAX_BRACKETS,
+    GAME_MULTIPLIER_RANGES,
+    BLACKJACK_21_MULTIPLIER,
+    BACCARAT_TIE_MULTIPLIER,
+    INITIAL_JACKPOT,
+    MIN_JACKPOT_BET,
+    JACKPOT_WIN_ODDS,
+    JACKPOT_PAYOUT_DIVISOR,
+)
+
+GAMES = ["coin", "dice", "blackjack", "baccarat", "indian_poker", "jackpot"]
+CHUNK = 200_000
+# 블랙잭 한 판에 쓰는 카드는 플레이어/딜러 합쳐 20장을 넘지 않는다
+BLACKJACK_DRAW = 20
+
+# GamblingEngine.CARDS 순서 (2..10, J, Q, K, A) 의 카드 값
+BJ_VALUES = np.array([2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11])
+BACCARAT_VALUES = np.array([2, 3, 4, 5, 6, 7, 8, 9, 0, 0, 0, 0, 1])
+ACE = 12
+
+
+def bracket_tax(amounts, brackets):
+    amounts = np.asarray(amounts, dtype=np.int64)
+    conditions = [amounts > threshold for threshold, _ in brackets]
+    taxes = [(amounts * rate).astype(np.int64) for _, rate in brackets]
+    return np.select(conditions, taxes, 0)
+
+
+def settle(bet, won, multipliers):
+    """GamblingEngine.settle 의 벡터판. (잔액 변화, 세금)"""
+    winnings = (bet * multipliers).astype(np.int64)
+    tax = np.where(won, bracket_tax(winnings, SECURITIES_TRANSACTION_TAX_BRACKETS), 0)
+    net = np.where(won, winnings - tax, -bet)
+    return net, tax
+
+
+def uniform_multiplier(rng, game, n):
+    low, high = GAME_MULTIPLIER_RANGES[game]
+    return rng.uniform(low, high, n)
+
+
+def draw_cards(rng, n, k):
+    """52장 덱에서 판마다 k장을 순서대로 뽑은 카드 번호 (n, k). 0..12 = 2..A"""
+    keys = rng.random((n, 52))
+    top = np.argpartition(keys, k, axis=1)[:, :k]
+    order = np.take_along_axis(keys, top, axis=1).argsort(axis=1)
+    return np.take_along_axis(top, order, axis=1) % 13
+
+
+def hand_value(total, aces):
+    # 21 을 넘으면 에이스를 필요한 만큼 1 로 센다
+    soft = np.minimum(aces, np.maximum(0, (total - 21 + 9) // 10))
+    return total - 10 * soft
+
+
+def sim_coin(rng, n, bet, args):
+    won = rng.random(n) < 0.5
+    return won, *settle(bet, won, uniform_multiplier(rng, "coin", n))
+
+
+def sim_dice(rng, n, bet, args):
+    won = rng.integers(0, GamblingEngine.DICE_FACES, n) == 0
+    return won, *settle(bet, won, uniform_multiplier(rng, "dice", n))
+
+
+def sim_blackjack(rng, n, bet, args):
+    ranks = draw_cards(rng, n, BLACKJACK_DRAW)
+    values = BJ_VALUES[ranks]
+    aces = (ranks == ACE).astype(np.int64)
+    rows = np.arange(n)
+
+    player_total = values[:, 0] + values[:, 1]
+    player_aces = aces[:, 0] + aces[:, 1]
+    dealer_total = values[:, 2] + values[:, 3]
+    dealer_aces = aces[:, 2] + aces[:, 3]
+    cursor = np.full(n, 4)
+
+    while True:
+        hit = rows[hand_value(player_total, player_aces) < args.stand_on]
+        if not hit.size:
+            break
+        player_total[hit] += values[hit, cursor[hit]]
+        player_aces[hit] += aces[hit, cursor[hit]]
+        cursor[hit] += 1
+    player_value = hand_value(player_total, player_aces)
+
+    # 버스트한 판은 딜러가 더 받지 않는다
+    while True:
+        draw = rows[(hand_value(dealer_total, dealer_aces) < 17) & (player_value <= 21)]
+        if not draw.size:
+            break
+        dealer_total[draw] += values[draw, cursor[draw]]
+        dealer_aces[draw] += aces[draw, cursor[draw]]
+        cursor[draw] += 1
+    dealer_value = hand_value(dealer_total, dealer_aces)
+
+    won = (player_value <= 21) & ((dealer_value > 21) | (player_value > dealer_value))
+    multipliers = np.where(
+        player_value == 21,
+        BLACKJACK_21_MULTIPLIER,
+        uniform_multiplier(rng, "blackjack", n),
+    )
+    return won, *settle(bet, won, multipliers)
+
+
+def sim_baccarat(rng, n, bet, args):
+    values = BACCARAT_VALUES[draw_cards(rng, n, 6)]
+    player = (values[:, 0] + values[:, 1]) % 10
+    banker = (values[:, 2] + values[:, 3]) % 10
+
+    player_draws = player <= 5
+    player = np.where(player_draws, (player + values[:, 4]) % 10, player)
+    banker_card = np.where(player_draws, values[:, 5], values[:, 4])
+    banker = np.where(banker <= 5, (banker + banker_card) % 10, banker)
+
+    result = np.where(player > banker, 0, np.where(banker > player, 1, 2))
+    won = result == ["Player", "Banker", "Tie"].index(args.baccarat_pick)
+    multipliers = np.where(
+        result == 2, BACCARAT_TIE_MULTIPLIER, uniform_multiplier(rng, "baccarat", n)
+    )
+    return won, *settle(bet, won, multipliers)
+
+
+def sim_indian_poker(rng, n, bet, args):
+    player = rng.integers(1, 11, n)
+    banker = rng.integers(1, 11, n)
+    call = banker < args.indian_call_below
+
+    won = call & (player > banker)
+    net, tax = settle(bet, won, uniform_multiplier(rng, "indian_poker", n))
+    net = np.where(call, net, -GamblingEngine.indian_die_loss(bet))
+    return won, net, tax
+
+
+def sim_jackpot(rng, n, bet, args):
+    """한 서버 잭팟 풀을 n 번 시도로 따라간다. 풀은 당첨 사이에는 선형으로 늘어나므로 당첨 횟수만큼만 돈다."""
+    won = rng.random(n) < 1 / JACKPOT_WIN_ODDS
+    net = np.full(n, -bet, dtype=np.int64)
+    tax = np.zeros(n, dtype=np.int64)
+
+    pool = args.jackpot_start
+    last = -1
+    paid_total = 0
+    for index in np.flatnonzero(won):
+        pool += bet * (index - last)
+        last = index
+        payout = pool // JACKPOT_PAYOUT_DIVISOR
+        payout_tax = int(bracket_tax([payout], INCOME_TAX_BRACKETS)[0])
+        net[index] += payout - payout_tax
+        tax[index] = payout_tax
+        paid_total += payout
+        pool = max(INITIAL_JACKPOT, pool - payout)
+    pool += bet * (n - 1 - last)
+
+    args.jackpot_state = {
+        "pool": pool,
+        "inflow": bet * n,
+        "paid": paid_total,
+        "hits": int(won.sum()),
+    }
+    return won, net, tax
+
+
+SIMULATORS = {
+    "coin": sim_coin,
+    "dice": sim_dice,
+    "blackjack": sim_blackjack,
+    "baccarat": sim_baccarat,
+    "indian_poker": sim_indian_poker,
+    "jackpot": sim_jackpot,
+}
+
+
+def engine_round(game, bet, args, rng, state):
+    """GamblingEngine 으로 한 판. (잔액 변화, 세금)"""
+    if game == "coin":
+        won = GamblingEngine.flip_coin(rng) == "앞"
+        return GamblingEngine.settle(bet, won, GamblingEngine.game_multiplier(game, rng), game)
+
+    if game == "dice":
+        won = GamblingEngine.roll_dice(rng) == "1"
+        return GamblingEngine.settle(bet, won, GamblingEngine.game_multiplier(game, rng), game)
+
+    if game == "blackjack":
+        deck, player_hand, dealer_hand = GamblingEngine.deal_blackjack(rng)
+        while GamblingEngine.calculate_hand_value(player_hand) < args.stand_on:
+            player_hand.append(deck.pop())
+        player_value = GamblingEngine.calculate_hand_value(player_hand)
+        if player_value > 21:
+            return -bet, 0
+        dealer_value = GamblingEngine.play_dealer(deck, dealer_hand)
+        won = GamblingEngine.blackjack_wins(player_value, dealer_value)
+        multiplier = GamblingEngine.blackjack_multiplier(player_value, rng)
+        return GamblingEngine.settle(bet, won, multiplier, game)
+
+    if game == "baccarat":
+        round_ = GamblingEngine.play_baccarat(rng)
+        won = round_.result == args.baccarat_pick
+        multiplier = GamblingEngine.baccarat_multiplier(round_.result, rng)
+        return GamblingEngine.settle(bet, won, multiplier, game)
+
+    if game == "indian_poker":
+        player_card, banker_card = GamblingEngine.deal_indian_poker(rng)
+        if banker_card >= args.indian_call_below:
+            return -GamblingEngine.indian_die_loss(bet), 0
+        won = player_card > banker_card
+        return GamblingEngine.settle(bet, won, GamblingEngine.game_multiplier(game, rng), game)
+
+    state["pool"] += bet
+    if not GamblingEngine.jackpot_hit(rng):
+        return -bet, 0
+    payout = GamblingEngine.jackpot_payout(state["pool"])
+    state["pool"] = max(INITIAL_JACKPOT, state["pool"] - payout)
+    tax = GamblingEngine.calculate_tax(payout, "jackpot")
+    return payout - tax - bet, tax
+
+
+def run_vectorized(game, args, rng):
+    bet = args.jackpot_bet if game == "jackpot" else args.bet
+    chunk = args.rounds if game == "jackpot" else CHUNK
+    started = time.perf_counter()
+
+    total = total_sq = total_tax = wins = 0
+    done = 0
+    while done < args.rounds:
+        n = min(chunk, args.rounds - done)
+        won, net, tax = SIMULATORS[game](rng, n, bet, args)
+        ratio = net / bet
+        total += ratio.sum()
+        total_sq += (ratio**2).sum()
+        total_tax += tax.sum() / bet
+        wins += int(won.sum())
+        done += n
+
+    elapsed = time.perf_counter() - started
+    ev = total / done
+    return {
+        "ev": ev,
+        "std": np.sqrt(max(0.0, total_sq / done - ev**2)),
+        "win_rate": wins / done,
+        "tax": total_tax / done,
+        "rate": done / elapsed,
+    }
+
+
+def run_engine(game, args):
+    bet = args.jackpot_bet if game == "jackpot" else args.bet
+    rng = random.Random(args.seed)
+    state = {"pool": args.jackpot_start}
+    started = time.perf_counter()
+    total = 0
+    for _ in range(args.engine_rounds):
+        net, _ = engine_round(game, bet, args, rng, state)
+        total += net
+    elapsed = time.perf_counter() - started
+    return {"ev": total / bet / args.engine_rounds, "rate": args.engine_rounds / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도박 게임 몬테카를로 시뮬레이터")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="게임마다 돌릴 판 수")
+    parser.add_argument("--games", default=",".join(GAMES), help="쉼표로 구분한 게임 목록")
+    parser.add_argument("--bet", type=int, default=10_000, help="게임 한 판 베팅금")
+    parser.add_argument("--jackpot-bet", type=int, default=MIN_JACKPOT_BET)
+    parser.add_argument("--jackpot-start", type=int, default=INITIAL_JACKPOT)
+    parser.add_argument("--stand-on", type=int, default=17, help="블랙잭: 이 합계 이상이면 멈춤")
+    parser.add_argument(
+        "--baccarat-pick", choices=["Player", "Banker", "Tie"], default="Banker"
+    )
+    parser.add_argument(
+        "--indian-call-below",
+        type=int,
+        default=11,
+        help="인디언 포커: 상대 카드가 이 값보다 작을 때만 콜 (11 = 항상 콜)",
+    )
+    parser.add_argument(
+        "--engine-rounds",
+        type=int,
+        default=100_000,
+        help="GamblingEngine 으로 한 판씩 돌려 처리량을 잴 판 수 (0 이면 생략)",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    games = [game.strip() for game in args.games.split(",") if game.strip()]
+    unknown = [game for game in games if game not in SIMULATORS]
+    if unknown:
+        parser.error(f"알 수 없는 게임: {', '.join(unknown)}")
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{args.rounds:,}판 / 베팅금 {args.bet:,}원 (잭팟 {args.jackpot_bet:,}원)\n")
+    print(
+        f"{'game':<14}{'EV':>9}{'edge':>9}{'std':>8}{'win':>8}{'tax':>8}"
+        f"{'numpy/s':>13}{'engine EV':>11}{'engine/s':>11}"
+    )
+
+    for game in games:
+        stats = run_vectorized(game, args, rng)
+        line = (
+            f"{game:<14}{stats['ev']:>+9.4f}{-stats['ev']:>+9.2%}{stats['std']:>8.3f}"
+            f"{stats['win_rate']:>8.2%}{stats['tax']:>8.4f}{stats['rate']:>13,.0f}"
+        )
+        if args.engine_rounds > 0:
+            engine = run_engine(game, args)
+            line += f"{engine['ev']:>+11.4f}{engine['rate']:>11,.0f}"
+        print(line)
+
+    state = getattr(args, "jackpot_state", None)
+    if state:
+        print(
+            f"\n잭팟: 당첨 {state['hits']:,}번, 유입 {state['inflow']:,}원 중 "
+            f"{state['paid'] / state['inflow']:.1%} 지급 (drain), "
+            f"풀 {args.jackpot_start:,}원 → {state['pool']:,}원"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,111 @@
+import asyncio
 import logging
+import time
+from typing import Any, Dict, Optional, Tuple
 import aiohttp
 from src.config.settings.Base import BaseConfig
+from src.config.settings.riotSettings import (
+    RIOT_GATEWAY_ACQUIRE_TIMEOUT,
+    RIOT_GATEWAY_CACHE_TTL,
+    RIOT_MAX_RETRIES,
+)
+from src.utils.cache.ttlCache import TTLCache
+from src.utils.concurrency.rateLimiter import RateLimiter
+from src.utils.metrics.latencyTracker import LatencyTracker
 
 logger = logging.getLogger(__name__)
 
+RATE_LIMITED_MESSAGE = "요청이 많아요. 잠시 후 다시 시도해주세요."
+
 
 class ApiGatewayClient:
+    _session: Optional[aiohttp.ClientSession] = None
+    _timeout = aiohttp.ClientTimeout(total=15)
+    stats = LatencyTracker()
+    # !롤/!발로 는 게이트웨이를 거쳐 라이엇 API 를 부른다. 게이트웨이 호출 하나가 라이엇 요청
+    # 여러 개가 되므로 자체 한도는 두지 않고, 게이트웨이가 넘겨주는 한도 헤더와 Retry-After 만 따른다.
+    # 같은 조회가 몰리면 한 번만 보낸다
+    _riot_limiter = RateLimiter([])
+    _riot_cache: TTLCache[dict] = TTLCache(
+        maxsize=512, ttl=RIOT_GATEWAY_CACHE_TTL, name="gateway.riot"
+    )
+
     def __init__(self):
         self.base_url = BaseConfig.API_GATEWAY_URL
-        self._timeout = aiohttp.ClientTimeout(total=15)
 
-    async def _get(self, path: str, params: dict = None) -> dict:
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=BaseConfig.API_GATEWAY_POOL_LIMIT,
+                limit_per_host=BaseConfig.API_GATEWAY_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            cls._session = aiohttp.ClientSession(
+                connector=connector, timeout=cls._timeout
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._session and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    @classmethod
+    def endpoint_stats(cls) -> Dict[str, Dict[str, float]]:
+        return cls.stats.snapshot()
+
+    async def _get(self, path: str, params: dict = None, endpoint: str = None) -> dict:
+        _, _, data = await self._request(path, params, endpoint)
+        return data
+
+    async def _request(
+        self, path: str, params: dict = None, endpoint: str = None
+    ) -> Tuple[int, Any, dict]:
         url = f"{self.base_url}{path}"
-        async with aiohttp.ClientSession(timeout=self._timeout) as session:
-            async with session.get(url, params=params) as resp:
-                return await resp.json()
+        endpoint = endpoint or path
+        started = time.perf_counter()
+        error = True
+        try:
+            async with self._get_session().get(url, params=params) as resp:
+                error = resp.status >= 400
+                if resp.status == 429:
+                    return resp.status, resp.headers, {}
+                return resp.status, resp.headers, await resp.json()
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.record(endpoint, elapsed, error=error)
+            if error:
+                logger.debug(f"API 게이트웨이 요청 실패: {endpoint} ({elapsed:.2f}s)")
+
+    async def _get_riot(self, path: str, endpoint: str = None) -> dict:
+        return await self._riot_cache.get_or_load(
+            path, lambda: self._fetch_riot(path, endpoint)
+        )
+
+    async def _fetch_riot(self, path: str, endpoint: str = None) -> dict:
+        for attempt in range(RIOT_MAX_RETRIES + 1):
+            try:
+                await self._riot_limiter.acquire(timeout=RIOT_GATEWAY_ACQUIRE_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise ValueError(RATE_LIMITED_MESSAGE)
+            status, headers, data = await self._request(path, endpoint=endpoint)
+            # 게이트웨이가 라이엇 한도 헤더를 넘겨주면 버킷을 그 값에 맞춘다
+            self._riot_limiter.update(headers, status)
+            if status != 429:
+                break
+            logger.debug(
+                f"게이트웨이 라이엇 요청 재시도 ({attempt + 1}/{RIOT_MAX_RETRIES}): {endpoint or path}"
+            )
+
+        # 일시적인 실패는 캐시하지 않는다
+        if status == 429:
+            raise ValueError(RATE_LIMITED_MESSAGE)
+        if status >= 500:
+            raise ValueError(data.get("error") or "전적 서버에 문제가 발생했습니다.")
+        return data
 
     async def get_meal(
         self, meal_type: str = "auto", day: str = "today", date: str = None
@@ -34,19 +125,27 @@ class ApiGatewayClient:
         return await self._get("/time/")
 
     async def get_lol_tier(self, riot_id: str) -> dict:
-        return await self._get(f"/riot/lol/tier/{riot_id}")
+        return await self._get_riot(
+            f"/riot/lol/tier/{riot_id}", endpoint="/riot/lol/tier/{riot_id}"
+        )
 
     async def get_lol_history(self, riot_id: str) -> dict:
-        return await self._get(f"/riot/lol/history/{riot_id}")
+        return await self._get_riot(
+            f"/riot/lol/history/{riot_id}", endpoint="/riot/lol/history/{riot_id}"
+        )
 
     async def get_lol_rotation(self) -> dict:
-        return await self._get("/riot/lol/rotation")
+        return await self._get_riot("/riot/lol/rotation")
 
     async def get_valo_tier(self, riot_id: str) -> dict:
-        return await self._get(f"/riot/valo/tier/{riot_id}")
+        return await self._get_riot(
+            f"/riot/valo/tier/{riot_id}", endpoint="/riot/valo/tier/{riot_id}"
+        )
 
     async def get_valo_history(self, riot_id: str) -> dict:
-        return await self._get(f"/riot/valo/history/{riot_id}")
+        return await self._get_riot(
+            f"/riot/valo/history/{riot_id}", endpoint="/riot/valo/history/{riot_id}"
+        )
 
     async def get_random_track(self) -> dict:
         return await self._get("/spotify/random")
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+import aiohttp
+from src.utils.cache.ttlCache import TTLCache
+from src.utils.text.messageNormalizer import normalize_message
+
+logger = logging.getLogger(__name__)
+
+
+class FilterApiClient:
+    """욕설 필터 서버 클라이언트.
+
+    짧은 구간(window) 안에 들어온 predict 요청을 모아 /predict/batch 한 번으로 보내고
+    결과를 기다리던 코루틴들에게 나눠준다. 서버에 배치 엔드포인트가 없으면
+    단건 /predict 요청으로 자동 전환한다. 결과는 정규화된 텍스트 기준으로 캐시되고,
+    같은 텍스트의 동시 요청은 하나의 요청을 공유한다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 5.0,
+        batch_window: float = 0.02,
+        max_batch_size: int = 16,
+        cache_size: int = 4096,
+        cache_ttl: float = 600.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_supported: Optional[bool] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.cache: TTLCache[bool] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl, name="filter.prediction"
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                connector=aiohttp.TCPConnector(limit_per_host=8, keepalive_timeout=30),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def predict(self, text: str) -> bool:
+        return await self.cache.get_or_load(
+            normalize_message(text), lambda: self._enqueue(text)
+        )
+
+    def invalidate_cache(self) -> None:
+        self.cache.clear()
+
+    async def _enqueue(self, text: str) -> bool:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            results = await self._predict_many(texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future in batch:
+            if not future.done():
+                future.set_result(results[text])
+
+    async def _predict_many(self, texts: List[str]) -> Dict[str, bool]:
+        if len(texts) > 1 and self._batch_supported is not False:
+            results = await self._predict_batch(texts)
+            if results is not None:
+                return results
+
+        flags = await asyncio.gather(*(self._predict_one(text) for text in texts))
+        return dict(zip(texts, flags))
+
+    async def _predict_batch(self, texts: List[str]) -> Optional[Dict[str, bool]]:
+        async with self._get_session().post(
+            f"{self.base_url}/predict/batch", json={"texts": texts}
+        ) as resp:
+            if resp.status in (404, 405):
+                self._batch_supported = False
+                logger.info("필터 서버에 배치 엔드포인트가 없어 단건 요청으로 전환합니다")
+                return None
+            resp.raise_for_status()
+            data = await resp.json()
+
+        self._batch_supported = True
+        results = data.get("results", [])
+        if len(results) != len(texts):
+            raise ValueError(f"배치 응답 개수 불일치: {len(results)}/{len(texts)}")
+        return {
+            text: bool(
+                result.get("is_profanity", False)
+                if isinstance(result, dict)
+                else result
+            )
+            for text, result in zip(texts, results)
+        }
+
+    async def _predict_one(self, text: str) -> bool:
+        async with self._get_session().post(
+            f"{self.base_url}/predict", json={"text": text}
+        ) as resp:
+            data = await resp.json()
+            return data.get("is_profanity", False)
+
+    async def status(self) -> dict:
+        async with self._get_session().get(f"{self.base_url}/status") as resp:
+            return await resp.json()
+
+    async def train(self) -> dict:
+        async with self._get_session().post(f"{self.base_url}/train") as resp:
+            return await resp.json()
+
+    async def send_feedback(self, text: str, label: int) -> None:
+        async with self._get_session().post(
+            f"{self.base_url}/feedback", json={"text": text, "label": label}
+        ):
+            pass
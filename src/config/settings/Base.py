@@ -13,6 +13,17 @@ class BaseConfig:
     DB_PASSWORD = os.getenv("DB_PASSWORD", "")
     DB_NAME = os.getenv("DB_NAME", "jee6_bot")
 
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+    DB_WORKER_THREADS = int(os.getenv("DB_WORKER_THREADS", str(DB_POOL_SIZE)))
+
+    DB_RAW_POOL_SIZE = int(os.getenv("DB_RAW_POOL_SIZE", "5"))
+    DB_RAW_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_RAW_POOL_ACQUIRE_TIMEOUT", "5.0"))
+    DB_RAW_POOL_MAX_IDLE = float(os.getenv("DB_RAW_POOL_MAX_IDLE", "300"))
+    DB_RAW_POOL_HEALTH_CHECK_INTERVAL = float(
+        os.getenv("DB_RAW_POOL_HEALTH_CHECK_INTERVAL", "30")
+    )
+
     DATABASE_URL = (
         f"mysql+mysqlconnector://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
         "?charset=utf8mb4&collation=utf8mb4_general_ci"
@@ -22,6 +33,28 @@ class BaseConfig:
     VLLM_BASE_URL = os.getenv("VLLM_BASE_URL", "http://localhost:8000/v1")
     VLLM_MODEL = os.getenv("VLLM_MODEL", "Qwen/Qwen2.5-7B-Instruct-AWQ")
 
+    LANG_PREFILTER_ENABLED = os.getenv("LANG_PREFILTER", "True").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    LANG_PREFILTER_THRESHOLD = float(os.getenv("LANG_PREFILTER_THRESHOLD", "0.2"))
+    LANG_PREFILTER_MIN_SAMPLES = int(os.getenv("LANG_PREFILTER_MIN_SAMPLES", "50"))
+    LANG_PREFILTER_RETRAIN_INTERVAL = int(
+        os.getenv("LANG_PREFILTER_RETRAIN_INTERVAL", "21600")
+    )
+    LANG_ROUTE_CACHE_SIZE = int(os.getenv("LANG_ROUTE_CACHE_SIZE", "2048"))
+    LANG_ROUTE_CACHE_TTL = float(os.getenv("LANG_ROUTE_CACHE_TTL", "1800"))
+    LANG_FEEDBACK_QUEUE_SIZE = int(os.getenv("LANG_FEEDBACK_QUEUE_SIZE", "5000"))
+    LANG_FEEDBACK_BATCH_SIZE = int(os.getenv("LANG_FEEDBACK_BATCH_SIZE", "200"))
+    LANG_FEEDBACK_FLUSH_INTERVAL = float(
+        os.getenv("LANG_FEEDBACK_FLUSH_INTERVAL", "2.0")
+    )
+    CHANNEL_REGISTRY_REFRESH_INTERVAL = float(
+        os.getenv("CHANNEL_REGISTRY_REFRESH_INTERVAL", "60")
+    )
+    CHANNEL_REGISTRY_MAX_BACKOFF = float(os.getenv("CHANNEL_REGISTRY_MAX_BACKOFF", "300"))
+
     SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
     SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
     SPOTIFY_PLAYLIST_ID = [
@@ -38,10 +71,36 @@ class BaseConfig:
     EXTERNAL_AUTH_TYPE = os.getenv("FLOODING_AUTH_TYPE", "bearer")
 
     API_GATEWAY_URL = os.getenv("API_GATEWAY_URL", "http://127.0.0.1:6974")
+    API_GATEWAY_POOL_LIMIT = int(os.getenv("API_GATEWAY_POOL_LIMIT", "100"))
+    API_GATEWAY_LIMIT_PER_HOST = int(os.getenv("API_GATEWAY_LIMIT_PER_HOST", "20"))
     FILTER_API_URL = os.getenv("FILTER_API_URL", "http://127.0.0.1:6975")
+    FILTER_BATCH_WINDOW_MS = int(os.getenv("FILTER_BATCH_WINDOW_MS", "20"))
+    FILTER_BATCH_MAX = int(os.getenv("FILTER_BATCH_MAX", "16"))
+    FILTER_CACHE_SIZE = int(os.getenv("FILTER_CACHE_SIZE", "4096"))
+    FILTER_CACHE_TTL = float(os.getenv("FILTER_CACHE_TTL", "600"))
 
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+    ADMIN_NAME = os.getenv("ADMIN_NAME", "nwoxsterziah")
+    # 0 이면 /metrics 엔드포인트를 띄우지 않는다
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+
+    # 저널은 기록마다 flush 하고, fsync 는 DB 반영(LEDGER_FLUSH_INTERVAL, 기본 2초)마다 한다.
+    # 프로세스가 죽어도 변경은 남지만 OS 가 죽거나 전원이 나가면 마지막 반영 이후의 변경
+    # (최대 LEDGER_FLUSH_INTERVAL 동안)은 잃을 수 있다
+    GAMBLING_LEDGER_ENABLED = os.getenv("GAMBLING_LEDGER", "False").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    GAMBLING_LEDGER_DIR = os.getenv(
+        "GAMBLING_LEDGER_DIR", str(BASE_DIR.parent / "data" / "ledger")
+    )
+    LOL_CHAMPION_CACHE_DIR = os.getenv(
+        "LOL_CHAMPION_CACHE_DIR", str(BASE_DIR.parent / "data" / "ddragon")
+    )
+
     ENABLE_MANAGEMENT_COMMANDS = os.getenv("M", "True").lower() in ("true", "1", "yes")
     ENABLE_GAMBLING_COMMANDS = os.getenv("G", "True").lower() in ("true", "1", "yes")
     ENABLE_LANG_COMMANDS = os.getenv("L", "True").lower() in ("true", "1", "yes")
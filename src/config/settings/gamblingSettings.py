@@ -3,15 +3,47 @@ MIN_JACKPOT_BET = 1000
 MAX_BET = 100_000_000_000_000
 
 INITIAL_JACKPOT = 1_000_000
+# 잭팟은 JACKPOT_WIN_ODDS 번에 한 번 당첨되고, 당첨금은 잭팟의 1/JACKPOT_PAYOUT_DIVISOR
+JACKPOT_WIN_ODDS = 100
+JACKPOT_PAYOUT_DIVISOR = 10
 
 JACKPOT_WIN_COOLDOWN = 1800
 GAME_COOLDOWN = 5
 WORK_COOLDOWN = 60
 
+COOLDOWNS = {
+    "coin": GAME_COOLDOWN,
+    "dice": GAME_COOLDOWN,
+    "blackjack": GAME_COOLDOWN,
+    "baccarat": GAME_COOLDOWN,
+    "indian_poker": GAME_COOLDOWN,
+    "jackpot": GAME_COOLDOWN,
+    "work": WORK_COOLDOWN,
+    "jackpot_win": JACKPOT_WIN_COOLDOWN,
+}
+# 이보다 긴 쿨다운만 DB 에 저장해서 재시작 후에도 유지한다
+COOLDOWN_PERSIST_MIN = 300
+COOLDOWN_FLUSH_INTERVAL = 10.0
+COOLDOWN_WHEEL_SLOTS = 512
+COOLDOWN_WHEEL_TICK = 1.0
+
 RESET_TIMES = [(7, 30), (12, 30), (18, 30)]
 
 WORK_REWARD_RANGE = (100, 2000)
 
+LEDGER_FLUSH_INTERVAL = 2.0
+LEDGER_FLUSH_THRESHOLD = 500
+LEDGER_MAX_CACHED = 10_000
+
+# 랭킹은 서버마다 상위 RANKING_DEPTH 명을 한 번 만들어 두고 잘라서 쓴다
+RANKING_DEPTH = 100
+RANKING_FETCH_CONCURRENCY = 5
+
+LOCK_STRIPES = 256
+
+# 이보다 오래 끝나지 않은 게임은 비정상 종료로 보고 정리한다
+ACTIVE_GAME_MAX_AGE = 600
+
 INCOME_TAX_BRACKETS = [
     (1_000_000_000_000_000, 0.45),
     (500_000_000_000_000, 0.42),
@@ -38,6 +70,9 @@ GIFT_TAX_BRACKETS = [
     (0, 0.05),
 ]
 
+BLACKJACK_21_MULTIPLIER = 2.0
+BACCARAT_TIE_MULTIPLIER = 8
+
 GAME_MULTIPLIER_RANGES = {
     "coin": (1.0, 1.2),
     "dice": (4.6, 5.7),
@@ -4,6 +4,11 @@ import os
 load_dotenv()
 
 RIOT_API_KEY = os.getenv("RIOT_API_KEY", "RIOT-API-KEY-NEEDED")
+RIOT_MAX_RETRIES = int(os.getenv("RIOT_MAX_RETRIES", "2"))
+# 한도에 걸렸을 때 명령이 기다리는 최대 시간(초). 넘으면 바로 "요청이 많아요" 를 보여준다
+RIOT_GATEWAY_ACQUIRE_TIMEOUT = float(os.getenv("RIOT_GATEWAY_ACQUIRE_TIMEOUT", "5"))
+# 게이트웨이를 거친 라이엇 조회 결과를 잠깐 들고 있어서 같은 조회가 몰려도 한 번만 보낸다
+RIOT_GATEWAY_CACHE_TTL = int(os.getenv("RIOT_GATEWAY_CACHE_TTL", "30"))
 
 LOL_BASE_URL = "https://kr.api.riotgames.com"
 LOL_ASIA_URL = "https://asia.api.riotgames.com"
@@ -11,6 +16,12 @@ LOL_ASIA_URL = "https://asia.api.riotgames.com"
 VALO_ASIA_URL = "https://asia.api.riotgames.com"
 VALO_AP_URL = "https://ap.api.riotgames.com"
 
+DDRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+DDRAGON_CHAMPION_URL = (
+    "https://ddragon.leagueoflegends.com/cdn/{version}/data/ko_KR/champion.json"
+)
+DDRAGON_REFRESH_INTERVAL = int(os.getenv("DDRAGON_REFRESH_INTERVAL", "21600"))
+
 LOL_GAME_MODES = {
     "CLASSIC": "소환사의 협곡",
     "ARAM": "칼바람 나락",
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, BigInteger, String
+from src.domain.models.base import Base
+
+
+class LedgerCheckpoint(Base):
+    __tablename__ = "ledger_checkpoints"
+
+    name = Column(String(50), primary_key=True)
+    seq = Column(BigInteger, default=0, nullable=False)
@@ -1,9 +1,10 @@
-from sqlalchemy import Column, BigInteger, Integer
+from sqlalchemy import Column, BigInteger, Integer, Index
 from src.domain.models.base import Base
 
 
 class UserBalance(Base):
     __tablename__ = "user_balances"
+    __table_args__ = (Index("idx_server_balance", "server_id", "balance"),)
 
     user_id = Column(BigInteger, primary_key=True)
     server_id = Column(BigInteger, primary_key=True)
@@ -1,14 +1,19 @@
 import mysql.connector
 from mysql.connector import Error, MySQLConnection
 import logging
-from typing import Optional, Callable, TypeVar
+import threading
+from typing import Optional, Callable, TypeVar, Dict
 from src.config.settings.Base import BaseConfig
+from src.infrastructure.database.pool import ConnectionPool, PoolTimeoutError
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
 class DatabaseConnection:
+    _pool: Optional[ConnectionPool[MySQLConnection]] = None
+    _pool_lock = threading.Lock()
+
     @staticmethod
     def get_config():
         return {
@@ -38,24 +43,57 @@ class DatabaseConnection:
             logger.error(f"Error connecting to MySQL: {e}")
             return None
 
+    @staticmethod
+    def _connect() -> MySQLConnection:
+        return mysql.connector.connect(**DatabaseConnection.get_config())
+
+    @staticmethod
+    def _reset(connection: MySQLConnection) -> None:
+        if connection.in_transaction:
+            connection.rollback()
+
+    @classmethod
+    def get_pool(cls) -> ConnectionPool[MySQLConnection]:
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls._pool = ConnectionPool(
+                        factory=cls._connect,
+                        size=BaseConfig.DB_RAW_POOL_SIZE,
+                        acquire_timeout=BaseConfig.DB_RAW_POOL_ACQUIRE_TIMEOUT,
+                        max_idle=BaseConfig.DB_RAW_POOL_MAX_IDLE,
+                        health_check_interval=BaseConfig.DB_RAW_POOL_HEALTH_CHECK_INTERVAL,
+                        is_alive=lambda connection: connection.is_connected(),
+                        reset=cls._reset,
+                        name="mysql",
+                    )
+                    logger.info(
+                        f"MySQL 커넥션 풀 생성 (size={BaseConfig.DB_RAW_POOL_SIZE})"
+                    )
+        return cls._pool
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, float]:
+        return cls._pool.stats() if cls._pool else {}
+
+    @classmethod
+    def close_pool(cls) -> None:
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+        if pool:
+            pool.close_all()
+
     @staticmethod
     def execute_query(func: Callable[[MySQLConnection], T]) -> Optional[T]:
-        connection = None
         try:
-            connection = DatabaseConnection.get_connection()
-            if not connection:
-                logger.error("Failed to get database connection")
-                return None
-
-            result = func(connection)
-            return result
+            with DatabaseConnection.get_pool().connection() as connection:
+                return func(connection)
+        except PoolTimeoutError as e:
+            logger.error(f"Failed to get database connection: {e}")
+            return None
         except Error as e:
             logger.error(f"Database error: {e}")
             return None
-        finally:
-            if connection and connection.is_connected():
-                connection.close()
-                logger.debug("Database connection closed")
 
 
 def get_connection():
@@ -0,0 +1,27 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from src.config.settings.Base import BaseConfig
+
+T = TypeVar("T")
+logger = logging.getLogger(__name__)
+
+# 동기 DB 드라이버 호출을 이벤트 루프 밖에서 실행하는 전용 워커 풀.
+# 워커 수를 엔진 커넥션 풀 크기에 맞춰, 워커가 커넥션을 기다리며 놀지 않게 한다.
+_executor = ThreadPoolExecutor(
+    max_workers=BaseConfig.DB_WORKER_THREADS, thread_name_prefix="db-worker"
+)
+
+
+async def run_in_db_executor(func: Callable[..., T], *args, **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_db_executor(wait: bool = True) -> None:
+    logger.info("DB 워커 풀 종료 중...")
+    _executor.shutdown(wait=wait)
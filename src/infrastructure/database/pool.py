@@ -0,0 +1,182 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Generic, Iterator, Optional, Tuple, TypeVar
+
+C = TypeVar("C")
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+class ConnectionPool(Generic[C]):
+    def __init__(
+        self,
+        factory: Callable[[], C],
+        size: int = 5,
+        acquire_timeout: float = 5.0,
+        max_idle: float = 300.0,
+        health_check_interval: float = 30.0,
+        is_alive: Optional[Callable[[C], bool]] = None,
+        reset: Optional[Callable[[C], None]] = None,
+        close: Optional[Callable[[C], None]] = None,
+        name: str = "pool",
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.acquire_timeout = acquire_timeout
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self.is_alive = is_alive or (lambda conn: True)
+        self.reset = reset
+        self._close = close or (lambda conn: conn.close())
+        self.name = name
+
+        self._idle: Deque[Tuple[C, float]] = deque()
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._acquired = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._health_failures = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def acquire(self, timeout: Optional[float] = None) -> C:
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            conn = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"{self.name} 풀이 이미 종료되었습니다")
+                    if self._idle:
+                        conn, last_used = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        self._created += 1
+                        last_used = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        logger.warning(
+                            f"{self.name} 커넥션 대기 시간 초과 ({timeout:.1f}s, 사용 중 {self._created}/{self.size})"
+                        )
+                        raise PoolTimeoutError(
+                            f"{self.name} 풀에서 {timeout:.1f}초 안에 커넥션을 얻지 못했습니다"
+                        )
+                    self._cond.wait(remaining)
+
+            if last_used is None:
+                try:
+                    conn = self.factory()
+                except Exception:
+                    self._forget()
+                    raise
+            else:
+                idle_for = time.monotonic() - last_used
+                if idle_for > self.max_idle:
+                    self._recycled += 1
+                    self._discard(conn)
+                    continue
+                if idle_for > self.health_check_interval and not self._check(conn):
+                    self._health_failures += 1
+                    self._discard(conn)
+                    continue
+
+            waited = time.monotonic() - started
+            with self._cond:
+                self._acquired += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            return conn
+
+    def release(self, conn: C, discard: bool = False) -> None:
+        if not discard and self.reset:
+            try:
+                self.reset(conn)
+            except Exception as e:
+                logger.warning(f"{self.name} 커넥션 초기화 실패, 폐기합니다: {e}")
+                discard = True
+
+        if discard:
+            self._discard(conn)
+            return
+
+        with self._cond:
+            if self._closed:
+                close_now = True
+            else:
+                close_now = False
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+        if close_now:
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[C]:
+        conn = self.acquire(timeout)
+        broken = False
+        try:
+            yield conn
+        except BaseException:
+            broken = not self._check(conn)
+            raise
+        finally:
+            self.release(conn, discard=broken)
+
+    def close_all(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        for conn in idle:
+            self._discard(conn)
+        logger.info(f"{self.name} 풀 종료 - 커넥션 {len(idle)}개 정리")
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "size": self.size,
+                "open": self._created,
+                "idle": idle,
+                "in_use": self._created - idle,
+                "acquired": self._acquired,
+                "timeouts": self._timeouts,
+                "recycled": self._recycled,
+                "health_failures": self._health_failures,
+                "wait_avg_ms": (
+                    self._wait_total / self._acquired * 1000 if self._acquired else 0.0
+                ),
+                "wait_max_ms": self._wait_max * 1000,
+            }
+
+    def _check(self, conn: C) -> bool:
+        try:
+            return bool(self.is_alive(conn))
+        except Exception:
+            return False
+
+    def _discard(self, conn: C) -> None:
+        try:
+            self._close(conn)
+        except Exception as e:
+            logger.debug(f"{self.name} 커넥션 종료 중 오류: {e}")
+        self._forget()
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
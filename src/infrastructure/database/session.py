@@ -4,6 +4,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from src.domain.models.base import Base
 from src.domain.models.LangFeedback import LangFeedback 
 from src.infrastructure.database.connection import DatabaseConnection
+from src.config.settings.Base import BaseConfig
 import logging
 from contextlib import contextmanager
 from typing import Generator
@@ -17,7 +18,11 @@ DATABASE_URL = (
 )
 
 engine = create_engine(
-    DATABASE_URL, pool_pre_ping=True, connect_args={"collation": config["collation"]}
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=BaseConfig.DB_POOL_SIZE,
+    max_overflow=BaseConfig.DB_MAX_OVERFLOW,
+    connect_args={"collation": config["collation"]},
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -73,5 +78,19 @@ def update_schema():
                     )
                     conn.commit()
                 logger.info("updated_at 컬럼 추가 완료")
+
+        if "user_balances" in inspector.get_table_names():
+            indexes = [index["name"] for index in inspector.get_indexes("user_balances")]
+            if "idx_server_balance" not in indexes:
+                logger.info("user_balances 테이블에 (server_id, balance) 인덱스 추가 중...")
+                with engine.connect() as conn:
+                    conn.execute(
+                        text(
+                            "ALTER TABLE user_balances "
+                            "ADD INDEX idx_server_balance (server_id, balance)"
+                        )
+                    )
+                    conn.commit()
+                logger.info("idx_server_balance 인덱스 추가 완료")
     except Exception as e:
         logger.error(f"테이블 스키마 업데이트 중 오류 발생: {e}")
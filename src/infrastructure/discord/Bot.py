@@ -12,18 +12,28 @@ from src.interfaces.commands.channel.SlowModeCommand import SlowModeCommand
 from src.interfaces.commands.justice.JusticeCommand import JusticeCommands
 from src.interfaces.commands.justice.ReleaseCommand import ReleaseCommand
 from src.interfaces.commands.information.InformationCommand import InformationCommands
+from src.interfaces.commands.information.MetricsCommand import MetricsCommand
 from src.interfaces.commands.information.WaterCommand import WaterCommand
 from src.interfaces.commands.meal.MealCommand import MealCommands
 from src.interfaces.commands.riot.LolCommand import LolCommands
 from src.interfaces.commands.riot.ValoCommand import ValoCommands
 from src.config.settings.Base import BaseConfig
 from src.services.MealService import MealService
+from src.services.GamblingService import GamblingService
+from src.services.LangFeedbackSink import LangFeedbackSink
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
+from src.clients.ApiGatewayClient import ApiGatewayClient
 from src.interfaces.commands.school.GraduationCommand import GraduationCommand
 from src.interfaces.commands.school.PromotionCommand import PromotionCommand
 from src.interfaces.commands.MentionCommand import MentionCommand
 from src.interfaces.commands.music.SpotifyCommand import SpotifyCommand
 from src.interfaces.commands.lang.LangCommand import LangCommand
 from src.interfaces.commands.filter.ProfanityListener import ProfanityListener
+from src.infrastructure.database.executor import shutdown_db_executor
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.discord.pipeline import COMMAND, MessagePipeline
+from src.infrastructure.metrics.server import MetricsServer
+from src.utils.concurrency.deadlineTimer import DeadlineTimer
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +52,21 @@ class Bot(commands.Bot):
         self.container.bot.override(self)
         self.remove_command("help")
 
+        self.pipeline = MessagePipeline(
+            BaseConfig.PREFIX, ChannelFeatureRegistry.instance()
+        )
+        self.pipeline.register(COMMAND, self.process_commands)
+        self.metrics_server = (
+            MetricsServer(BaseConfig.METRICS_HOST, BaseConfig.METRICS_PORT)
+            if BaseConfig.METRICS_PORT
+            else None
+        )
+
     async def setup_hook(self) -> None:
+        await ChannelFeatureRegistry.instance().start()
+        if self.metrics_server:
+            await self.metrics_server.start()
+
         if BaseConfig.ENABLE_MANAGEMENT_COMMANDS:
             await self.add_cog(ChannelCommands(self, self.container))
             await self.add_cog(CleanCommand(self, self.container))
@@ -55,6 +79,7 @@ class Bot(commands.Bot):
             await self.add_cog(self.container.gambling_card_games())
 
         await self.add_cog(InformationCommands(self, self.container))
+        await self.add_cog(MetricsCommand(self, self.container))
         await self.add_cog(WaterCommand(self, self.container))
         await self.add_cog(MealCommands(self, self.container))
         await self.add_cog(LolCommands(self, self.container))
@@ -82,6 +107,25 @@ class Bot(commands.Bot):
         print(f"Connected to {len(self.guilds)} guilds")
         print(f"Management commands enabled: {BaseConfig.ENABLE_MANAGEMENT_COMMANDS}")
 
+    async def on_message(self, message):
+        await self.pipeline.dispatch(message)
+
+    async def close(self):
+        await super().close()
+        if self.metrics_server:
+            await self.metrics_server.close()
+        if DeadlineTimer._instance is not None:
+            await DeadlineTimer._instance.close()
+        await ApiGatewayClient.close()
+        if GamblingService._instance is not None:
+            await GamblingService._instance.close()
+        if ChannelFeatureRegistry._instance is not None:
+            await ChannelFeatureRegistry._instance.close()
+        if LangFeedbackSink._instance is not None:
+            await LangFeedbackSink._instance.close()
+        shutdown_db_executor()
+        DatabaseConnection.close_pool()
+
     async def _preload_meal_cache(self):
         try:
             logger.info("급식 정보 캐시 사전 로딩 시작...")
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+
+import discord
+
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
+from src.utils.metrics.latencyTracker import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[discord.Message], Awaitable[None]]
+
+COMMAND = "command"
+# 자연어 모드 채널에서 접두사 명령을 쓴 경우 (암묵적 피드백 신호)
+LANG_COMMAND = "lang_command"
+LANG = "lang"
+FILTER = "filter"
+
+
+class MessagePipeline:
+    """모든 메시지를 한 번만 분류해서 등록된 핸들러로 보내는 디스패처.
+
+    분류 결과마다 핸들러를 별도 태스크로 실행하므로 느린 LLM 처리가 명령이나
+    욕설 필터를 막지 않는다. 분류와 핸들러별 소요 시간은 stats 에 쌓인다.
+    """
+
+    def __init__(self, prefix: str, registry: ChannelFeatureRegistry):
+        self.prefix = prefix
+        self.registry = registry
+        self.stats = LatencyTracker()
+        self.counters: Counter = Counter()
+        self._handlers: Dict[str, List[MessageHandler]] = defaultdict(list)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def register(self, route: str, handler: MessageHandler) -> None:
+        self._handlers[route].append(handler)
+
+    def unregister(self, route: str, handler: MessageHandler) -> None:
+        if handler in self._handlers[route]:
+            self._handlers[route].remove(handler)
+
+    def classify(self, message: discord.Message) -> Tuple[str, ...]:
+        if message.author.bot:
+            return ()
+
+        channel_id = message.channel.id
+        content = message.content or ""
+
+        if content.startswith(self.prefix):
+            if message.guild and self.registry.is_enabled(LANG, channel_id):
+                return (COMMAND, LANG_COMMAND)
+            return (COMMAND,)
+
+        if not message.guild or not content:
+            return ()
+
+        routes = []
+        if self.registry.is_enabled(LANG, channel_id):
+            routes.append(LANG)
+        if self.registry.is_enabled(FILTER, channel_id):
+            routes.append(FILTER)
+        return tuple(routes)
+
+    async def dispatch(self, message: discord.Message) -> None:
+        with self.stats.measure("classify"):
+            routes = self.classify(message)
+
+        if not routes:
+            self.counters["ignored"] += 1
+            return
+
+        for route in routes:
+            self.counters[route] += 1
+            for handler in self._handlers[route]:
+                task = asyncio.create_task(self._run(route, handler, message))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, route: str, handler: MessageHandler, message: discord.Message
+    ) -> None:
+        started = time.perf_counter()
+        failed = False
+        try:
+            await handler(message)
+        except Exception as e:
+            failed = True
+            logger.error(f"메시지 처리 중 오류 ({route}): {e}", exc_info=True)
+        finally:
+            self.stats.record(route, time.perf_counter() - started, error=failed)
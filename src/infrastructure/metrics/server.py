@@ -0,0 +1,43 @@
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from src.utils.metrics.cacheMetrics import render_prometheus
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsServer:
+    """캐시 지표를 Prometheus 텍스트 형식으로 내보내는 /metrics 엔드포인트.
+
+    운영자용이므로 기본은 127.0.0.1 에만 바인딩한다.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/metrics", self._metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        try:
+            await web.TCPSite(self._runner, self.host, self.port).start()
+        except OSError as e:
+            logger.warning(f"지표 엔드포인트 시작 실패 ({self.host}:{self.port}): {e}")
+            await self.close()
+            return
+        logger.info(f"지표 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=render_prometheus(), content_type="text/plain", charset="utf-8"
+        )
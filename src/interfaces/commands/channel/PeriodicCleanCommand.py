@@ -7,6 +7,7 @@ from src.infrastructure.database.session import get_db_session
 from sqlalchemy import text
 from src.utils.time.timeParser import parse_time_string
 from src.utils.time.formatSeconds import format_seconds
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -200,6 +201,7 @@ class PeriodicCleanCommand(BaseCommand):
             with get_db_session() as db:
                 repo = self.container.periodic_clean_repository(db=db)
                 repo.enable(ctx.guild.id, channel.id, channel.name, seconds)
+                ChannelFeatureRegistry.instance().invalidate()
         except Exception as e:
             await ctx.send(
                 embed=ChannelEmbed.create_error_embed(e)
@@ -260,6 +262,7 @@ class PeriodicCleanCommand(BaseCommand):
                     return
 
                 repo.disable_by_name(guild_id, channel_name_to_search)
+                ChannelFeatureRegistry.instance().invalidate()
 
                 cancelled_tasks = 0
                 for record in records:
@@ -8,6 +8,7 @@ from src.interfaces.commands.Base import BaseCommand
 from src.utils.embeds.ChannelEmbed import ChannelEmbed
 from src.infrastructure.database.session import get_db_session
 from src.services.SlowModeService import SlowModeService
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +137,7 @@ class SlowModeCommand(BaseCommand):
             with get_db_session() as db:
                 repo = self.container.slow_mode_repository(db=db)
                 repo.enable(ctx.guild.id, channel.id, channel.name)
+                ChannelFeatureRegistry.instance().invalidate()
         except Exception as e:
             await ctx.send(
                 embed=ChannelEmbed.create_error_embed(
@@ -205,6 +207,7 @@ class SlowModeCommand(BaseCommand):
                         del self.slow_mode_tasks[task_key]
 
                 repo.disable_by_name(ctx.guild.id, channel_name_to_search)
+                ChannelFeatureRegistry.instance().invalidate()
 
                 await self.slow_mode_service.remove_slow_mode(channel)
 
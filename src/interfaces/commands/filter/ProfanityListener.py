@@ -1,40 +1,48 @@
+import asyncio
 import logging
-import aiohttp
 from discord.ext import commands
 from src.interfaces.commands.Base import BaseCommand
 from src.config.settings.Base import BaseConfig
+from src.clients.FilterApiClient import FilterApiClient
 from src.infrastructure.database.session import get_db_session
 from src.repositories.ChannelFilterRepository import ChannelFilterRepository
 from src.domain.models.ChannelFilter import ChannelFilter
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
+from src.infrastructure.discord.pipeline import FILTER
 
 logger = logging.getLogger(__name__)
 
 PROFANITY_EMOJI = "\U0001F92C"  # 🤬
 FALSE_POSITIVE_EMOJI = "\u274C"  # ❌
-ADMIN_NAME = "nwoxsterziah"
+ADMIN_NAME = BaseConfig.ADMIN_NAME
+TRAIN_POLL_INTERVAL = 10
+TRAIN_POLL_LIMIT = 180
 
 
 class ProfanityListener(BaseCommand):
     def __init__(self, bot, container):
         super().__init__(bot, container)
-        self.filter_url = BaseConfig.FILTER_API_URL
-        self._timeout = aiohttp.ClientTimeout(total=5)
-        self._enabled_channels: set[int] = set()
-        self._cache_loaded = False
+        self.filter_client = FilterApiClient(
+            BaseConfig.FILTER_API_URL,
+            timeout=5,
+            batch_window=BaseConfig.FILTER_BATCH_WINDOW_MS / 1000,
+            max_batch_size=BaseConfig.FILTER_BATCH_MAX,
+            cache_size=BaseConfig.FILTER_CACHE_SIZE,
+            cache_ttl=BaseConfig.FILTER_CACHE_TTL,
+        )
+        self._train_watcher: asyncio.Task | None = None
+        self.channel_registry = ChannelFeatureRegistry.instance()
         # message_id -> original text (for feedback tracking)
         self._flagged_messages: dict[int, str] = {}
 
-    def _load_enabled_channels(self):
-        if self._cache_loaded:
-            return
-        try:
-            with get_db_session() as db:
-                repo = ChannelFilterRepository(model=ChannelFilter, db=db)
-                self._enabled_channels = repo.get_all_enabled_channel_ids()
-            self._cache_loaded = True
-            logger.info(f"욕설 필터 활성 채널 {len(self._enabled_channels)}개 로드")
-        except Exception as e:
-            logger.error(f"욕설 필터 채널 로드 실패: {e}")
+    async def cog_load(self):
+        self.bot.pipeline.register(FILTER, self.handle_message)
+
+    async def cog_unload(self):
+        self.bot.pipeline.unregister(FILTER, self.handle_message)
+        if self._train_watcher:
+            self._train_watcher.cancel()
+        await self.filter_client.close()
 
     @commands.command(
         name="filter",
@@ -44,19 +52,17 @@ class ProfanityListener(BaseCommand):
     async def toggle_filter(self, ctx):
         if ctx.author.name != ADMIN_NAME:
             return
-        self._load_enabled_channels()
         try:
             with get_db_session() as db:
                 repo = ChannelFilterRepository(model=ChannelFilter, db=db)
                 now_enabled = repo.toggle(ctx.guild.id, ctx.channel.id)
 
+            self.channel_registry.invalidate()
             if now_enabled:
-                self._enabled_channels.add(ctx.channel.id)
                 await ctx.reply("욕설 필터가 **활성화**되었습니다.\n"
                                 f"오탐: 봇의 {PROFANITY_EMOJI}에 {FALSE_POSITIVE_EMOJI} 리액션\n"
                                 f"미탐: 메시지에 {PROFANITY_EMOJI} 리액션")
             else:
-                self._enabled_channels.discard(ctx.channel.id)
                 await ctx.reply("욕설 필터가 **비활성화**되었습니다.")
         except Exception as e:
             logger.error(f"Filter toggle error: {e}")
@@ -71,24 +77,27 @@ class ProfanityListener(BaseCommand):
         if ctx.author.name != ADMIN_NAME:
             return
         try:
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.get(f"{self.filter_url}/status") as resp:
-                    status = await resp.json()
+            status = await self.filter_client.status()
 
-                count = status.get("feedback_count", 0)
-                if count < 5:
-                    await ctx.reply(f"피드백 {count}개 — 최소 5개 필요합니다.")
-                    return
+            count = status.get("feedback_count", 0)
+            if count < 5:
+                await ctx.reply(f"피드백 {count}개 — 최소 5개 필요합니다.")
+                return
 
-                msg = await ctx.reply(f"학습 시작 (피드백 {count}개)...")
+            msg = await ctx.reply(f"학습 시작 (피드백 {count}개)...")
 
-                async with session.post(f"{self.filter_url}/train") as resp:
-                    result = await resp.json()
+            result = await self.filter_client.train()
 
-                if result.get("status") == "training":
-                    await msg.edit(content=f"학습 중... (피드백 {count}개, 백그라운드 처리)")
-                else:
-                    await msg.edit(content=f"학습 결과: {result}")
+            if result.get("status") == "training":
+                await msg.edit(content=f"학습 중... (피드백 {count}개, 백그라운드 처리)")
+                if self._train_watcher:
+                    self._train_watcher.cancel()
+                self._train_watcher = asyncio.create_task(
+                    self._wait_for_training(msg, count)
+                )
+            else:
+                self.filter_client.invalidate_cache()
+                await msg.edit(content=f"학습 결과: {result}")
         except Exception as e:
             logger.error(f"Train error: {e}")
             await ctx.reply("학습 요청 중 오류가 발생했습니다.")
@@ -102,29 +111,21 @@ class ProfanityListener(BaseCommand):
         if ctx.author.name != ADMIN_NAME:
             return
         try:
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.get(f"{self.filter_url}/status") as resp:
-                    status = await resp.json()
+            status = await self.filter_client.status()
             fine_tuned = "사용 중" if status.get("fine_tuned") else "미적용"
             count = status.get("feedback_count", 0)
-            await ctx.reply(f"Fine-tuned 모델: **{fine_tuned}**\n축적 피드백: **{count}개**")
+            cache = self.filter_client.cache.stats()
+            await ctx.reply(
+                f"Fine-tuned 모델: **{fine_tuned}**\n축적 피드백: **{count}개**\n"
+                f"예측 캐시: **{cache['hit_ratio']:.1%}** 적중 "
+                f"(적중 {cache['hits']} · 합류 {cache['coalesced']} · 미스 {cache['misses']}, "
+                f"{cache['size']}/{cache['maxsize']})"
+            )
         except Exception as e:
             logger.error(f"Status error: {e}")
             await ctx.reply("상태 조회 중 오류가 발생했습니다.")
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        if message.author.bot:
-            return
-        if not message.guild:
-            return
-        if not message.content or message.content.startswith(BaseConfig.PREFIX):
-            return
-
-        self._load_enabled_channels()
-        if message.channel.id not in self._enabled_channels:
-            return
-
+    async def handle_message(self, message):
         try:
             is_profanity = await self._check_profanity(message.content)
             if is_profanity:
@@ -165,21 +166,28 @@ class ProfanityListener(BaseCommand):
             await self._send_feedback(message.content, label=1)  # 1 = profanity
             logger.info(f"피드백(미탐): {message.content[:30]}...")
 
+    async def _wait_for_training(self, msg, count: int):
+        try:
+            for _ in range(TRAIN_POLL_LIMIT):
+                await asyncio.sleep(TRAIN_POLL_INTERVAL)
+                status = await self.filter_client.status()
+                if not status.get("training") and status.get("status") != "training":
+                    break
+            else:
+                logger.warning("필터 학습 완료를 확인하지 못했습니다. 예측 캐시만 비웁니다.")
+            self.filter_client.invalidate_cache()
+            await msg.edit(content=f"학습 완료 (피드백 {count}개)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.filter_client.invalidate_cache()
+            logger.error(f"Train watch error: {e}")
+
     async def _check_profanity(self, text: str) -> bool:
-        async with aiohttp.ClientSession(timeout=self._timeout) as session:
-            async with session.post(
-                f"{self.filter_url}/predict",
-                json={"text": text},
-            ) as resp:
-                data = await resp.json()
-                return data.get("is_profanity", False)
+        return await self.filter_client.predict(text)
 
     async def _send_feedback(self, text: str, label: int):
         try:
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                await session.post(
-                    f"{self.filter_url}/feedback",
-                    json={"text": text, "label": label},
-                )
+            await self.filter_client.send_feedback(text, label)
         except Exception as e:
             logger.error(f"Feedback send error: {e}")
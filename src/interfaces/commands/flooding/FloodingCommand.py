@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import discord
 from discord.ext import commands
 
 from src.clients.FloodingApiClient import BotBaseError
 from src.interfaces.commands.Base import BaseCommand
+from src.interfaces.views.GameSession import PaginatorSession
 from src.schemas.FloodingResponse import MusicItem
 from src.utils.embeds.FloodingEmbed import FloodingEmbed
 
@@ -67,37 +67,8 @@ class FloodingCommand(BaseCommand):
             embed.set_footer(text=f"{page}/{total}")
             return embed
 
-        current = 0
-        message = await ctx.reply(embed=make_embed(items[current], current + 1, len(items)))
-
-        if len(items) == 1:
-            return
-
-        await message.add_reaction("◀️")
-        await message.add_reaction("▶️")
-
-        def check(reaction, user):
-            return (
-                user == ctx.author
-                and str(reaction.emoji) in ["◀️", "▶️"]
-                and reaction.message.id == message.id
-            )
-
-        while True:
-            try:
-                reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
-
-                if str(reaction.emoji) == "▶️" and current < len(items) - 1:
-                    current += 1
-                elif str(reaction.emoji) == "◀️" and current > 0:
-                    current -= 1
-
-                await message.edit(embed=make_embed(items[current], current + 1, len(items)))
-                await message.remove_reaction(reaction, user)
-
-            except asyncio.TimeoutError:
-                await message.clear_reactions()
-                break
+        pages = [make_embed(item, page, len(items)) for page, item in enumerate(items, start=1)]
+        await PaginatorSession(ctx.author.id, pages).start(ctx)
 
     @commands.command(name="플러딩.음악신청", aliases=["플러딩.기상음악신청"], description="유튜브 URL로 음악을 신청합니다.")
     async def request_music(self, ctx: commands.Context, music_url: str = None) -> None:
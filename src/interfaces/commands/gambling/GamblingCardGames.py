@@ -1,17 +1,16 @@
 import discord
 from discord.ext import commands
 import logging
-import random
-import asyncio
 
 from src.interfaces.commands.Base import BaseCommand
-from src.services.GamblingService import GamblingService, GamblingManager
+from src.services.GamblingService import GamblingService
+from src.services.ActiveGameRegistry import ActiveGameRegistry
+from src.services import GamblingEngine
 from src.utils.embeds.GamblingEmbed import GamblingEmbed
+from src.interfaces.views.GameSession import ChoiceSession
 from src.config.settings.gamblingSettings import (
     MIN_BET,
     MAX_BET,
-    GAME_COOLDOWN,
-    GAME_MULTIPLIER_RANGES,
 )
 
 logger = logging.getLogger(__name__)
@@ -21,10 +20,7 @@ class GamblingCardGames(BaseCommand):
     def __init__(self, bot, container):
         super().__init__(bot, container)
         self.gambling_service = GamblingService()
-        self.game_manager = GamblingManager()
-        self.blackjack_players = set()
-        self.baccarat_players = set()
-        self.indian_poker_players = set()
+        self.games = ActiveGameRegistry.instance()
 
     async def _parse_bet_amount(
         self, bet_str: str, user_id: int, server_id: int
@@ -36,22 +32,32 @@ class GamblingCardGames(BaseCommand):
         except (ValueError, TypeError):
             return None
 
-    async def _handle_timeout(self, user_id, server_id, bet_amount, game_message):
-        lock = await self.gambling_service._get_lock(user_id)
-        async with lock:
-            await self.gambling_service.subtract_balance(user_id, server_id, bet_amount)
-            balance = await self.gambling_service.get_balance(user_id, server_id)
+    async def _handle_timeout(self, user_id, server_id, bet_amount):
+        async with self.gambling_service.user_lock(user_id):
+            balance = await self.gambling_service.subtract_balance(
+                user_id, server_id, bet_amount
+            )
 
-        embed = discord.Embed(
+        return discord.Embed(
             title="⏳️ 시간 초과",
             description=f"30초 동안 응답이 없어 베팅금 {bet_amount:,}원을 잃었습니다.\n- 재산: {balance:,}원",
             color=discord.Color.red(),
         )
-        await game_message.edit(embed=embed)
+
+    async def _start_session(self, ctx, game, session, embed):
+        # 세션이 시작되면 게임 종료는 세션이 맡는다
+        session.on_close(lambda: self.games.end(game))
+        await session.start(ctx, embed)
+
+    def _timeout_handler(self, user_id, server_id, bet_amount):
+        async def on_timeout():
+            return await self._handle_timeout(user_id, server_id, bet_amount)
+
+        return on_timeout
 
     async def _validate_bet(self, bet, user_id, server_id, ctx, game_type):
         remaining = await self.gambling_service.check_cooldown(
-            user_id, game_type, GAME_COOLDOWN
+            user_id, game_type
         )
         if remaining:
             await ctx.reply(embed=GamblingEmbed.create_cooldown_embed(remaining))
@@ -83,32 +89,23 @@ class GamblingCardGames(BaseCommand):
         if not valid:
             return
 
-        self.blackjack_players.add(user_id)
+        game = self.games.start(user_id, server_id, "blackjack")
+        if game is None:
+            await ctx.reply(
+                embed=GamblingEmbed.create_error_embed(
+                    "이미 다른 게임이 진행 중입니다."
+                )
+            )
+            return
 
+        session = None
         try:
             await self.gambling_service.set_cooldown(user_id, "blackjack")
 
-            (
-                game_message,
-                cards,
-                player_hand,
-                dealer_hand,
-                player_value,
-                dealer_value,
-            ) = await self._setup_blackjack_game(ctx)
-
-            await self._run_blackjack_game(
-                user_id,
-                ctx,
-                game_message,
-                cards,
-                player_hand,
-                dealer_hand,
-                player_value,
-                dealer_value,
-                bet_amount,
-                server_id,
+            session, embed = self._setup_blackjack_game(
+                ctx, user_id, server_id, bet_amount
             )
+            await self._start_session(ctx, game, session, embed)
 
         except Exception as e:
             logger.error(f"블랙잭 게임 처리 중 오류: {e}")
@@ -117,19 +114,48 @@ class GamblingCardGames(BaseCommand):
             )
 
         finally:
-            self.blackjack_players.remove(user_id)
+            if session is None or not session.running:
+                self.games.end(game)
 
-    async def _setup_blackjack_game(self, ctx):
-        cards = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"] * 4
-        random.shuffle(cards)
+    def _setup_blackjack_game(self, ctx, user_id, server_id, bet_amount):
+        cards, player_hand, dealer_hand = GamblingEngine.deal_blackjack()
+        dealer_value = GamblingEngine.calculate_hand_value(dealer_hand)
 
-        player_hand = [cards.pop(), cards.pop()]
-        dealer_hand = [cards.pop(), cards.pop()]
+        async def on_choice(action):
+            if action == "hit":
+                return await self._handle_blackjack_hit(
+                    cards,
+                    player_hand,
+                    dealer_hand,
+                    dealer_value,
+                    user_id,
+                    server_id,
+                    bet_amount,
+                    ctx,
+                )
+            embed = await self._handle_blackjack_stand(
+                cards,
+                player_hand,
+                dealer_hand,
+                dealer_value,
+                user_id,
+                server_id,
+                bet_amount,
+                ctx,
+            )
+            return embed, True
 
-        player_value = self.gambling_service.calculate_hand_value(player_hand)
-        dealer_value = self.gambling_service.calculate_hand_value(dealer_hand)
+        session = ChoiceSession(
+            user_id,
+            [("👊", "hit"), ("🛑", "stand")],
+            on_choice,
+            on_timeout=self._timeout_handler(user_id, server_id, bet_amount),
+        )
+        return session, self._blackjack_embed(ctx, player_hand, dealer_hand)
 
-        embed = GamblingEmbed.create_blackjack_embed(
+    def _blackjack_embed(self, ctx, player_hand, dealer_hand):
+        player_value = GamblingEngine.calculate_hand_value(player_hand)
+        return GamblingEmbed.create_blackjack_embed(
             title=f"🃏 {ctx.author.name}의 블랙잭",
             description=(
                 f"{ctx.author.name}의 패: {' '.join(player_hand)} (합계: {player_value})\n"
@@ -138,96 +164,25 @@ class GamblingCardGames(BaseCommand):
             color=discord.Color.blue(),
         )
 
-        game_message = await ctx.reply(embed=embed)
-        await game_message.add_reaction("👊")
-        await game_message.add_reaction("🛑")
-
-        return game_message, cards, player_hand, dealer_hand, player_value, dealer_value
-
-    async def _run_blackjack_game(
-        self,
-        user_id,
-        ctx,
-        game_message,
-        cards,
-        player_hand,
-        dealer_hand,
-        player_value,
-        dealer_value,
-        bet_amount,
-        server_id,
-    ):
-        def check(reaction, user):
-            return (
-                user.id == user_id
-                and str(reaction.emoji) in ["👊", "🛑"]
-                and reaction.message.id == game_message.id
-            )
-
-        while True:
-            try:
-                reaction, _ = await self.bot.wait_for(
-                    "reaction_add", timeout=30.0, check=check
-                )
-                await reaction.remove(ctx.author)
-
-                if str(reaction.emoji) == "👊":
-                    game_over, player_value = await self._handle_blackjack_hit(
-                        cards,
-                        player_hand,
-                        dealer_hand,
-                        player_value,
-                        dealer_value,
-                        user_id,
-                        server_id,
-                        bet_amount,
-                        ctx,
-                        game_message,
-                    )
-                    if game_over:
-                        break
-                elif str(reaction.emoji) == "🛑":
-                    await self._handle_blackjack_stand(
-                        cards,
-                        player_hand,
-                        dealer_hand,
-                        player_value,
-                        dealer_value,
-                        user_id,
-                        server_id,
-                        bet_amount,
-                        ctx,
-                        game_message,
-                    )
-                    break
-
-            except asyncio.TimeoutError:
-                await self._handle_timeout(user_id, server_id, bet_amount, game_message)
-                break
-
     async def _handle_blackjack_hit(
         self,
         cards,
         player_hand,
         dealer_hand,
-        player_value,
         dealer_value,
         user_id,
         server_id,
         bet_amount,
         ctx,
-        game_message,
     ):
         player_hand.append(cards.pop())
-        player_value = self.gambling_service.calculate_hand_value(player_hand)
+        player_value = GamblingEngine.calculate_hand_value(player_hand)
 
         if player_value > 21:
-            lock = await self.gambling_service._get_lock(user_id)
-            async with lock:
-                await self.gambling_service.subtract_balance(
+            async with self.gambling_service.user_lock(user_id):
+                balance = await self.gambling_service.subtract_balance(
                     user_id, server_id, bet_amount
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
             embed = discord.Embed(
                 title=f"🃏 {ctx.author.name} 버스트!",
@@ -239,53 +194,34 @@ class GamblingCardGames(BaseCommand):
                 ),
                 color=discord.Color.red(),
             )
-            await game_message.edit(embed=embed)
-            return True, player_value
+            return embed, True
 
-        embed = GamblingEmbed.create_blackjack_embed(
-            title=f"🃏 {ctx.author.name}의 블랙잭",
-            description=(
-                f"{ctx.author.name}의 패: {' '.join(player_hand)} (합계: {player_value})\n"
-                f"JEE6의 패: {dealer_hand[0]} ?"
-            ),
-            color=discord.Color.blue(),
-        )
-        await game_message.edit(embed=embed)
-        return False, player_value
+        return self._blackjack_embed(ctx, player_hand, dealer_hand), False
 
     async def _handle_blackjack_stand(
         self,
         cards,
         player_hand,
         dealer_hand,
-        player_value,
         dealer_value,
         user_id,
         server_id,
         bet_amount,
         ctx,
-        game_message,
     ):
-        while dealer_value < 17:
-            dealer_hand.append(cards.pop())
-            dealer_value = self.gambling_service.calculate_hand_value(dealer_hand)
-
-        lock = await self.gambling_service._get_lock(user_id)
-        async with lock:
-            if dealer_value > 21 or player_value > dealer_value:
-                multiplier = (
-                    2.0
-                    if player_value == 21
-                    else random.uniform(*GAME_MULTIPLIER_RANGES["blackjack"])
-                )
+        player_value = GamblingEngine.calculate_hand_value(player_hand)
+        dealer_value = GamblingEngine.play_dealer(cards, dealer_hand)
+
+        async with self.gambling_service.user_lock(user_id):
+            if GamblingEngine.blackjack_wins(player_value, dealer_value):
+                multiplier = GamblingEngine.blackjack_multiplier(player_value)
                 winnings = int(bet_amount * multiplier)
                 tax = self.gambling_service.calculate_tax(winnings, "blackjack")
                 winnings_after_tax = winnings - tax
 
-                await self.gambling_service.add_balance(
+                balance = await self.gambling_service.add_balance(
                     user_id, server_id, winnings_after_tax
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
                 embed = discord.Embed(
                     title=f"🃏 {ctx.author.name} 승리",
@@ -298,10 +234,9 @@ class GamblingCardGames(BaseCommand):
                     color=discord.Color.green(),
                 )
             else:
-                await self.gambling_service.subtract_balance(
+                balance = await self.gambling_service.subtract_balance(
                     user_id, server_id, bet_amount
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
                 result = "패배" if player_value < dealer_value else "무승부"
                 embed = discord.Embed(
@@ -315,7 +250,7 @@ class GamblingCardGames(BaseCommand):
                     color=discord.Color.red(),
                 )
 
-        await game_message.edit(embed=embed)
+        return embed
 
     @commands.command(name="도박.바카라", description="도박.바카라 [베팅금]")
     async def baccarat(self, ctx, bet: str = None):
@@ -328,33 +263,24 @@ class GamblingCardGames(BaseCommand):
         if not valid:
             return
 
-        self.baccarat_players.add(user_id)
+        game = self.games.start(user_id, server_id, "baccarat")
+        if game is None:
+            await ctx.reply(
+                embed=GamblingEmbed.create_error_embed(
+                    "이미 다른 게임이 진행 중입니다."
+                )
+            )
+            return
 
+        session = None
         try:
             await self.gambling_service.set_cooldown(user_id, "baccarat")
-            game_message = await self._setup_baccarat_game(ctx)
-
-            def check(reaction, user):
-                return (
-                    user.id == user_id
-                    and str(reaction.emoji) in ["👤", "🏦", "🤝"]
-                    and reaction.message.id == game_message.id
-                )
-
-            try:
-                reaction, _ = await self.bot.wait_for(
-                    "reaction_add", timeout=30.0, check=check
-                )
-
-                guess = {"👤": "Player", "🏦": "Banker", "🤝": "Tie"}[
-                    str(reaction.emoji)
-                ]
 
+            async def on_choice(guess):
                 is_win, result, player_hand, banker_hand, player_value, banker_value = (
                     await self._get_baccarat_result(guess)
                 )
-
-                await self._handle_baccarat_result(
+                embed = await self._handle_baccarat_result(
                     is_win,
                     player_hand,
                     banker_hand,
@@ -364,12 +290,26 @@ class GamblingCardGames(BaseCommand):
                     server_id,
                     bet_amount,
                     ctx,
-                    game_message,
                     result,
                 )
+                return embed, True
 
-            except asyncio.TimeoutError:
-                await self._handle_timeout(user_id, server_id, bet_amount, game_message)
+            session = ChoiceSession(
+                user_id,
+                [("👤", "Player"), ("🏦", "Banker"), ("🤝", "Tie")],
+                on_choice,
+                on_timeout=self._timeout_handler(user_id, server_id, bet_amount),
+            )
+            await self._start_session(
+                ctx,
+                game,
+                session,
+                GamblingEmbed.create_baccarat_embed(
+                    title=f"🃏 {ctx.author.name}의 바카라",
+                    description="베팅할 곳을 선택하세요",
+                    color=discord.Color.blue(),
+                ),
+            )
 
         except Exception as e:
             logger.error(f"바카라 게임 처리 중 오류: {e}")
@@ -378,48 +318,20 @@ class GamblingCardGames(BaseCommand):
             )
 
         finally:
-            self.baccarat_players.remove(user_id)
-
-    async def _setup_baccarat_game(self, ctx):
-        embed = GamblingEmbed.create_baccarat_embed(
-            title=f"🃏 {ctx.author.name}의 바카라",
-            description="베팅할 곳을 선택하세요",
-            color=discord.Color.blue(),
-        )
-
-        game_message = await ctx.reply(embed=embed)
-        await game_message.add_reaction("👤")
-        await game_message.add_reaction("🏦")
-        await game_message.add_reaction("🤝")
-        return game_message
+            if session is None or not session.running:
+                self.games.end(game)
 
     async def _get_baccarat_result(self, user_guess):
-        cards = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"] * 4
-        random.shuffle(cards)
-
-        player_hand = [cards.pop(), cards.pop()]
-        banker_hand = [cards.pop(), cards.pop()]
-
-        player_value = self.gambling_service.calculate_baccarat_value(player_hand)
-        banker_value = self.gambling_service.calculate_baccarat_value(banker_hand)
-
-        if player_value <= 5:
-            player_hand.append(cards.pop())
-            player_value = self.gambling_service.calculate_baccarat_value(player_hand)
-
-        if banker_value <= 5:
-            banker_hand.append(cards.pop())
-            banker_value = self.gambling_service.calculate_baccarat_value(banker_hand)
-
-        if player_value > banker_value:
-            result = "Player"
-        elif banker_value > player_value:
-            result = "Banker"
-        else:
-            result = "Tie"
-
-        is_win = user_guess == result
-        return is_win, result, player_hand, banker_hand, player_value, banker_value
+        round_ = GamblingEngine.play_baccarat()
+        is_win = user_guess == round_.result
+        return (
+            is_win,
+            round_.result,
+            round_.player_hand,
+            round_.banker_hand,
+            round_.player_value,
+            round_.banker_value,
+        )
 
     async def _handle_baccarat_result(
         self,
@@ -432,25 +344,18 @@ class GamblingCardGames(BaseCommand):
         server_id,
         bet_amount,
         ctx,
-        game_message,
         result,
     ):
-        lock = await self.gambling_service._get_lock(user_id)
-        async with lock:
+        async with self.gambling_service.user_lock(user_id):
             if is_win:
-                multiplier = (
-                    8
-                    if result == "Tie"
-                    else random.uniform(*GAME_MULTIPLIER_RANGES["baccarat"])
-                )
+                multiplier = GamblingEngine.baccarat_multiplier(result)
                 winnings = int(bet_amount * multiplier)
                 tax = self.gambling_service.calculate_tax(winnings, "baccarat")
                 winnings_after_tax = winnings - tax
 
-                await self.gambling_service.add_balance(
+                balance = await self.gambling_service.add_balance(
                     user_id, server_id, winnings_after_tax
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
                 embed = discord.Embed(
                     title=f"🃏 {ctx.author.name} 맞음 ㄹㅈㄷ",
@@ -463,10 +368,9 @@ class GamblingCardGames(BaseCommand):
                     color=discord.Color.green(),
                 )
             else:
-                await self.gambling_service.subtract_balance(
+                balance = await self.gambling_service.subtract_balance(
                     user_id, server_id, bet_amount
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
                 embed = discord.Embed(
                     title=f"🃏 {ctx.author.name} 틀림ㅋ",
@@ -479,7 +383,7 @@ class GamblingCardGames(BaseCommand):
                     color=discord.Color.red(),
                 )
 
-        await game_message.edit(embed=embed)
+        return embed
 
     @commands.command(
         name="도박.인디언", aliases=["도박.인디언포커"], description="도박.인디언포커 [베팅금]"
@@ -494,48 +398,48 @@ class GamblingCardGames(BaseCommand):
         if not valid:
             return
 
-        self.indian_poker_players.add(user_id)
+        game = self.games.start(user_id, server_id, "indian_poker")
+        if game is None:
+            await ctx.reply(
+                embed=GamblingEmbed.create_error_embed(
+                    "이미 다른 게임이 진행 중입니다."
+                )
+            )
+            return
 
+        session = None
         try:
             await self.gambling_service.set_cooldown(user_id, "indian_poker")
 
-            game_message, player_card, banker_card = await self._setup_indian_poker(ctx)
+            player_card, banker_card = GamblingEngine.deal_indian_poker()
 
-            def check(reaction, user):
-                return (
-                    user.id == user_id
-                    and str(reaction.emoji) in ["💀", "✅"]
-                    and reaction.message.id == game_message.id
+            async def on_choice(action):
+                handler = (
+                    self._handle_indian_die
+                    if action == "die"
+                    else self._handle_indian_call
                 )
-
-            try:
-                reaction, _ = await self.bot.wait_for(
-                    "reaction_add", timeout=30.0, check=check
+                embed = await handler(
+                    player_card, banker_card, user_id, server_id, bet_amount, ctx
                 )
+                return embed, True
 
-                if str(reaction.emoji) == "💀":
-                    await self._handle_indian_die(
-                        player_card,
-                        banker_card,
-                        user_id,
-                        server_id,
-                        bet_amount,
-                        ctx,
-                        game_message,
-                    )
-                else:
-                    await self._handle_indian_call(
-                        player_card,
-                        banker_card,
-                        user_id,
-                        server_id,
-                        bet_amount,
-                        ctx,
-                        game_message,
-                    )
-
-            except asyncio.TimeoutError:
-                await self._handle_timeout(user_id, server_id, bet_amount, game_message)
+            session = ChoiceSession(
+                user_id,
+                [("💀", "die"), ("✅", "call")],
+                on_choice,
+                on_timeout=self._timeout_handler(user_id, server_id, bet_amount),
+            )
+            await self._start_session(
+                ctx,
+                game,
+                session,
+                GamblingEmbed.create_indian_poker_embed(
+                    title=f"🃏 {ctx.author.name}의 인디언 포커",
+                    description=f"{ctx.author.name}의 카드: ?\nJEE6의 카드: {banker_card}",
+                    color=discord.Color.blue(),
+                ),
+            )
 
         except Exception as e:
             logger.error(f"인디언 포커 게임 처리 중 오류: {e}")
@@ -544,23 +448,8 @@ class GamblingCardGames(BaseCommand):
             )
 
         finally:
-            self.indian_poker_players.remove(user_id)
-
-    async def _setup_indian_poker(self, ctx):
-        player_card = random.randint(1, 10)
-        banker_card = random.randint(1, 10)
-
-        embed = GamblingEmbed.create_indian_poker_embed(
-            title=f"🃏 {ctx.author.name}의 인디언 포커",
-            description=f"{ctx.author.name}의 카드: ?\nJEE6의 카드: {banker_card}",
-            color=discord.Color.blue(),
-        )
-
-        game_message = await ctx.reply(embed=embed)
-        await game_message.add_reaction("💀")
-        await game_message.add_reaction("✅")
-
-        return game_message, player_card, banker_card
+            if session is None or not session.running:
+                self.games.end(game)
 
     async def _handle_indian_die(
         self,
@@ -570,13 +459,12 @@ class GamblingCardGames(BaseCommand):
         server_id,
         bet_amount,
         ctx,
-        game_message,
     ):
-        lock = await self.gambling_service._get_lock(user_id)
-        async with lock:
-            loss = bet_amount // 2
-            await self.gambling_service.subtract_balance(user_id, server_id, loss)
-            balance = await self.gambling_service.get_balance(user_id, server_id)
+        async with self.gambling_service.user_lock(user_id):
+            loss = GamblingEngine.indian_die_loss(bet_amount)
+            balance = await self.gambling_service.subtract_balance(
+                user_id, server_id, loss
+            )
 
             embed = discord.Embed(
                 title=f"🃏 {ctx.author.name} Die",
@@ -588,7 +476,7 @@ class GamblingCardGames(BaseCommand):
                 ),
                 color=discord.Color.red(),
             )
-        await game_message.edit(embed=embed)
+        return embed
 
     async def _handle_indian_call(
         self,
@@ -598,20 +486,17 @@ class GamblingCardGames(BaseCommand):
         server_id,
         bet_amount,
         ctx,
-        game_message,
     ):
-        lock = await self.gambling_service._get_lock(user_id)
-        async with lock:
+        async with self.gambling_service.user_lock(user_id):
             if player_card > banker_card:
-                multiplier = random.uniform(*GAME_MULTIPLIER_RANGES["indian_poker"])
+                multiplier = GamblingEngine.game_multiplier("indian_poker")
                 winnings = int(bet_amount * multiplier)
                 tax = self.gambling_service.calculate_tax(winnings, "indian_poker")
                 winnings_after_tax = winnings - tax
 
-                await self.gambling_service.add_balance(
+                balance = await self.gambling_service.add_balance(
                     user_id, server_id, winnings_after_tax
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
                 embed = discord.Embed(
                     title=f"🃏 {ctx.author.name} 승리",
@@ -624,10 +509,9 @@ class GamblingCardGames(BaseCommand):
                     color=discord.Color.green(),
                 )
             else:
-                await self.gambling_service.subtract_balance(
+                balance = await self.gambling_service.subtract_balance(
                     user_id, server_id, bet_amount
                 )
-                balance = await self.gambling_service.get_balance(user_id, server_id)
 
                 embed = discord.Embed(
                     title=f"🃏 {ctx.author.name} 패배",
@@ -639,4 +523,4 @@ class GamblingCardGames(BaseCommand):
                     ),
                     color=discord.Color.red(),
                 )
-        await game_message.edit(embed=embed)
+        return embed
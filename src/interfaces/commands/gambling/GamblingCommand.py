@@ -2,38 +2,33 @@ import discord
 from discord.ext import commands, tasks
 import logging
 import random
-import secrets
-import asyncio
 from datetime import datetime
 
 from src.interfaces.commands.Base import BaseCommand
-from src.services.GamblingService import GamblingService, GamblingManager
+from src.services.GamblingService import GamblingService
+from src.services.ActiveGameRegistry import ActiveGameRegistry
+from src.services import GamblingEngine
 from src.utils.embeds.GamblingEmbed import GamblingEmbed
+from src.interfaces.views.GameSession import PaginatorSession
 from src.config.settings.gamblingSettings import (
     MIN_JACKPOT_BET,
     MAX_BET,
-    JACKPOT_WIN_COOLDOWN,
-    GAME_COOLDOWN,
-    WORK_COOLDOWN,
     RESET_TIMES,
     WORK_REWARD_RANGE,
 )
 
 logger = logging.getLogger(__name__)
 
+# 이 게임들이 진행 중일 때는 다른 도박 명령도 막는다
+BLOCKING_GAMES = {"blackjack", "baccarat", "indian_poker", "coin", "dice"}
+
 
 class GamblingCommands(BaseCommand):
 
     def __init__(self, bot, container):
         super().__init__(bot, container)
         self.gambling_service = GamblingService()
-        self.game_manager = GamblingManager()
-
-        self.blackjack_players = set()
-        self.baccarat_players = set()
-        self.indian_poker_players = set()
-        self.coin_players = set()
-        self.dice_players = set()
+        self.games = ActiveGameRegistry.instance()
 
         self.reset_jackpot.start()
 
@@ -65,8 +60,7 @@ class GamblingCommands(BaseCommand):
         user_id = ctx.author.id
         server_id = ctx.guild.id
 
-        lock = await self.gambling_service._get_lock(user_id)
-        async with lock:
+        async with self.gambling_service.user_lock(user_id):
             balance = await self.gambling_service.get_balance(user_id, server_id)
             embed = GamblingEmbed.create_balance_embed(ctx.author.name, balance)
             await ctx.reply(embed=embed)
@@ -78,7 +72,8 @@ class GamblingCommands(BaseCommand):
         user_id = ctx.author.id
         server_id = ctx.guild.id
 
-        if not await self.game_manager.start_game(user_id, "work"):
+        game = self.games.start(user_id, server_id, "work")
+        if game is None:
             await ctx.reply(
                 embed=GamblingEmbed.create_error_embed(
                     "이미 다른 게임이 진행 중입니다."
@@ -88,19 +83,18 @@ class GamblingCommands(BaseCommand):
 
         try:
             remaining = await self.gambling_service.check_cooldown(
-                user_id, "work", WORK_COOLDOWN
+                user_id, "work"
             )
             if remaining:
                 embed = GamblingEmbed.create_cooldown_embed(remaining)
                 await ctx.reply(embed=embed)
                 return
 
-            lock = await self.gambling_service._get_lock(user_id)
-            async with lock:
+            async with self.gambling_service.user_lock(user_id):
                 amount = random.randint(*WORK_REWARD_RANGE)
-                await self.gambling_service.add_balance(user_id, server_id, amount)
-
-                balance = await self.gambling_service.get_balance(user_id, server_id)
+                balance = await self.gambling_service.add_balance(
+                    user_id, server_id, amount
+                )
                 embed = GamblingEmbed.create_work_embed(
                     ctx.author.name, amount, balance
                 )
@@ -109,7 +103,7 @@ class GamblingCommands(BaseCommand):
                 await self.gambling_service.set_cooldown(user_id, "work")
 
         finally:
-            await self.game_manager.end_game(user_id)
+            self.games.end(game)
 
     @commands.command(name="도박.랭킹", description="랭킹")
     async def ranking(self, ctx):
@@ -163,44 +157,39 @@ class GamblingCommands(BaseCommand):
 
                 pages.append("\n".join(page_lines))
 
-            current_page = 0
-            embed = GamblingEmbed.create_ranking_embed(
-                "🏅 전체 랭킹", pages[current_page]
-            )
-            embed.set_footer(text=f"{current_page + 1}/{len(pages)}")
+            embeds = []
+            for number, page in enumerate(pages, start=1):
+                embed = GamblingEmbed.create_ranking_embed("🏅 전체 랭킹", page)
+                embed.set_footer(text=f"{number}/{len(pages)}")
+                embeds.append(embed)
 
-            message = await ctx.reply(embed=embed)
+            await PaginatorSession(ctx.author.id, embeds).start(ctx)
 
-            if len(pages) > 1:
-                await message.add_reaction("◀️")
-                await message.add_reaction("▶️")
-
-                def check(reaction, user):
-                    return (
-                        user == ctx.author
-                        and str(reaction.emoji) in ["◀️", "▶️"]
-                        and reaction.message.id == message.id
-                    )
-
-                while True:
-                    try:
-                        reaction, user = await self.bot.wait_for(
-                            "reaction_add", timeout=30.0, check=check
-                        )
+    @commands.command(name="도박.내랭킹", description="내 순위")
+    async def my_ranking(self, ctx):
+        server_id = ctx.guild.id
 
-                        if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
-                            current_page += 1
-                        elif str(reaction.emoji) == "◀️" and current_page > 0:
-                            current_page -= 1
+        async with ctx.typing():
+            info = await self.gambling_service.get_rank_info(
+                server_id, ctx.author.id, self.bot
+            )
+            if info is None:
+                await ctx.reply(
+                    embed=GamblingEmbed.create_error_embed("랭킹 정보를 불러오지 못했습니다.")
+                )
+                return
 
-                        embed.description = pages[current_page]
-                        embed.set_footer(text=f"{current_page + 1}/{len(pages)}")
-                        await message.edit(embed=embed)
-                        await message.remove_reaction(reaction, user)
+            lines = []
+            for rank, user_id, username, balance in info["neighbors"]:
+                line = f"{rank}. {username}: {balance:,}원"
+                lines.append(f"**{line}**" if user_id == ctx.author.id else line)
 
-                    except asyncio.TimeoutError:
-                        await message.clear_reactions()
-                        break
+            embed = GamblingEmbed.create_ranking_embed(
+                f"🏅 {ctx.author.name}님의 랭킹",
+                f"{info['total']:,}명 중 **{info['rank']:,}위** "
+                f"(상위 {info['percentile']:.1f}%)\n\n" + "\n".join(lines),
+            )
+            await ctx.reply(embed=embed)
 
     @commands.command(name="도박.송금", description="송금")
     async def transfer(self, ctx, recipient: discord.Member = None, amount: str = None):
@@ -254,46 +243,31 @@ class GamblingCommands(BaseCommand):
             )
             return
 
-        sender_lock = await self.gambling_service._get_lock(sender_id)
-        recipient_lock = await self.gambling_service._get_lock(recipient_id)
-
-        async with sender_lock:
-            async with recipient_lock:
-                sender_balance = await self.gambling_service.get_balance(
-                    sender_id, server_id
-                )
-
-                if amount_value > sender_balance:
-                    await ctx.reply(
-                        embed=GamblingEmbed.create_error_embed("돈이 부족해...")
-                    )
-                    return
-
-                tax = self.gambling_service.calculate_gift_tax(amount_value)
-                amount_after_tax = amount_value - tax
+        async with self.gambling_service.user_lock(sender_id, recipient_id):
+            tax = self.gambling_service.calculate_gift_tax(amount_value)
+            result = await self.gambling_service.transfer(
+                sender_id, recipient_id, server_id, amount_value, tax
+            )
 
-                await self.gambling_service.subtract_balance(
-                    sender_id, server_id, amount_value
-                )
-                await self.gambling_service.add_balance(
-                    recipient_id, server_id, amount_after_tax
+            if result is None:
+                await ctx.reply(
+                    embed=GamblingEmbed.create_error_embed("돈이 부족해...")
                 )
-                await self.gambling_service.add_jackpot(server_id, tax)
+                return
 
-                sender_balance = await self.gambling_service.get_balance(
-                    sender_id, server_id
-                )
-                embed = GamblingEmbed.create_transfer_embed(
-                    ctx.author.name, recipient.name, amount_value, tax, sender_balance
-                )
-                await ctx.reply(embed=embed)
+            sender_balance, _ = result
+            embed = GamblingEmbed.create_transfer_embed(
+                ctx.author.name, recipient.name, amount_value, tax, sender_balance
+            )
+            await ctx.reply(embed=embed)
 
     @commands.command(name="도박.잭팟", description="잭팟")
     async def jackpot(self, ctx, bet: str = None):
         user_id = ctx.author.id
         server_id = ctx.guild.id
 
-        if not await self.game_manager.start_game(user_id, "jackpot"):
+        game = self.games.start(user_id, server_id, "jackpot")
+        if game is None:
             await ctx.reply(
                 embed=GamblingEmbed.create_error_embed(
                     "이미 다른 게임이 진행 중입니다."
@@ -303,14 +277,14 @@ class GamblingCommands(BaseCommand):
 
         try:
             remaining = await self.gambling_service.check_cooldown(
-                user_id, "jackpot", GAME_COOLDOWN
+                user_id, "jackpot"
             )
             if remaining:
                 await ctx.reply(embed=GamblingEmbed.create_cooldown_embed(remaining))
                 return
 
             remaining = await self.gambling_service.check_cooldown(
-                user_id, "jackpot_win", JACKPOT_WIN_COOLDOWN
+                user_id, "jackpot_win"
             )
             if remaining:
                 minutes = remaining // 60
@@ -341,8 +315,7 @@ class GamblingCommands(BaseCommand):
                 )
                 return
 
-            lock = await self.gambling_service._get_lock(user_id)
-            async with lock:
+            async with self.gambling_service.user_lock(user_id):
                 current_balance = await self.gambling_service.get_balance(
                     user_id, server_id
                 )
@@ -362,18 +335,18 @@ class GamblingCommands(BaseCommand):
                     )
                     return
 
-                await self.gambling_service.subtract_balance(
+                balance = await self.gambling_service.subtract_balance(
                     user_id, server_id, bet_amount
                 )
                 await self.gambling_service.add_jackpot(server_id, bet_amount)
 
-                if secrets.randbelow(100) <= 0:
+                if GamblingEngine.jackpot_hit():
                     jackpot = await self.gambling_service.get_jackpot(server_id)
-                    winnings = jackpot // 10
+                    winnings = GamblingEngine.jackpot_payout(jackpot)
                     tax = self.gambling_service.calculate_tax(winnings, "jackpot")
                     winnings_after_tax = winnings - tax
 
-                    await self.gambling_service.add_balance(
+                    balance = await self.gambling_service.add_balance(
                         user_id, server_id, winnings_after_tax
                     )
                     await self.gambling_service.subtract_jackpot(server_id, winnings)
@@ -381,9 +354,6 @@ class GamblingCommands(BaseCommand):
                     await self.gambling_service.set_cooldown(user_id, "jackpot_win")
 
                     current_jackpot = await self.gambling_service.get_jackpot(server_id)
-                    balance = await self.gambling_service.get_balance(
-                        user_id, server_id
-                    )
 
                     embed = GamblingEmbed.create_jackpot_embed(
                         f"🎉 {ctx.author.name} 당첨",
@@ -396,9 +366,6 @@ class GamblingCommands(BaseCommand):
                     )
                 else:
                     current_jackpot = await self.gambling_service.get_jackpot(server_id)
-                    balance = await self.gambling_service.get_balance(
-                        user_id, server_id
-                    )
 
                     embed = GamblingEmbed.create_jackpot_embed(
                         f"🎰 {ctx.author.name} 잭팟 실패ㅋ",
@@ -415,34 +382,14 @@ class GamblingCommands(BaseCommand):
                 await ctx.reply(embed=embed)
 
         finally:
-            await self.game_manager.end_game(user_id)
+            self.games.end(game)
 
     async def cog_check(self, ctx):
-        user_id = ctx.author.id
-
-        if (
-            user_id in self.blackjack_players
-            or user_id in self.baccarat_players
-            or user_id in self.indian_poker_players
-            or user_id in self.coin_players
-            or user_id in self.dice_players
-        ):
-
-            current_game = None
-            if user_id in self.blackjack_players:
-                current_game = "블랙잭"
-            elif user_id in self.baccarat_players:
-                current_game = "바카라"
-            elif user_id in self.indian_poker_players:
-                current_game = "인디언 포커"
-            elif user_id in self.coin_players:
-                current_game = "동전"
-            elif user_id in self.dice_players:
-                current_game = "주사위"
-
+        game = self.games.get(ctx.author.id)
+        if game is not None and game.game_type in BLOCKING_GAMES:
             await ctx.reply(
                 embed=GamblingEmbed.create_error_embed(
-                    f"이미 {current_game} 게임이 진행 중입니다."
+                    f"이미 {game.display_name} 게임이 진행 중입니다."
                 )
             )
             return False
@@ -3,6 +3,7 @@ import logging
 from src.interfaces.commands.Base import BaseCommand
 from src.utils.embeds.InformationEmbed import InformationEmbed
 from src.infrastructure.database.connection import test_connection
+from src.utils.metrics.cacheMetrics import cache_summary
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,9 @@ class InformationCommands(BaseCommand):
 
             db_status = "🟢 굿" if test_connection() else "🔴 좆됨"
 
-            embed = InformationEmbed.create_info_embed(latency, db_status)
+            embed = InformationEmbed.create_info_embed(
+                latency, db_status, cache_summary()
+            )
 
             await ctx.reply(embed=embed)
 
@@ -0,0 +1,77 @@
+from discord.ext import commands
+import logging
+from src.interfaces.commands.Base import BaseCommand
+from src.config.settings.Base import BaseConfig
+from src.utils.metrics.cacheMetrics import cache_snapshot
+from src.services.GamblingService import GamblingService
+from src.services.ActiveGameRegistry import ActiveGameRegistry
+
+logger = logging.getLogger(__name__)
+
+# 디스코드 메시지 길이 제한(2000자)보다 여유 있게 자른다
+MESSAGE_LIMIT = 1900
+
+
+class MetricsCommand(BaseCommand):
+    @commands.command(
+        name="cache.stats",
+        aliases=["캐시.상태"],
+        description="캐시 적중률과 로드 지연을 확인합니다",
+    )
+    async def cache_stats(self, ctx):
+        if ctx.author.name != BaseConfig.ADMIN_NAME:
+            return
+        logger.info(f"cache_stats({ctx.guild.name if ctx.guild else 'DM'}, {ctx.author.name})")
+
+        snapshot = cache_snapshot()
+        if not snapshot:
+            await ctx.reply("등록된 캐시가 없습니다.")
+            return
+
+        lines = [
+            f"{'cache':<24}{'size':>11}{'hit':>7}{'h/m/c':>16}{'evict':>7}{'load':>9}{'fly':>5}"
+        ]
+        for name, s in snapshot.items():
+            size = f"{s['size']}/{s['maxsize']}"
+            counts = f"{s['hits']}/{s['misses']}/{s['coalesced']}"
+            lines.append(
+                f"{name:<24}{size:>11}{s['hit_ratio']:>7.0%}{counts:>16}"
+                f"{s['evictions']:>7}{s['avg_load_ms']:>7.0f}ms{s['inflight']:>5}"
+            )
+
+        if GamblingService._instance is not None:
+            locks = GamblingService._instance.lock_stats()
+            wait = locks["wait"]
+            lines.append("")
+            lines.append(
+                f"gambling.locks  경합 {locks['contention_ratio']:.1%} "
+                f"({locks['contended']}/{locks['acquired']}) · "
+                f"대기 avg {wait.get('avg_ms', 0):.1f}ms p95 {wait.get('p95_ms', 0):.1f}ms · "
+                f"점유 {locks['held']}/{locks['stripes']}"
+            )
+            if locks["hot_keys"]:
+                lines.append(
+                    "  hot: " + ", ".join(f"{key}({count})" for key, count in locks["hot_keys"])
+                )
+            cooldowns = GamblingService._instance.cooldowns.stats()
+            lines.append(
+                f"gambling.cooldowns  {cooldowns['entries']}건 · 저장 대기 {cooldowns['pending']} · "
+                f"정리됨 {cooldowns.get('pruned', 0)} · 저장됨 {cooldowns.get('flushed', 0)}"
+            )
+
+        if ActiveGameRegistry._instance is not None:
+            games = ActiveGameRegistry._instance.stats()
+            by_game = ", ".join(f"{name} {count}" for name, count in games["by_game"].items())
+            lines.append(
+                f"gambling.games  진행 중 {games['active']} (서버 최대 {games['peak_server']}) · "
+                f"정리됨 {games.get('reaped', 0)}" + (f" · {by_game}" if by_game else "")
+            )
+
+        chunk, length = [], 0
+        for line in lines:
+            if length + len(line) > MESSAGE_LIMIT:
+                await ctx.reply("```\n" + "\n".join(chunk) + "\n```")
+                chunk, length = [], 0
+            chunk.append(line)
+            length += len(line) + 1
+        await ctx.reply("```\n" + "\n".join(chunk) + "\n```")
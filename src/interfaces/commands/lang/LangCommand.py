@@ -3,8 +3,10 @@ import discord
 from discord.ext import commands
 from src.interfaces.commands.Base import BaseCommand
 from src.services.LangService import LangService
+from src.services.LangFeedbackSink import LangFeedbackSink
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
+from src.infrastructure.discord.pipeline import LANG, LANG_COMMAND
 from src.infrastructure.database.session import get_db_session
-from src.config.settings.Base import BaseConfig
 from src.utils.embeds.MealEmbed import MealEmbed
 from src.utils.embeds.WaterEmbed import WaterEmbed
 from src.utils.embeds.TimeEmbed import TimeEmbed
@@ -21,8 +23,7 @@ class LangCommand(BaseCommand):
     def __init__(self, bot, container):
         super().__init__(bot, container)
         self.lang_service = LangService()
-        self._enabled_channels: set[int] = set()
-        self._cache_loaded = False
+        self.channel_registry = ChannelFeatureRegistry.instance()
         self._services_wired = False
         self._last_ignored: dict[int, dict[int, object]] = {}
         # bot_reply_id -> user_message text
@@ -46,19 +47,6 @@ class LangCommand(BaseCommand):
 
         self._services_wired = True
 
-    def _load_enabled_channels(self):
-        if self._cache_loaded:
-            return
-        try:
-            with get_db_session() as db:
-                repo = self.container.channel_lang_repository(db=db)
-                self._enabled_channels = repo.get_all_enabled_channel_ids()
-            self._cache_loaded = True
-            self._wire_services()
-            logger.info(f"자연어 모드 활성 채널 {len(self._enabled_channels)}개 로드")
-        except Exception as e:
-            logger.error(f"자연어 모드 채널 로드 실패: {e}")
-
     def _build_response(self, result: dict) -> dict:
         t = result.get("type")
 
@@ -230,10 +218,7 @@ class LangCommand(BaseCommand):
                 repo = self.container.channel_lang_repository(db=db)
                 enabled = repo.toggle(ctx.guild.id, ctx.channel.id)
 
-            if enabled:
-                self._enabled_channels.add(ctx.channel.id)
-            else:
-                self._enabled_channels.discard(ctx.channel.id)
+            self.channel_registry.invalidate()
 
             status = "활성화" if enabled else "비활성화"
             color = discord.Color.green() if enabled else discord.Color.red()
@@ -282,31 +267,23 @@ class LangCommand(BaseCommand):
         embed.set_footer(text=f"Q: {question[:100]}")
         await ctx.reply(embed=embed)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        if message.author.bot:
-            return
+    async def cog_load(self):
+        self.bot.pipeline.register(LANG, self.handle_message)
+        self.bot.pipeline.register(LANG_COMMAND, self.handle_command_fallback)
 
-        if not message.guild:
-            return
+    async def cog_unload(self):
+        self.bot.pipeline.unregister(LANG, self.handle_message)
+        self.bot.pipeline.unregister(LANG_COMMAND, self.handle_command_fallback)
 
-        self._load_enabled_channels()
-
-        if message.content.startswith(BaseConfig.PREFIX):
-            if message.channel.id in self._enabled_channels:
-                self._record_signal(
-                    message, "cmd_fallback",
-                    message.content[:100],
-                )
-            return
-
-        if message.channel.id not in self._enabled_channels:
-            return
+    async def handle_command_fallback(self, message):
+        self._record_signal(message, "cmd_fallback", message.content[:100])
 
+    async def handle_message(self, message):
         content = message.content.strip()
         if not content or len(content) < 2:
             return
 
+        self._wire_services()
         logger.info(f"lang_process({message.guild.name}, {message.channel.name}, {message.author.name}, {content[:50]})")
 
         context = {
@@ -367,8 +344,7 @@ class LangCommand(BaseCommand):
 
         user_message = self._reply_map.pop(message.id)
         try:
-            from src.domain.models.LangFeedback import LangFeedback
-            feedback = LangFeedback(
+            LangFeedbackSink.instance().submit(
                 guild_id=message.guild.id if message.guild else 0,
                 channel_id=message.channel.id,
                 user_id=user.id,
@@ -378,8 +354,6 @@ class LangCommand(BaseCommand):
                 signal_detail=f"사용자가 ❌ 리액션으로 오답 신고",
                 label="wrong",
             )
-            with get_db_session() as db:
-                db.add(feedback)
             logger.info(f"LLM 오답 피드백: {user_message[:30]}...")
         except Exception as e:
             logger.warning(f"오답 피드백 저장 실패: {e}")
@@ -387,10 +361,7 @@ class LangCommand(BaseCommand):
     def _record_signal(self, message, signal: str, detail: str = None):
         """암묵적 피드백 신호를 DB에 기록"""
         try:
-            from src.infrastructure.database.session import get_db_session
-            from src.domain.models.LangFeedback import LangFeedback
-
-            feedback = LangFeedback(
+            LangFeedbackSink.instance().submit(
                 guild_id=message.guild.id,
                 channel_id=message.channel.id,
                 user_id=message.author.id,
@@ -399,7 +370,5 @@ class LangCommand(BaseCommand):
                 signal=signal,
                 signal_detail=detail,
             )
-            with get_db_session() as db:
-                db.add(feedback)
         except Exception as e:
             logger.warning(f"피드백 신호 저장 실패: {e}")
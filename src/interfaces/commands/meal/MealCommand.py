@@ -12,6 +12,7 @@ from PIL import Image
 from src.interfaces.commands.Base import BaseCommand
 from src.utils.embeds.MealEmbed import MealEmbed
 from src.clients.ApiGatewayClient import ApiGatewayClient
+from src.utils.cache.ttlCache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +22,7 @@ _DATE_FLAG_RE = re.compile(r"(?:^|\s)(?:--date|-d)(?:[=\s]+(\S+))?")
 # 급식 사진 원본은 18MB대로 커서 Discord 임베드 프록시/업로드 한도에 걸린다.
 # 받아서 작게 리사이즈한 뒤 첨부로 올린다. URL 기준으로 결과(JPEG bytes)를 캐시.
 _IMG_MAX_SIDE = 1280
-_IMG_CACHE: dict[str, bytes] = {}
-_IMG_CACHE_MAX = 64
+_IMG_CACHE: TTLCache[bytes] = TTLCache(maxsize=64, ttl=86400, name="meal.image")
 _IMG_TIMEOUT = aiohttp.ClientTimeout(total=15)
 # 급식 사진 서버는 비브라우저 User-Agent(aiohttp 기본값 등)를 400으로 차단한다.
 _IMG_HEADERS = {"User-Agent": "Mozilla/5.0"}
@@ -142,9 +142,7 @@ class MealCommands(BaseCommand):
             None, self._resize_to_jpeg, raw
         )
         if jpeg:
-            if len(_IMG_CACHE) >= _IMG_CACHE_MAX:
-                _IMG_CACHE.pop(next(iter(_IMG_CACHE)))
-            _IMG_CACHE[image_url] = jpeg
+            _IMG_CACHE.set(image_url, jpeg)
         return jpeg
 
     @staticmethod
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import uuid
+from abc import ABCMeta, abstractmethod
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+import discord
+
+from src.utils.concurrency.deadlineTimer import DeadlineTimer
+
+logger = logging.getLogger(__name__)
+
+SESSION_TIMEOUT = 30.0
+
+# 버튼을 눌렀을 때 (새 임베드, 끝났는지) 를 돌려준다
+ChoiceHandler = Callable[[str], Awaitable[Tuple[discord.Embed, bool]]]
+
+
+class GameSession(discord.ui.View, metaclass=ABCMeta):
+    """메시지 하나에 붙는 버튼 세션.
+
+    버튼 입력은 discord.py 가 (메시지 id, custom_id) 로 이 View 에 바로 넘겨주므로 다른 게임의
+    check 를 거치지 않는다. 입력마다 interaction 응답으로 메시지를 한 번만 수정한다.
+    타임아웃은 View 자체 타이머 대신 DeadlineTimer 하나가 모든 세션을 함께 처리한다.
+    """
+
+    def __init__(self, owner_id: int, timeout: float = SESSION_TIMEOUT):
+        super().__init__(timeout=None)
+        self.owner_id = owner_id
+        self.session_id = uuid.uuid4().hex[:12]
+        self.idle_timeout = timeout
+        self.deadline = 0.0
+        self.message: Optional[discord.Message] = None
+        self._finished = False
+        self._lock = asyncio.Lock()
+        self._on_close: List[Callable[[], None]] = []
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    @property
+    def running(self) -> bool:
+        return self.message is not None and not self._finished
+
+    def add_button(self, action: str, emoji: str, label: Optional[str] = None) -> None:
+        button = discord.ui.Button(
+            emoji=emoji,
+            label=label,
+            style=discord.ButtonStyle.secondary,
+            custom_id=f"session:{self.session_id}:{action}",
+        )
+
+        async def callback(interaction: discord.Interaction) -> None:
+            await self._handle(interaction, action)
+
+        button.callback = callback
+        self.add_item(button)
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        self._on_close.append(callback)
+
+    async def start(self, ctx, embed: discord.Embed) -> discord.Message:
+        self.message = await ctx.reply(embed=embed, view=self)
+        self._touch()
+        DeadlineTimer.instance().schedule(self)
+        return self.message
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message(
+                "다른 사람의 게임은 조작할 수 없어요.", ephemeral=True
+            )
+            return False
+        if self._finished:
+            # 끝난 세션의 버튼이 늦게 눌려도 응답은 해야 "상호작용 실패" 가 뜨지 않는다
+            await interaction.response.defer()
+            return False
+        return True
+
+    @abstractmethod
+    async def on_action(
+        self, interaction: discord.Interaction, action: str
+    ) -> Tuple[discord.Embed, bool]:
+        """버튼 입력 처리. (새 임베드, 끝났는지) 를 돌려준다."""
+
+    async def on_expire(self) -> Optional[discord.Embed]:
+        """시간 초과 시 보여줄 임베드. None 이면 버튼만 없앤다."""
+        return None
+
+    async def expire(self) -> None:
+        async with self._lock:
+            if self._finished:
+                return
+            if self.deadline > asyncio.get_running_loop().time():
+                # 락을 기다리는 사이 버튼 입력으로 연장됐으면 끝내지 않고 다시 예약한다
+                DeadlineTimer.instance().schedule(self)
+                return
+            embed = await self.on_expire()
+            await self._close()
+            if self.message:
+                if embed is None:
+                    await self.message.edit(view=None)
+                else:
+                    await self.message.edit(embed=embed, view=None)
+
+    async def _handle(self, interaction: discord.Interaction, action: str) -> None:
+        async with self._lock:
+            if self._finished:
+                await interaction.response.defer()
+                return
+            try:
+                embed, done = await self.on_action(interaction, action)
+            except Exception as e:
+                logger.error(f"게임 세션 처리 중 오류 ({action}): {e}", exc_info=True)
+                embed, done = discord.Embed(
+                    title="❗ 오류",
+                    description="게임 진행 중 오류가 발생했습니다.",
+                    color=discord.Color.red(),
+                ), True
+
+            if done:
+                await self._close()
+                await interaction.response.edit_message(embed=embed, view=None)
+            else:
+                self._touch()
+                await interaction.response.edit_message(embed=embed, view=self)
+
+    def _touch(self) -> None:
+        self.deadline = asyncio.get_running_loop().time() + self.idle_timeout
+
+    async def _close(self) -> None:
+        self._finished = True
+        self.stop()
+        for callback in self._on_close:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"게임 세션 종료 처리 중 오류: {e}")
+
+
+class ChoiceSession(GameSession):
+    """버튼 목록과 처리 함수만으로 만드는 세션. 카드/동전/주사위 게임이 쓴다."""
+
+    def __init__(
+        self,
+        owner_id: int,
+        choices: Sequence[Tuple[str, str]],
+        handler: ChoiceHandler,
+        on_timeout: Optional[Callable[[], Awaitable[discord.Embed]]] = None,
+        timeout: float = SESSION_TIMEOUT,
+    ):
+        super().__init__(owner_id, timeout)
+        self._handler = handler
+        self._on_timeout = on_timeout
+        for emoji, action in choices:
+            self.add_button(action, emoji)
+
+    async def on_action(self, interaction, action):
+        return await self._handler(action)
+
+    async def on_expire(self):
+        return await self._on_timeout() if self._on_timeout else None
+
+
+class PaginatorSession(GameSession):
+    """◀️ ▶️ 로 임베드 목록을 넘기는 세션. 시간이 지나면 버튼만 사라진다."""
+
+    def __init__(self, owner_id: int, pages: Sequence[discord.Embed], timeout: float = SESSION_TIMEOUT):
+        super().__init__(owner_id, timeout)
+        self.pages = list(pages)
+        self.current = 0
+        self.add_button("prev", "◀️")
+        self.add_button("next", "▶️")
+
+    async def start(self, ctx, embed: Optional[discord.Embed] = None) -> discord.Message:
+        if len(self.pages) == 1:
+            self._finished = True
+            self.message = await ctx.reply(embed=self.pages[0])
+            return self.message
+        return await super().start(ctx, self.pages[0])
+
+    async def on_action(self, interaction, action):
+        if action == "next" and self.current < len(self.pages) - 1:
+            self.current += 1
+        elif action == "prev" and self.current > 0:
+            self.current -= 1
+        return self.pages[self.current], False
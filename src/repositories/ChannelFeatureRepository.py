@@ -0,0 +1,48 @@
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+from mysql.connector import MySQLConnection
+from src.repositories.MySQLRawRepository import MySQLRawRepository
+
+logger = logging.getLogger(__name__)
+
+# (기능, 테이블) - 모든 테이블은 BaseModel 의 id/updated_at 을 가진다
+FEATURE_TABLES = (
+    ("lang", "channel_lang"),
+    ("filter", "channel_filter"),
+    ("slow_mode", "channel_slow_mode"),
+    ("periodic_clean", "periodic_clean"),
+)
+
+FeatureRow = Tuple[str, int, int, bool, Optional[datetime]]
+
+
+class ChannelFeatureRepository(MySQLRawRepository):
+    def __init__(self):
+        super().__init__()
+
+    async def get_changes(self, since: Optional[datetime]) -> Optional[List[FeatureRow]]:
+        """since 이후 변경된 채널 기능 행을 (기능, 행 id, 채널 id, 활성 여부, updated_at) 으로 반환한다.
+
+        since 가 None 이면 전체를 읽는다. 조회에 실패하면 None 을 반환한다.
+        """
+        where = "" if since is None else " WHERE updated_at >= %s"
+        sql = " UNION ALL ".join(
+            f"SELECT '{feature}', id, channel_id, enabled, updated_at FROM {table}{where}"
+            for feature, table in FEATURE_TABLES
+        )
+        params = () if since is None else (since,) * len(FEATURE_TABLES)
+
+        def _get_changes(connection: MySQLConnection) -> List[FeatureRow]:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return [
+                    (feature, row_id, channel_id, bool(enabled), updated_at)
+                    for feature, row_id, channel_id, enabled, updated_at in cursor.fetchall()
+                ]
+
+        try:
+            return await self.execute_query(_get_changes)
+        except Exception as e:
+            logger.error(f"get_changes({since}) FAIL: {e}")
+            return None
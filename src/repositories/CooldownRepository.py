@@ -1,80 +1,131 @@
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from src.domain.models.cooldown import Cooldown
 from src.repositories.SQLAlchemyRawRepository import SQLAlchemyRawRepository
-from src.infrastructure.database.session import get_db_session
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_COOLDOWN_SQL = text(
+    "INSERT INTO cooldowns (user_id, game_type, last_played) "
+    "VALUES (:user_id, :game_type, :last_played) "
+    "ON DUPLICATE KEY UPDATE last_played = VALUES(last_played)"
+)
+
 
 class CooldownRepository(SQLAlchemyRawRepository):
     def __init__(self, model=Cooldown):
         super().__init__(model)
 
     async def get_cooldown(self, user_id: int, action_type: str) -> Optional[datetime]:
-        try:
-            with get_db_session() as session:
-                cooldown = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, game_type=action_type)
-                    .first()
-                )
+        def _get(session: Session) -> Optional[datetime]:
+            cooldown = (
+                session.query(self.model)
+                .filter_by(user_id=user_id, game_type=action_type)
+                .first()
+            )
+
+            if not cooldown:
+                return None
 
-                if not cooldown:
-                    return None
+            return cooldown.last_played
 
-                return cooldown.last_played
+        try:
+            return await self.run_in_session(_get)
         except Exception as e:
             logger.error(e)
             return None
 
     async def set_cooldown(self, user_id: int, action_type: str) -> None:
+        def _set(session: Session) -> None:
+            cooldown = (
+                session.query(self.model)
+                .filter_by(user_id=user_id, game_type=action_type)
+                .first()
+            )
+
+            now = datetime.utcnow()
+
+            if not cooldown:
+                cooldown = Cooldown(user_id=user_id, action_type=action_type, last_used=now)
+                session.add(cooldown)
+            else:
+                cooldown.last_played = now
+
+            session.commit()
+
         try:
-            with get_db_session() as session:
-                cooldown = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, game_type=action_type)
-                    .first()
+            await self.run_in_session(_set)
+        except Exception as e:
+            logger.error(e)
+
+    async def get_cooldowns_since(
+        self, action_types: List[str], since: datetime
+    ) -> Optional[List[Tuple[int, str, datetime]]]:
+        def _get(session: Session) -> List[Tuple[int, str, datetime]]:
+            rows = (
+                session.query(self.model)
+                .filter(
+                    self.model.game_type.in_(action_types),
+                    self.model.last_played > since,
                 )
+                .all()
+            )
+            return [(row.user_id, row.game_type, row.last_played) for row in rows]
 
-                now = datetime.utcnow()
+        try:
+            return await self.run_in_session(_get)
+        except Exception as e:
+            logger.error(f"쿨다운 목록 조회 중 오류: {e}")
+            return None
 
-                if not cooldown:
-                    cooldown = Cooldown(
-                        user_id=user_id, action_type=action_type, last_used=now
-                    )
-                    session.add(cooldown)
-                else:
-                    cooldown.last_played = now
+    async def set_cooldowns(self, rows: List[Tuple[int, str, datetime]]) -> bool:
+        def _set(session: Session) -> bool:
+            session.execute(
+                _UPSERT_COOLDOWN_SQL,
+                [
+                    {"user_id": user_id, "game_type": action, "last_played": used}
+                    for user_id, action, used in rows
+                ],
+            )
+            session.commit()
+            return True
 
-                session.commit()
+        try:
+            return await self.run_in_session(_set)
         except Exception as e:
-            logger.error(e)
+            logger.error(f"쿨다운 일괄 저장 중 오류 ({len(rows)}건): {e}")
+            return False
 
     async def delete_cooldown(self, user_id: int, action_type: str) -> None:
-        try:
-            with get_db_session() as session:
-                cooldown = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, game_type=action_type)
-                    .first()
-                )
+        def _delete(session: Session) -> None:
+            cooldown = (
+                session.query(self.model)
+                .filter_by(user_id=user_id, game_type=action_type)
+                .first()
+            )
 
-                if cooldown:
-                    session.delete(cooldown)
-                    session.commit()
+            if cooldown:
+                session.delete(cooldown)
+                session.commit()
+
+        try:
+            await self.run_in_session(_delete)
         except Exception as e:
             logger.error(e)
 
     async def delete_all_cooldowns(self, user_id: int) -> None:
-        try:
-            with get_db_session() as session:
-                cooldowns = session.query(self.model).filter_by(user_id=user_id).all()
+        def _delete_all(session: Session) -> None:
+            cooldowns = session.query(self.model).filter_by(user_id=user_id).all()
 
-                for cooldown in cooldowns:
-                    session.delete(cooldown)
+            for cooldown in cooldowns:
+                session.delete(cooldown)
 
-                session.commit()
+            session.commit()
+
+        try:
+            await self.run_in_session(_delete_all)
         except Exception as e:
             logger.error(e)
@@ -1,102 +1,104 @@
 import logging
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from src.domain.models.jackpot import Jackpot
 from src.repositories.SQLAlchemyRawRepository import SQLAlchemyRawRepository
-from src.infrastructure.database.session import get_db_session
 from src.config.settings.gamblingSettings import INITIAL_JACKPOT
 
 logger = logging.getLogger(__name__)
 
+_ADD_SQL = text(
+    "INSERT INTO jackpots (server_id, amount) VALUES (:server_id, :initial + :amount) "
+    "ON DUPLICATE KEY UPDATE amount = amount + :amount"
+)
+_SUBTRACT_SQL = text(
+    "INSERT INTO jackpots (server_id, amount) VALUES (:server_id, :initial) "
+    "ON DUPLICATE KEY UPDATE amount = GREATEST(:initial, amount - :amount)"
+)
+
 
 class JackpotRepository(SQLAlchemyRawRepository):
     def __init__(self, model=Jackpot):
         super().__init__(model)
 
     async def get_jackpot(self, server_id: int) -> int:
+        def _get(session: Session) -> int:
+            jackpot = session.query(self.model).filter_by(server_id=server_id).first()
+
+            if not jackpot:
+                logger.debug(f"서버 {server_id}의 잭팟 정보가 없어 새로 생성합니다.")
+                jackpot = Jackpot(server_id=server_id, amount=INITIAL_JACKPOT)
+                session.add(jackpot)
+                session.commit()
+
+            return jackpot.amount
+
         try:
-            with get_db_session() as session:
-                jackpot = (
-                    session.query(self.model).filter_by(server_id=server_id).first()
-                )
-
-                if not jackpot:
-                    logger.debug(
-                        f"서버 {server_id}의 잭팟 정보가 없어 새로 생성합니다."
-                    )
-                    jackpot = Jackpot(server_id=server_id, amount=INITIAL_JACKPOT)
-                    session.add(jackpot)
-                    session.commit()
-
-                return jackpot.amount
+            return await self.run_in_session(_get)
         except Exception as e:
             logger.error(f"잭팟 조회 중 오류: {e}")
             return INITIAL_JACKPOT
 
     async def set_jackpot(self, server_id: int, amount: int) -> None:
-        try:
-            with get_db_session() as session:
-                jackpot = (
-                    session.query(self.model).filter_by(server_id=server_id).first()
-                )
+        def _set(session: Session) -> None:
+            jackpot = session.query(self.model).filter_by(server_id=server_id).first()
 
-                if not jackpot:
-                    jackpot = Jackpot(server_id=server_id, amount=amount)
-                    session.add(jackpot)
-                else:
-                    jackpot.amount = amount
+            if not jackpot:
+                jackpot = Jackpot(server_id=server_id, amount=amount)
+                session.add(jackpot)
+            else:
+                jackpot.amount = amount
 
-                session.commit()
+            session.commit()
+
+        try:
+            await self.run_in_session(_set)
         except Exception as e:
             logger.error(f"잭팟 설정 중 오류: {e}")
 
+    @staticmethod
+    def add_in_session(session: Session, server_id: int, amount: int) -> None:
+        session.execute(
+            _ADD_SQL,
+            {"server_id": server_id, "amount": amount, "initial": INITIAL_JACKPOT},
+        )
+
     async def add_jackpot(self, server_id: int, amount: int) -> None:
-        try:
-            with get_db_session() as session:
-                jackpot = (
-                    session.query(self.model).filter_by(server_id=server_id).first()
-                )
-
-                if not jackpot:
-                    jackpot = Jackpot(
-                        server_id=server_id, amount=INITIAL_JACKPOT + amount
-                    )
-                    session.add(jackpot)
-                else:
-                    jackpot.amount += amount
+        def _add(session: Session) -> None:
+            self.add_in_session(session, server_id, amount)
+            session.commit()
 
-                session.commit()
+        try:
+            await self.run_in_session(_add)
         except Exception as e:
             logger.error(f"잭팟 증가 중 오류: {e}")
 
     async def subtract_jackpot(self, server_id: int, amount: int) -> None:
-        try:
-            with get_db_session() as session:
-                jackpot = (
-                    session.query(self.model).filter_by(server_id=server_id).first()
-                )
+        def _subtract(session: Session) -> None:
+            session.execute(
+                _SUBTRACT_SQL,
+                {"server_id": server_id, "amount": amount, "initial": INITIAL_JACKPOT},
+            )
+            session.commit()
 
-                if not jackpot:
-                    jackpot = Jackpot(server_id=server_id, amount=INITIAL_JACKPOT)
-                    session.add(jackpot)
-                else:
-                    jackpot.amount = max(INITIAL_JACKPOT, jackpot.amount - amount)
-
-                session.commit()
+        try:
+            await self.run_in_session(_subtract)
         except Exception as e:
             logger.error(f"잭팟 감소 중 오류: {e}")
 
     async def reset_jackpot(self, server_id: int) -> None:
-        try:
-            with get_db_session() as session:
-                jackpot = (
-                    session.query(self.model).filter_by(server_id=server_id).first()
-                )
+        def _reset(session: Session) -> None:
+            jackpot = session.query(self.model).filter_by(server_id=server_id).first()
 
-                if not jackpot:
-                    jackpot = Jackpot(server_id=server_id, amount=INITIAL_JACKPOT)
-                    session.add(jackpot)
-                else:
-                    jackpot.amount = INITIAL_JACKPOT
+            if not jackpot:
+                jackpot = Jackpot(server_id=server_id, amount=INITIAL_JACKPOT)
+                session.add(jackpot)
+            else:
+                jackpot.amount = INITIAL_JACKPOT
 
-                session.commit()
+            session.commit()
+
+        try:
+            await self.run_in_session(_reset)
         except Exception as e:
             logger.error(f"잭팟 초기화 중 오류: {e}")
@@ -23,7 +23,7 @@ class JusticeRepository(MySQLRawRepository):
             return result["count"] if result else 0
 
         try:
-            result = self.execute_query(_get_count)
+            result = await self.execute_query(_get_count)
             return result if result is not None else 0
         except Exception as e:
             logger.error(f"get_user_count({user_id}, {server_id}) FAIL: {e}")
@@ -43,7 +43,7 @@ class JusticeRepository(MySQLRawRepository):
             return True
 
         try:
-            result = self.execute_query(_set_count)
+            result = await self.execute_query(_set_count)
             success = result is True
             self.log_operation(
                 "set_user_count", f"{user_id}, {server_id}, {count}", success=success
@@ -75,7 +75,7 @@ class JusticeRepository(MySQLRawRepository):
             return True
 
         try:
-            result = self.execute_query(_add_history)
+            result = await self.execute_query(_add_history)
             success = result is True
             self.log_operation(
                 "add_timeout_history",
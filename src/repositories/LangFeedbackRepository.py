@@ -0,0 +1,63 @@
+import logging
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from src.domain.models.LangFeedback import LangFeedback
+from src.repositories.SQLAlchemyRawRepository import SQLAlchemyRawRepository
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_LABELS = ("wrong", "wrong_tool", "should_ignore")
+
+
+class LangFeedbackRepository(SQLAlchemyRawRepository):
+    def __init__(self, model=LangFeedback):
+        super().__init__(model)
+
+    async def add_many(self, rows: List[Dict[str, Any]]) -> int:
+        """피드백 행들을 한 번의 executemany INSERT 로 저장한다."""
+        if not rows:
+            return 0
+
+        def _insert(session: Session) -> int:
+            session.execute(insert(self.model), rows)
+            return len(rows)
+
+        return await self.run_in_session(_insert)
+
+    async def get_routing_samples(self, limit: int = 20000) -> List[Tuple[str, bool]]:
+        """LLM 라우팅 결과를 (메시지, 도구/응답 여부) 학습 샘플로 변환한다."""
+
+        def _samples(session: Session) -> List[Tuple[str, bool]]:
+            rows = (
+                session.query(
+                    self.model.user_message,
+                    self.model.parsed_action,
+                    self.model.tool_success,
+                    self.model.label,
+                )
+                .filter(self.model.parsed_action.in_(["tool", "reply", "ignore"]))
+                .order_by(self.model.id.desc())
+                .limit(limit)
+                .all()
+            )
+
+            samples = []
+            for text, action, tool_success, label in rows:
+                if label == "should_respond":
+                    samples.append((text, True))
+                elif label == "should_ignore":
+                    samples.append((text, False))
+                elif label in NEGATIVE_LABELS:
+                    continue
+                elif action == "ignore":
+                    samples.append((text, False))
+                elif tool_success is not False:
+                    samples.append((text, True))
+            return samples
+
+        try:
+            return await self.run_in_session(_samples)
+        except Exception as e:
+            logger.error(f"라우팅 학습 샘플 조회 중 오류: {e}")
+            return []
@@ -0,0 +1,53 @@
+import logging
+from typing import Dict, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from src.domain.models.LedgerCheckpoint import LedgerCheckpoint
+from src.repositories.SQLAlchemyRawRepository import SQLAlchemyRawRepository
+from src.repositories.UserBalanceRepository import UserBalanceRepository
+from src.repositories.JackpotRepository import JackpotRepository
+
+logger = logging.getLogger(__name__)
+
+_UPSERT_CHECKPOINT_SQL = text(
+    "INSERT INTO ledger_checkpoints (name, seq) VALUES (:name, :seq) "
+    "ON DUPLICATE KEY UPDATE seq = GREATEST(seq, VALUES(seq))"
+)
+
+
+class LedgerRepository(SQLAlchemyRawRepository):
+    def __init__(self, model=LedgerCheckpoint):
+        super().__init__(model)
+
+    async def get_checkpoint(self, name: str) -> Optional[int]:
+        def _get(session: Session) -> int:
+            checkpoint = session.query(self.model).filter_by(name=name).first()
+            return checkpoint.seq if checkpoint else 0
+
+        try:
+            return await self.run_in_session(_get)
+        except Exception as e:
+            logger.error(f"원장 체크포인트 조회 중 오류: {e}")
+            return None
+
+    async def apply_batch(
+        self,
+        name: str,
+        seq: int,
+        balance_deltas: Dict[Tuple[int, int], int],
+        jackpot_deltas: Dict[int, int],
+    ) -> bool:
+        def _apply(session: Session) -> bool:
+            UserBalanceRepository.apply_deltas_in_session(session, balance_deltas)
+            for server_id, delta in jackpot_deltas.items():
+                if delta:
+                    JackpotRepository.add_in_session(session, server_id, delta)
+            session.execute(_UPSERT_CHECKPOINT_SQL, {"name": name, "seq": seq})
+            session.commit()
+            return True
+
+        try:
+            return await self.run_in_session(_apply)
+        except Exception as e:
+            logger.error(f"원장 반영 중 오류 (seq={seq}): {e}")
+            return False
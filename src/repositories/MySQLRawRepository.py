@@ -2,6 +2,7 @@ import logging
 from typing import Optional, TypeVar, Callable, Any
 from mysql.connector import MySQLConnection
 from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.executor import run_in_db_executor
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -13,8 +14,10 @@ class MySQLRawRepository:
     def __init__(self):
         self.db_connection = DatabaseConnection
 
-    def execute_query(self, func: Callable[[MySQLConnection], T]) -> Optional[T]:
-        return self.db_connection.execute_query(func)
+    async def execute_query(
+        self, func: Callable[[MySQLConnection], T]
+    ) -> Optional[T]:
+        return await run_in_db_executor(self.db_connection.execute_query, func)
 
     def log_operation(self, operation: str, params: Any = None, success: bool = True):
         status = "OKAY" if success else "FAIL"
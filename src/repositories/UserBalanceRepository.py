@@ -1,136 +1,230 @@
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from src.domain.models.UserBalance import UserBalance
 from src.repositories.SQLAlchemyRawRepository import SQLAlchemyRawRepository
-from src.infrastructure.database.session import get_db_session
+from src.repositories.JackpotRepository import JackpotRepository
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_DELTA_SQL = text(
+    "INSERT INTO user_balances (user_id, server_id, balance) "
+    "VALUES (:user_id, :server_id, GREATEST(0, :delta)) "
+    "ON DUPLICATE KEY UPDATE balance = GREATEST(0, balance + :delta)"
+)
+_UPSERT_SET_SQL = text(
+    "INSERT INTO user_balances (user_id, server_id, balance) "
+    "VALUES (:user_id, :server_id, :balance) "
+    "ON DUPLICATE KEY UPDATE balance = VALUES(balance)"
+)
+_DEBIT_SQL = text(
+    "UPDATE user_balances SET balance = balance - :amount "
+    "WHERE user_id = :user_id AND server_id = :server_id AND balance >= :amount"
+)
+_SELECT_BALANCE_SQL = text(
+    "SELECT balance FROM user_balances "
+    "WHERE user_id = :user_id AND server_id = :server_id"
+)
+_SELECT_SERVER_SQL = text(
+    "SELECT user_id, balance FROM user_balances WHERE server_id = :server_id"
+)
+_SELECT_PAIR_SQL = text(
+    "SELECT user_id, balance FROM user_balances "
+    "WHERE server_id = :server_id AND user_id IN (:sender_id, :recipient_id)"
+)
+
 
 class UserBalanceRepository(SQLAlchemyRawRepository):
     def __init__(self, model=UserBalance):
         super().__init__(model)
 
     async def get_user_balance(self, user_id: int, server_id: int) -> int:
-        try:
-            with get_db_session() as session:
-                user_balance = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, server_id=server_id)
-                    .first()
-                )
+        def _get(session: Session) -> int:
+            user_balance = (
+                session.query(self.model)
+                .filter_by(user_id=user_id, server_id=server_id)
+                .first()
+            )
+
+            if not user_balance:
+                logger.debug(f"사용자 {user_id}의 잔액 정보가 없어 새로 생성합니다.")
+                user_balance = UserBalance(user_id=user_id, server_id=server_id)
+                session.add(user_balance)
+                session.commit()
 
-                if not user_balance:
-                    logger.debug(
-                        f"사용자 {user_id}의 잔액 정보가 없어 새로 생성합니다."
-                    )
-                    user_balance = UserBalance(user_id=user_id, server_id=server_id)
-                    session.add(user_balance)
-                    session.commit()
+            return user_balance.balance
 
-                return user_balance.balance
+        try:
+            return await self.run_in_session(_get)
         except Exception as e:
             logger.error(e)
             return 0
 
-    async def set_user_balance(
-        self, user_id: int, server_id: int, balance: int
-    ) -> None:
-        try:
-            with get_db_session() as session:
-                user_balance = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, server_id=server_id)
-                    .first()
-                )
+    @staticmethod
+    def _apply_delta(session: Session, user_id: int, server_id: int, delta: int) -> int:
+        params = {"user_id": user_id, "server_id": server_id, "delta": delta}
+        session.execute(_UPSERT_DELTA_SQL, params)
+        return session.execute(_SELECT_BALANCE_SQL, params).scalar_one()
 
-                if not user_balance:
-                    user_balance = UserBalance(
-                        user_id=user_id, server_id=server_id, balance=balance
-                    )
-                    session.add(user_balance)
-                else:
-                    user_balance.balance = balance
+    @staticmethod
+    def apply_deltas_in_session(
+        session: Session, deltas: Dict[Tuple[int, int], int]
+    ) -> None:
+        params = [
+            {"user_id": user_id, "server_id": server_id, "delta": delta}
+            for (user_id, server_id), delta in deltas.items()
+            if delta
+        ]
+        if params:
+            session.execute(_UPSERT_DELTA_SQL, params)
+
+    async def set_user_balance(self, user_id: int, server_id: int, balance: int) -> int:
+        def _set(session: Session) -> int:
+            session.execute(
+                _UPSERT_SET_SQL,
+                {"user_id": user_id, "server_id": server_id, "balance": balance},
+            )
+            session.commit()
+            return balance
 
-                session.commit()
+        try:
+            return await self.run_in_session(_set)
         except Exception as e:
             logger.error(e)
+            return balance
 
-    async def add_user_balance(self, user_id: int, server_id: int, amount: int) -> None:
-        try:
-            with get_db_session() as session:
-                user_balance = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, server_id=server_id)
-                    .first()
-                )
-
-                if not user_balance:
-                    user_balance = UserBalance(
-                        user_id=user_id, server_id=server_id, balance=amount
-                    )
-                    session.add(user_balance)
-                else:
-                    user_balance.balance += amount
+    async def add_user_balance(self, user_id: int, server_id: int, amount: int) -> int:
+        def _add(session: Session) -> int:
+            balance = self._apply_delta(session, user_id, server_id, amount)
+            session.commit()
+            return balance
 
-                session.commit()
+        try:
+            return await self.run_in_session(_add)
         except Exception as e:
             logger.error(e)
+            return await self.get_user_balance(user_id, server_id)
 
     async def subtract_user_balance(
         self, user_id: int, server_id: int, amount: int
-    ) -> None:
+    ) -> int:
+        def _subtract(session: Session) -> int:
+            balance = self._apply_delta(session, user_id, server_id, -amount)
+            session.commit()
+            return balance
+
         try:
-            with get_db_session() as session:
-                user_balance = (
-                    session.query(self.model)
-                    .filter_by(user_id=user_id, server_id=server_id)
-                    .first()
+            return await self.run_in_session(_subtract)
+        except Exception as e:
+            logger.error(e)
+            return await self.get_user_balance(user_id, server_id)
+
+    async def transfer(
+        self,
+        sender_id: int,
+        recipient_id: int,
+        server_id: int,
+        amount: int,
+        tax: int,
+    ) -> Optional[Tuple[int, int]]:
+        def _transfer(session: Session) -> Optional[Tuple[int, int]]:
+            def _debit() -> bool:
+                result = session.execute(
+                    _DEBIT_SQL,
+                    {"user_id": sender_id, "server_id": server_id, "amount": amount},
+                )
+                return result.rowcount > 0
+
+            def _credit() -> None:
+                session.execute(
+                    _UPSERT_DELTA_SQL,
+                    {
+                        "user_id": recipient_id,
+                        "server_id": server_id,
+                        "delta": amount - tax,
+                    },
                 )
 
-                if not user_balance:
-                    user_balance = UserBalance(
-                        user_id=user_id, server_id=server_id, balance=0
-                    )
-                    session.add(user_balance)
-                else:
-                    user_balance.balance = max(0, user_balance.balance - amount)
+            # 반대 방향 송금끼리 교착되지 않도록 항상 user_id 오름차순으로 행을 잠근다
+            if sender_id < recipient_id:
+                if not _debit():
+                    session.rollback()
+                    return None
+                _credit()
+            else:
+                _credit()
+                if not _debit():
+                    session.rollback()
+                    return None
+
+            if tax:
+                JackpotRepository.add_in_session(session, server_id, tax)
+
+            balances = session.execute(
+                _SELECT_PAIR_SQL,
+                {
+                    "server_id": server_id,
+                    "sender_id": sender_id,
+                    "recipient_id": recipient_id,
+                },
+            ).all()
+            session.commit()
+
+            by_user = {row[0]: row[1] for row in balances}
+            return by_user[sender_id], by_user[recipient_id]
 
-                session.commit()
+        try:
+            return await self.run_in_session(_transfer)
         except Exception as e:
-            logger.error(e)
+            logger.error(f"송금 처리 중 오류: {e}")
+            return None
 
     async def get_rankings(
         self, server_id: int, limit: int = 10
     ) -> List[Tuple[int, int]]:
+        def _rankings(session: Session) -> List[Tuple[int, int]]:
+            return (
+                session.query(self.model.user_id, self.model.balance)
+                .filter(self.model.server_id == server_id)
+                .order_by(self.model.balance.desc())
+                .limit(limit)
+                .all()
+            )
+
         try:
-            with get_db_session() as session:
-                result = (
-                    session.query(self.model.user_id, self.model.balance)
-                    .filter(self.model.server_id == server_id)
-                    .order_by(self.model.balance.desc())
-                    .limit(limit)
-                    .all()
-                )
-                return result
+            return await self.run_in_session(_rankings)
         except Exception as e:
             logger.error(e)
             return []
 
+    async def get_all_balances(self, server_id: int) -> Optional[List[Tuple[int, int]]]:
+        """서버의 모든 (user_id, balance). 랭킹 인덱스를 만들 때 한 번만 쓴다. 실패하면 None."""
+
+        def _all(session: Session) -> List[Tuple[int, int]]:
+            rows = session.execute(_SELECT_SERVER_SQL, {"server_id": server_id})
+            return [(row[0], row[1]) for row in rows]
+
+        try:
+            return await self.run_in_session(_all)
+        except Exception as e:
+            logger.error(f"서버 {server_id} 잔액 목록 조회 실패: {e}")
+            return None
+
     async def get_sorted_balances(
         self, server_id: int, limit: int = 100
     ) -> List[Tuple[int, int]]:
-        try:
-            with get_db_session() as session:
-                query = (
-                    session.query(self.model.user_id, self.model.balance)
-                    .filter_by(server_id=server_id)
-                    .order_by(self.model.balance.desc())
-                    .limit(limit)
-                )
+        def _sorted(session: Session) -> List[Tuple[int, int]]:
+            query = (
+                session.query(self.model.user_id, self.model.balance)
+                .filter_by(server_id=server_id)
+                .order_by(self.model.balance.desc())
+                .limit(limit)
+            )
+            return [(row[0], row[1]) for row in query.all()]
 
-                result = [(row[0], row[1]) for row in query.all()]
-                return result
+        try:
+            return await self.run_in_session(_sorted)
         except Exception as e:
             logger.error(e)
             return []
@@ -0,0 +1,104 @@
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from src.config.settings.gamblingSettings import ACTIVE_GAME_MAX_AGE
+
+logger = logging.getLogger(__name__)
+
+GAME_NAMES = {
+    "blackjack": "블랙잭",
+    "baccarat": "바카라",
+    "indian_poker": "인디언 포커",
+    "coin": "동전",
+    "dice": "주사위",
+    "work": "노동",
+    "jackpot": "잭팟",
+}
+
+
+@dataclass
+class ActiveGame:
+    user_id: int
+    server_id: int
+    game_type: str
+    started_at: float
+
+    @property
+    def display_name(self) -> str:
+        return GAME_NAMES.get(self.game_type, self.game_type)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class ActiveGameRegistry:
+    """도박 cog 들이 함께 쓰는 진행 중 게임 목록. 유저당 게임 하나만 허용한다.
+
+    finally 에서 end 를 부르지 못하고 죽은 게임은 max_age 가 지나면 다음 조회 때 정리된다.
+    """
+
+    _instance = None
+
+    def __init__(self, max_age: float = ACTIVE_GAME_MAX_AGE):
+        self.max_age = max_age
+        self._games: Dict[int, ActiveGame] = {}
+        self.counters: Counter = Counter()
+
+    @classmethod
+    def instance(cls) -> "ActiveGameRegistry":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get(self, user_id: int) -> Optional[ActiveGame]:
+        game = self._games.get(user_id)
+        if game is not None and game.age > self.max_age:
+            self._reap(game)
+            return None
+        return game
+
+    def start(self, user_id: int, server_id: int, game_type: str) -> Optional[ActiveGame]:
+        """게임을 등록한다. 이미 진행 중인 게임이 있으면 None."""
+        if self.get(user_id) is not None:
+            self.counters["rejected"] += 1
+            return None
+        game = ActiveGame(user_id, server_id, game_type, time.monotonic())
+        self._games[user_id] = game
+        self.counters["started"] += 1
+        return game
+
+    def end(self, game: ActiveGame) -> None:
+        # 정리된 뒤 같은 유저가 새 게임을 시작했을 수 있으므로 자기 게임일 때만 지운다
+        if self._games.get(game.user_id) is game:
+            del self._games[game.user_id]
+            self.counters["ended"] += 1
+
+    def reap(self) -> int:
+        stale = [game for game in self._games.values() if game.age > self.max_age]
+        for game in stale:
+            self._reap(game)
+        return len(stale)
+
+    def _reap(self, game: ActiveGame) -> None:
+        del self._games[game.user_id]
+        self.counters["reaped"] += 1
+        logger.warning(
+            f"끝나지 않은 게임 정리: {game.user_id} {game.game_type} ({game.age:.0f}초 경과)"
+        )
+
+    def count_by_server(self) -> Dict[int, int]:
+        self.reap()
+        return dict(Counter(game.server_id for game in self._games.values()))
+
+    def stats(self) -> Dict:
+        self.reap()
+        return {
+            **self.counters,
+            "active": len(self._games),
+            "by_game": dict(Counter(game.game_type for game in self._games.values())),
+            "peak_server": max(self.count_by_server().values(), default=0),
+        }
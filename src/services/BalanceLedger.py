@@ -0,0 +1,329 @@
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings.gamblingSettings import (
+    INITIAL_JACKPOT,
+    LEDGER_FLUSH_INTERVAL,
+    LEDGER_FLUSH_THRESHOLD,
+    LEDGER_MAX_CACHED,
+)
+
+logger = logging.getLogger(__name__)
+
+BalanceKey = Tuple[int, int]
+
+
+class BalanceLedger:
+    """잔액/잭팟을 메모리에서 처리하고 변경분만 모아서 DB에 반영하는 write-behind 원장.
+
+    모든 변경은 먼저 append-only 저널에 기록되고, 배치 반영과 같은 트랜잭션에서
+    체크포인트(seq)가 갱신된다. 재시작 시 체크포인트 이후의 저널만 다시 반영한다.
+    한 프로세스만 이 테이블들을 쓴다는 전제로 동작한다.
+    """
+
+    NAME = "gambling"
+
+    def __init__(
+        self,
+        user_balance_repo,
+        jackpot_repo,
+        ledger_repo,
+        journal_dir: str,
+        flush_interval: float = LEDGER_FLUSH_INTERVAL,
+        flush_threshold: int = LEDGER_FLUSH_THRESHOLD,
+        max_cached: int = LEDGER_MAX_CACHED,
+    ):
+        self.user_balance_repo = user_balance_repo
+        self.jackpot_repo = jackpot_repo
+        self.ledger_repo = ledger_repo
+        self.journal_dir = Path(journal_dir)
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.max_cached = max_cached
+
+        self._balances: Dict[BalanceKey, int] = {}
+        self._jackpots: Dict[int, int] = {}
+        self._balance_deltas: Dict[BalanceKey, int] = defaultdict(int)
+        self._jackpot_deltas: Dict[int, int] = defaultdict(int)
+        self._pending_ops = 0
+
+        self._seq = 0
+        self._journal = None
+        self._sealed: List[Path] = []
+
+        self._started = False
+        self._start_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flush_event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._started:
+                return
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            await self._replay()
+            self._open_segment()
+            self._task = asyncio.create_task(self._run())
+            self._started = True
+            logger.info(f"잔액 원장 시작 (seq={self._seq}, 저널={self.journal_dir})")
+
+    async def close(self) -> None:
+        if not self._started:
+            return
+        if self._task:
+            # 진행 중인 반영이 끝난 뒤에 루프를 멈춘다
+            async with self._flush_lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if not await self.flush():
+            logger.warning("종료 시 원장 반영 실패 - 다음 시작 때 저널에서 복구합니다")
+        self._close_segment()
+        self._started = False
+
+    async def get_balance(self, user_id: int, server_id: int) -> int:
+        await self.start()
+        key = (user_id, server_id)
+        if key not in self._balances:
+            loaded = await self.user_balance_repo.get_user_balance(user_id, server_id)
+            self._balances.setdefault(key, loaded + self._balance_deltas.get(key, 0))
+        return self._balances[key]
+
+    async def get_jackpot(self, server_id: int) -> int:
+        await self.start()
+        if server_id not in self._jackpots:
+            loaded = await self.jackpot_repo.get_jackpot(server_id)
+            self._jackpots.setdefault(
+                server_id, loaded + self._jackpot_deltas.get(server_id, 0)
+            )
+        return self._jackpots[server_id]
+
+    async def add_balance(self, user_id: int, server_id: int, amount: int) -> int:
+        await self.get_balance(user_id, server_id)
+        delta = self._change_balance((user_id, server_id), amount)
+        self._record(balances=[(user_id, server_id, delta)])
+        return self._balances[(user_id, server_id)]
+
+    async def subtract_balance(self, user_id: int, server_id: int, amount: int) -> int:
+        return await self.add_balance(user_id, server_id, -amount)
+
+    async def add_jackpot(self, server_id: int, amount: int) -> int:
+        await self.get_jackpot(server_id)
+        delta = self._change_jackpot(server_id, amount, floor=None)
+        self._record(jackpots=[(server_id, delta)])
+        return self._jackpots[server_id]
+
+    async def subtract_jackpot(self, server_id: int, amount: int) -> int:
+        await self.get_jackpot(server_id)
+        delta = self._change_jackpot(server_id, -amount, floor=INITIAL_JACKPOT)
+        self._record(jackpots=[(server_id, delta)])
+        return self._jackpots[server_id]
+
+    async def transfer(
+        self, sender_id: int, recipient_id: int, server_id: int, amount: int, tax: int
+    ) -> Optional[Tuple[int, int]]:
+        await self.get_balance(sender_id, server_id)
+        await self.get_balance(recipient_id, server_id)
+        await self.get_jackpot(server_id)
+
+        sender_key = (sender_id, server_id)
+        recipient_key = (recipient_id, server_id)
+        if self._balances[sender_key] < amount:
+            return None
+
+        sent = self._change_balance(sender_key, -amount)
+        received = self._change_balance(recipient_key, amount - tax)
+        taxed = self._change_jackpot(server_id, tax, floor=None)
+        self._record(
+            balances=[
+                (sender_id, server_id, sent),
+                (recipient_id, server_id, received),
+            ],
+            jackpots=[(server_id, taxed)],
+        )
+        return self._balances[sender_key], self._balances[recipient_key]
+
+    async def flush(self) -> bool:
+        async with self._flush_lock:
+            if not self._balance_deltas and not self._jackpot_deltas:
+                return True
+
+            balance_deltas = dict(self._balance_deltas)
+            jackpot_deltas = dict(self._jackpot_deltas)
+            upto = self._seq
+            self._balance_deltas.clear()
+            self._jackpot_deltas.clear()
+            self._pending_ops = 0
+            segments = self._seal()
+
+            ok = await self.ledger_repo.apply_batch(
+                self.NAME, upto, balance_deltas, jackpot_deltas
+            )
+            if not ok:
+                # 커밋 후 응답만 유실된 경우 두 번 반영하지 않도록 체크포인트로 확인
+                checkpoint = await self.ledger_repo.get_checkpoint(self.NAME)
+                ok = checkpoint is not None and checkpoint >= upto
+
+            if not ok:
+                for key, delta in balance_deltas.items():
+                    self._balance_deltas[key] += delta
+                for server_id, delta in jackpot_deltas.items():
+                    self._jackpot_deltas[server_id] += delta
+                logger.warning(
+                    f"원장 반영 실패 - 변경분 {len(balance_deltas)}건을 다음 주기에 재시도합니다"
+                )
+                return False
+
+            for segment in segments:
+                segment.unlink(missing_ok=True)
+                self._sealed.remove(segment)
+            self._evict()
+            logger.debug(
+                f"원장 반영 완료 (seq={upto}, 잔액 {len(balance_deltas)}건, 잭팟 {len(jackpot_deltas)}건)"
+            )
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "cached_balances": len(self._balances),
+            "cached_jackpots": len(self._jackpots),
+            "pending_balances": len(self._balance_deltas),
+            "pending_jackpots": len(self._jackpot_deltas),
+            "seq": self._seq,
+        }
+
+    def _change_balance(self, key: BalanceKey, amount: int) -> int:
+        current = self._balances[key]
+        updated = max(0, current + amount)
+        self._balances[key] = updated
+        return updated - current
+
+    def _change_jackpot(self, server_id: int, amount: int, floor: Optional[int]) -> int:
+        current = self._jackpots[server_id]
+        updated = current + amount
+        if floor is not None:
+            updated = max(floor, updated)
+        self._jackpots[server_id] = updated
+        return updated - current
+
+    def _record(
+        self,
+        balances: List[Tuple[int, int, int]] = (),
+        jackpots: List[Tuple[int, int]] = (),
+    ) -> None:
+        balances = [entry for entry in balances if entry[2]]
+        jackpots = [entry for entry in jackpots if entry[1]]
+        if not balances and not jackpots:
+            return
+
+        self._seq += 1
+        self._journal.write(
+            json.dumps({"seq": self._seq, "b": balances, "j": jackpots}) + "\n"
+        )
+        self._journal.flush()
+
+        for user_id, server_id, delta in balances:
+            self._balance_deltas[(user_id, server_id)] += delta
+        for server_id, delta in jackpots:
+            self._jackpot_deltas[server_id] += delta
+
+        self._pending_ops += 1
+        if self._pending_ops >= self.flush_threshold:
+            self._flush_event.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_event.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"원장 반영 루프 오류: {e}")
+
+    async def _replay(self) -> None:
+        segments = sorted(self.journal_dir.glob("journal-*.jsonl"))
+        if not segments:
+            return
+
+        checkpoint = await self.ledger_repo.get_checkpoint(self.NAME)
+        if checkpoint is None:
+            raise RuntimeError("원장 체크포인트를 읽지 못해 저널을 복구할 수 없습니다")
+
+        balance_deltas: Dict[BalanceKey, int] = defaultdict(int)
+        jackpot_deltas: Dict[int, int] = defaultdict(int)
+        max_seq = checkpoint
+        replayed = 0
+
+        for segment in segments:
+            with segment.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"손상된 저널 줄을 건너뜁니다: {segment.name}")
+                        continue
+                    max_seq = max(max_seq, record["seq"])
+                    if record["seq"] <= checkpoint:
+                        continue
+                    for user_id, server_id, delta in record["b"]:
+                        balance_deltas[(user_id, server_id)] += delta
+                    for server_id, delta in record["j"]:
+                        jackpot_deltas[server_id] += delta
+                    replayed += 1
+
+        self._seq = max_seq
+        if replayed:
+            logger.info(f"저널 복구 중: 미반영 기록 {replayed}건 (체크포인트 {checkpoint})")
+            if not await self.ledger_repo.apply_batch(
+                self.NAME, max_seq, balance_deltas, jackpot_deltas
+            ):
+                # 반영하지 못한 변경분은 메모리에 남겨 조회 값에 포함시키고 다음 주기에 재시도
+                self._balance_deltas.update(balance_deltas)
+                self._jackpot_deltas.update(jackpot_deltas)
+                self._sealed.extend(segments)
+                return
+
+        for segment in segments:
+            segment.unlink(missing_ok=True)
+
+    def _open_segment(self) -> None:
+        path = self.journal_dir / f"journal-{self._seq + 1:012d}.jsonl"
+        self._journal = path.open("a", encoding="utf-8")
+
+    def _close_segment(self) -> Optional[Path]:
+        if self._journal is None:
+            return None
+        path = Path(self._journal.name)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal.close()
+        self._journal = None
+        return path
+
+    def _seal(self) -> List[Path]:
+        sealed = self._close_segment()
+        if sealed is not None:
+            self._sealed.append(sealed)
+        self._open_segment()
+        return list(self._sealed)
+
+    def _evict(self) -> None:
+        overflow = len(self._balances) - self.max_cached
+        if overflow <= 0:
+            return
+        for key in list(self._balances)[:overflow]:
+            if key not in self._balance_deltas:
+                del self._balances[key]
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+from src.config.settings.Base import BaseConfig
+from src.config.settings.riotSettings import (
+    DDRAGON_CHAMPION_URL,
+    DDRAGON_REFRESH_INTERVAL,
+    DDRAGON_VERSIONS_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChampionIndex:
+    """패치 버전 하나의 챔피언 데이터와 조회용 인덱스. 교체는 객체째 바꿔서 한 번에 한다."""
+
+    version: Optional[str] = None
+    data: Dict[str, Dict] = field(default_factory=dict)
+    # "Ahri" -> "아리"
+    kr_names: Dict[str, str] = field(default_factory=dict)
+    # 103 -> ("아리", "Ahri")
+    by_key: Dict[int, Tuple[str, str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, version: str, data: Dict[str, Dict]) -> "ChampionIndex":
+        return cls(
+            version=version,
+            data=data,
+            kr_names={en_name: info["name"] for en_name, info in data.items()},
+            by_key={
+                int(info["key"]): (info["name"], en_name)
+                for en_name, info in data.items()
+            },
+        )
+
+
+class ChampionDataStore:
+    """Data Dragon 챔피언 데이터를 버전별 파일로 디스크에 캐시하는 저장소.
+
+    시작할 때는 디스크에 있는 마지막 버전을 먼저 쓰고, versions.json 에 새 패치가
+    올라왔을 때만 백그라운드에서 내려받아 교체한다. 네트워크가 없어도 캐시로 동작한다.
+    """
+
+    _instance = None
+
+    def __init__(
+        self,
+        cache_dir: str = BaseConfig.LOL_CHAMPION_CACHE_DIR,
+        refresh_interval: float = DDRAGON_REFRESH_INTERVAL,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.refresh_interval = refresh_interval
+        self.index = ChampionIndex()
+
+        self._loaded = asyncio.Event()
+        self._start_lock = asyncio.Lock()
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def instance(cls) -> "ChampionDataStore":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.index.version
+
+    @property
+    def data(self) -> Dict[str, Dict]:
+        return self.index.data
+
+    def kr_name(self, champion_id: str) -> str:
+        return self.index.kr_names.get(champion_id, champion_id)
+
+    def by_key(self, key: int) -> Optional[Tuple[str, str]]:
+        return self.index.by_key.get(key)
+
+    async def ensure_loaded(self) -> None:
+        if self._loaded.is_set():
+            return
+        async with self._start_lock:
+            if self._task is None:
+                payload = await asyncio.to_thread(self._read_cache)
+                if payload:
+                    self._apply(payload["version"], payload["data"])
+                    logger.info(f"롤 챔피언 데이터 캐시 사용 (버전: {self.version})")
+                self._task = asyncio.create_task(self._run())
+        if not self._loaded.is_set():
+            # 디스크 캐시가 없으면 첫 다운로드를 기다린다
+            await self.refresh()
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self) -> bool:
+        async with self._refresh_lock:
+            try:
+                async with aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=15)
+                ) as session:
+                    async with session.get(DDRAGON_VERSIONS_URL) as response:
+                        response.raise_for_status()
+                        latest = (await response.json())[0]
+                    if latest == self.version:
+                        return False
+                    async with session.get(
+                        DDRAGON_CHAMPION_URL.format(version=latest)
+                    ) as response:
+                        response.raise_for_status()
+                        champions = await response.json()
+            except Exception as e:
+                logger.error(f"롤 챔피언 데이터 갱신 실패: {e}")
+                return False
+
+            await asyncio.to_thread(self._write_cache, latest, champions["data"])
+            self._apply(latest, champions["data"])
+            logger.info(f"롤 챔피언 데이터 로드 완료 (버전: {latest})")
+            return True
+
+    def _apply(self, version: str, data: Dict[str, Dict]) -> None:
+        # 인덱스를 모두 만든 뒤 참조 하나만 바꿔서, 조회 중인 코드가 섞인 버전을 보지 않게 한다
+        self.index = ChampionIndex.build(version, data)
+        self._loaded.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def _read_cache(self) -> Optional[Dict]:
+        for path in sorted(self.cache_dir.glob("champion-*.json"), reverse=True):
+            try:
+                with path.open(encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"챔피언 캐시 파일을 읽지 못했습니다: {path.name}, {e}")
+        return None
+
+    def _write_cache(self, version: str, data: Dict[str, Dict]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"champion-{version}.json"
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": version, "data": data}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        for old in self.cache_dir.glob("champion-*.json"):
+            if old != path:
+                old.unlink(missing_ok=True)
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set, Tuple
+
+from src.config.settings.Base import BaseConfig
+from src.repositories.ChannelFeatureRepository import (
+    FEATURE_TABLES,
+    ChannelFeatureRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+FEATURES = tuple(feature for feature, _ in FEATURE_TABLES)
+
+
+class ChannelFeatureRegistry:
+    """채널별 기능(lang/filter/slow_mode/periodic_clean) 활성 여부를 메모리에 들고 있는 레지스트리.
+
+    시작할 때 한 번의 쿼리로 전부 읽고, 이후에는 updated_at 워터마크 이후 변경분만 읽는다.
+    조회 실패 시 지수 백오프 동안은 메시지 경로에서 DB 를 다시 두드리지 않는다.
+    """
+
+    _instance = None
+    # 같은 초에 커밋된 행이나 늦게 커밋된 트랜잭션을 놓치지 않도록 겹쳐 읽는 구간
+    OVERLAP = timedelta(seconds=5)
+
+    def __init__(
+        self,
+        repo: Optional[ChannelFeatureRepository] = None,
+        refresh_interval: float = BaseConfig.CHANNEL_REGISTRY_REFRESH_INTERVAL,
+        max_backoff: float = BaseConfig.CHANNEL_REGISTRY_MAX_BACKOFF,
+        base_backoff: float = 1.0,
+    ):
+        self.repo = repo or ChannelFeatureRepository()
+        self.refresh_interval = refresh_interval
+        self.max_backoff = max_backoff
+        self.base_backoff = base_backoff
+
+        # (기능, 행 id) -> (채널 id, 활성 여부). 슬로우 모드/주기 청소는 채널 id 가 바뀔 수 있다
+        self._rows: Dict[Tuple[str, int], Tuple[int, bool]] = {}
+        self._channels: Dict[str, Counter] = {feature: Counter() for feature in FEATURES}
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._failures = 0
+        self._retry_at = 0.0
+
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Optional[asyncio.Task] = None
+
+    @classmethod
+    def instance(cls) -> "ChannelFeatureRegistry":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def is_enabled(self, feature: str, channel_id: int) -> bool:
+        if not self._loaded:
+            self._schedule_refresh()
+        return channel_id in self._channels[feature]
+
+    def channels(self, feature: str) -> Set[int]:
+        return set(self._channels[feature])
+
+    def invalidate(self) -> None:
+        """설정 변경 직후 호출하면 백오프와 관계없이 곧바로 변경분을 다시 읽는다."""
+        # 진행 중인 갱신이 커밋 전에 시작됐을 수 있으므로 항상 한 번 더 읽는다
+        self._pending = asyncio.get_running_loop().create_task(self.refresh(force=True))
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            await self.refresh(force=True)
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        for task in (self._task, self._pending):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def refresh(self, force: bool = False) -> bool:
+        if not force and time.monotonic() < self._retry_at:
+            return False
+
+        async with self._lock:
+            since = None
+            if self._loaded and self._watermark is not None:
+                since = self._watermark - self.OVERLAP
+
+            rows = await self.repo.get_changes(since)
+            if rows is None:
+                self._failures += 1
+                delay = min(self.max_backoff, self.base_backoff * 2 ** (self._failures - 1))
+                self._retry_at = time.monotonic() + delay
+                logger.warning(
+                    f"채널 기능 목록 갱신 실패 ({self._failures}회) - {delay:.0f}초 후 재시도"
+                )
+                return False
+
+            for row in rows:
+                self._apply(*row)
+            self._failures = 0
+            self._retry_at = 0.0
+
+            if not self._loaded:
+                self._loaded = True
+                summary = ", ".join(
+                    f"{feature} {len(self._channels[feature])}개" for feature in FEATURES
+                )
+                logger.info(f"채널 기능 목록 로드 완료 ({summary})")
+            return True
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            **{feature: len(self._channels[feature]) for feature in FEATURES},
+            "loaded": self._loaded,
+            "failures": self._failures,
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+        }
+
+    def _apply(
+        self,
+        feature: str,
+        row_id: int,
+        channel_id: int,
+        enabled: bool,
+        updated_at: Optional[datetime],
+    ) -> None:
+        key = (feature, row_id)
+        previous = self._rows.get(key)
+        if previous and previous[1]:
+            counts = self._channels[feature]
+            counts[previous[0]] -= 1
+            if counts[previous[0]] <= 0:
+                del counts[previous[0]]
+
+        self._rows[key] = (channel_id, enabled)
+        if enabled:
+            self._channels[feature][channel_id] += 1
+
+        if updated_at and (self._watermark is None or updated_at > self._watermark):
+            self._watermark = updated_at
+
+    def _schedule_refresh(self, force: bool = False) -> None:
+        if self._pending and not self._pending.done():
+            return
+        if not force and time.monotonic() < self._retry_at:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pending = loop.create_task(self.refresh(force=force))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(
+                max(self.refresh_interval, self._retry_at - time.monotonic())
+            )
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"채널 기능 목록 갱신 루프 오류: {e}")
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.config.settings.gamblingSettings import (
+    COOLDOWNS,
+    COOLDOWN_PERSIST_MIN,
+    COOLDOWN_FLUSH_INTERVAL,
+    COOLDOWN_WHEEL_SLOTS,
+    COOLDOWN_WHEEL_TICK,
+)
+
+logger = logging.getLogger(__name__)
+
+CooldownKey = Tuple[int, str]
+
+
+class CooldownIndex:
+    """(user_id, action_type) 별 쿨다운 만료 시각을 메모리에 들고 있는 인덱스.
+
+    조회는 dict 한 번으로 끝나고 DB 를 읽지 않는다. persist_min 이상인 긴 쿨다운만 모아서
+    주기적으로 DB 에 쓰고, 시작할 때 아직 안 끝난 것들을 한 번 읽어 온다.
+    만료된 항목은 만료 시각으로 나눈 슬롯(timer wheel)을 tick 마다 하나씩 훑어서 지운다.
+    """
+
+    def __init__(
+        self,
+        repo,
+        durations: Dict[str, int] = COOLDOWNS,
+        persist_min: int = COOLDOWN_PERSIST_MIN,
+        flush_interval: float = COOLDOWN_FLUSH_INTERVAL,
+        slots: int = COOLDOWN_WHEEL_SLOTS,
+        tick: float = COOLDOWN_WHEEL_TICK,
+    ):
+        self.repo = repo
+        self.durations = durations
+        self.persist_min = persist_min
+        self.flush_interval = flush_interval
+        self.tick = tick
+
+        # key -> (monotonic 만료 시각, 슬롯 번호)
+        self._entries: Dict[CooldownKey, Tuple[float, int]] = {}
+        self._slots: List[Set[CooldownKey]] = [set() for _ in range(slots)]
+        self._cursor = int(time.monotonic() // tick)
+        self._dirty: Dict[CooldownKey, datetime] = {}
+        self.counters: Counter = Counter()
+
+        self._started = False
+        self._start_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._started:
+                return
+            await self._load()
+            self._task = asyncio.create_task(self._run())
+            self._started = True
+
+    async def close(self) -> None:
+        if not self._started:
+            return
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if not await self.flush():
+            logger.warning(f"종료 시 쿨다운 {len(self._dirty)}건을 저장하지 못했습니다")
+        self._started = False
+
+    def remaining(self, user_id: int, action_type: str) -> int:
+        entry = self._entries.get((user_id, action_type))
+        if entry is None:
+            return 0
+        left = entry[0] - time.monotonic()
+        return int(left) if left > 0 else 0
+
+    def set(self, user_id: int, action_type: str, seconds: Optional[int] = None) -> None:
+        if seconds is None:
+            seconds = self.durations[action_type]
+        key = (user_id, action_type)
+        self._put(key, time.monotonic() + seconds)
+        if seconds >= self.persist_min:
+            # DB 에는 기존처럼 사용 시각(UTC)만 남긴다
+            self._dirty[key] = datetime.utcnow()
+
+    async def flush(self) -> bool:
+        if not self._dirty:
+            return True
+        batch = self._dirty
+        self._dirty = {}
+        rows = [(user_id, action, used) for (user_id, action), used in batch.items()]
+        if not await self.repo.set_cooldowns(rows):
+            # 그 사이 다시 쓰인 키는 새 값을 유지한다
+            for key, used in batch.items():
+                self._dirty.setdefault(key, used)
+            return False
+        self.counters["flushed"] += len(rows)
+        return True
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """지난 tick 들의 슬롯을 훑어서 만료된 항목을 지운다. 한 바퀴 이상 밀렸으면 전체를 한 번 훑는다."""
+        now = time.monotonic() if now is None else now
+        target = int(now // self.tick)
+        steps = min(target - self._cursor, len(self._slots))
+        removed = 0
+        for step in range(1, steps + 1):
+            slot = (self._cursor + step) % len(self._slots)
+            bucket = self._slots[slot]
+            expired = [key for key in bucket if self._entries[key][0] <= now]
+            for key in expired:
+                bucket.discard(key)
+                del self._entries[key]
+            removed += len(expired)
+        self._cursor = max(self._cursor, target)
+        self.counters["pruned"] += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "pending": len(self._dirty),
+            **self.counters,
+        }
+
+    def _put(self, key: CooldownKey, expires_at: float) -> None:
+        old = self._entries.get(key)
+        if old is not None:
+            self._slots[old[1]].discard(key)
+        # 이미 지나간 tick 에 넣으면 한 바퀴 뒤에야 훑으므로 다음 tick 이후로 잡는다
+        tick_no = max(int(expires_at // self.tick) + 1, self._cursor + 1)
+        slot = tick_no % len(self._slots)
+        self._slots[slot].add(key)
+        self._entries[key] = (expires_at, slot)
+
+    async def _load(self) -> None:
+        persisted = {
+            action: seconds
+            for action, seconds in self.durations.items()
+            if seconds >= self.persist_min
+        }
+        if not persisted:
+            return
+        utc_now = datetime.utcnow()
+        since = utc_now - timedelta(seconds=max(persisted.values()))
+        rows = await self.repo.get_cooldowns_since(list(persisted), since)
+        if rows is None:
+            logger.warning("저장된 쿨다운을 불러오지 못했습니다 - 긴 쿨다운이 초기화된 상태로 시작합니다")
+            return
+
+        now = time.monotonic()
+        loaded = 0
+        for user_id, action, used in rows:
+            left = persisted[action] - (utc_now - used).total_seconds()
+            if left > 0 and (user_id, action) not in self._entries:
+                self._put((user_id, action), now + left)
+                loaded += 1
+        logger.info(f"쿨다운 인덱스 시작: 저장된 쿨다운 {loaded}건 복구")
+
+    async def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            await asyncio.sleep(self.tick)
+            try:
+                self.prune()
+                if time.monotonic() - last_flush >= self.flush_interval:
+                    last_flush = time.monotonic()
+                    await self.flush()
+            except Exception as e:
+                logger.error(f"쿨다운 정리 루프 오류: {e}")
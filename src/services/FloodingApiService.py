@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from src.clients.FloodingApiClient import AuthenticatedApiClient
 from src.schemas.FloodingResponse import MusicItem, UserStatus
+from src.utils.cache.ttlCache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,14 @@ MUSIC_LIST_TTL = 600
 
 
 class FloodingApiService:
+    # 컨테이너가 Factory 로 인스턴스를 여러 번 만들기 때문에 캐시는 클래스에 둔다
+    _user_status_cache: TTLCache[UserStatus] = TTLCache(
+        maxsize=1024, ttl=USER_STATUS_TTL, name="flooding.user_status"
+    )
+    _music_list_cache: TTLCache[list[MusicItem]] = TTLCache(
+        maxsize=1024, ttl=MUSIC_LIST_TTL, name="flooding.music_list"
+    )
+
     def __init__(
         self,
         client: AuthenticatedApiClient,
@@ -22,19 +30,16 @@ class FloodingApiService:
     ) -> None:
         self._client = client
         self._auth_service = auth_service
-        self._user_status_cache: dict[str, tuple[float, UserStatus]] = {}
-        self._music_list_cache: dict[str, tuple[float, list[MusicItem]]] = {}
 
     async def get_user_status(self, discord_user_id: str) -> UserStatus:
-        if discord_user_id in self._user_status_cache:
-            cache_time, cached = self._user_status_cache[discord_user_id]
-            if time.time() - cache_time < USER_STATUS_TTL:
-                logger.debug(f"유저 상태 캐시 사용: {discord_user_id}")
-                return cached
+        cached = self._user_status_cache.get(discord_user_id)
+        if cached is not None:
+            logger.debug(f"유저 상태 캐시 사용: {discord_user_id}")
+            return cached
         token = await self._auth_service.get_valid_token(discord_user_id)
         resp = await self._client.get_with_bearer("/user/myself", access_token=token)
         result = self._to_user_status(resp.data)
-        self._user_status_cache[discord_user_id] = (time.time(), result)
+        self._user_status_cache.set(discord_user_id, result)
         return result
 
     async def request_music(self, discord_user_id: str, music_url: str) -> None:
@@ -48,11 +53,10 @@ class FloodingApiService:
     async def get_music_list(self, discord_user_id: str) -> list[MusicItem]:
         today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
         cache_key = f"{discord_user_id}:{today}"
-        if cache_key in self._music_list_cache:
-            cache_time, cached = self._music_list_cache[cache_key]
-            if time.time() - cache_time < MUSIC_LIST_TTL:
-                logger.debug(f"음악 목록 캐시 사용: {discord_user_id} {today}")
-                return cached
+        cached = self._music_list_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"음악 목록 캐시 사용: {discord_user_id} {today}")
+            return cached
         token = await self._auth_service.get_valid_token(discord_user_id)
         resp = await self._client.get_with_bearer(
             f"/music?date={today}&type=LATEST",
@@ -70,7 +74,7 @@ class FloodingApiService:
             )
             for item in (resp.data or {}).get("music_list", [])
         ]
-        self._music_list_cache[cache_key] = (time.time(), result)
+        self._music_list_cache.set(cache_key, result)
         return result
 
     def _to_user_status(self, data: dict) -> UserStatus:
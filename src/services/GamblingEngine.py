@@ -0,0 +1,192 @@
+"""도박 게임 규칙만 모아 둔 모듈. 디스코드/DB 없이 돌아가므로 cog 와 시뮬레이터가 같이 쓴다.
+
+난수는 rng 인자로 받는다. 카드 게임은 random 모듈, 동전/주사위/잭팟은 기존처럼 secrets 기반 난수가 기본값이다.
+"""
+
+import random
+import secrets
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from src.config.settings.gamblingSettings import (
+    INCOME_TAX_BRACKETS,
+    SECURITIES_TRANSACTION_TAX_BRACKETS,
+    GIFT_TAX_BRACKETS,
+    GAME_MULTIPLIER_RANGES,
+    BLACKJACK_21_MULTIPLIER,
+    BACCARAT_TIE_MULTIPLIER,
+    JACKPOT_WIN_ODDS,
+    JACKPOT_PAYOUT_DIVISOR,
+)
+
+CARDS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+COIN_SIDES = ["앞", "뒤"]
+DICE_FACES = 6
+# 게임 세금은 증권거래세 구간을 쓴다
+SECURITIES_TAX_GAMES = {"coin", "dice", "blackjack", "baccarat", "indian_poker"}
+
+_system_random = secrets.SystemRandom()
+
+
+def new_deck(rng=random) -> List[str]:
+    deck = CARDS * 4
+    rng.shuffle(deck)
+    return deck
+
+
+def calculate_hand_value(cards: Sequence[str]) -> int:
+    value = 0
+    aces = 0
+
+    for card in cards:
+        if card in ["J", "Q", "K"]:
+            value += 10
+        elif card == "A":
+            aces += 1
+            value += 11
+        else:
+            value += int(card)
+
+    while value > 21 and aces > 0:
+        value -= 10
+        aces -= 1
+
+    return value
+
+
+def calculate_baccarat_value(cards: Sequence[str]) -> int:
+    value = 0
+
+    for card in cards:
+        if card in ["J", "Q", "K", "10"]:
+            value += 0
+        elif card == "A":
+            value += 1
+        else:
+            value += int(card)
+
+    return value % 10
+
+
+def bracket_tax(amount: int, brackets: Sequence[Tuple[int, float]]) -> int:
+    for threshold, rate in brackets:
+        if amount > threshold:
+            return int(amount * rate)
+    return 0
+
+
+def calculate_tax(amount: int, tax_type: str = "income") -> int:
+    if tax_type == "securities" or tax_type in SECURITIES_TAX_GAMES:
+        return bracket_tax(amount, SECURITIES_TRANSACTION_TAX_BRACKETS)
+    elif tax_type == "gift":
+        return bracket_tax(amount, GIFT_TAX_BRACKETS)
+    else:
+        return bracket_tax(amount, INCOME_TAX_BRACKETS)
+
+
+def game_multiplier(game_type: str, rng=random) -> float:
+    return rng.uniform(*GAME_MULTIPLIER_RANGES[game_type])
+
+
+def settle(bet: int, won: bool, multiplier: float, tax_type: str) -> Tuple[int, int]:
+    """(잔액 변화, 세금). 이기면 베팅금을 빼지 않고 bet × multiplier 에서 세금만 떼어 더한다."""
+    if not won:
+        return -bet, 0
+    winnings = int(bet * multiplier)
+    tax = calculate_tax(winnings, tax_type)
+    return winnings - tax, tax
+
+
+def flip_coin(rng=_system_random) -> str:
+    return rng.choice(COIN_SIDES)
+
+
+def roll_dice(rng=_system_random) -> str:
+    return str(rng.randrange(DICE_FACES) + 1)
+
+
+def deal_blackjack(rng=random) -> Tuple[List[str], List[str], List[str]]:
+    """(남은 덱, 플레이어 패, 딜러 패)"""
+    deck = new_deck(rng)
+    player_hand = [deck.pop(), deck.pop()]
+    dealer_hand = [deck.pop(), deck.pop()]
+    return deck, player_hand, dealer_hand
+
+
+def play_dealer(deck: List[str], dealer_hand: List[str]) -> int:
+    """딜러는 17 이상이 될 때까지 받는다. dealer_hand 를 채우고 최종 합계를 돌려준다."""
+    dealer_value = calculate_hand_value(dealer_hand)
+    while dealer_value < 17:
+        dealer_hand.append(deck.pop())
+        dealer_value = calculate_hand_value(dealer_hand)
+    return dealer_value
+
+
+def blackjack_wins(player_value: int, dealer_value: int) -> bool:
+    # 무승부는 진 것으로 처리한다
+    return player_value <= 21 and (dealer_value > 21 or player_value > dealer_value)
+
+
+def blackjack_multiplier(player_value: int, rng=random) -> float:
+    if player_value == 21:
+        return BLACKJACK_21_MULTIPLIER
+    return game_multiplier("blackjack", rng)
+
+
+@dataclass
+class BaccaratRound:
+    player_hand: List[str]
+    banker_hand: List[str]
+    player_value: int
+    banker_value: int
+    result: str
+
+
+def play_baccarat(rng=random) -> BaccaratRound:
+    deck = new_deck(rng)
+
+    player_hand = [deck.pop(), deck.pop()]
+    banker_hand = [deck.pop(), deck.pop()]
+
+    player_value = calculate_baccarat_value(player_hand)
+    banker_value = calculate_baccarat_value(banker_hand)
+
+    if player_value <= 5:
+        player_hand.append(deck.pop())
+        player_value = calculate_baccarat_value(player_hand)
+
+    if banker_value <= 5:
+        banker_hand.append(deck.pop())
+        banker_value = calculate_baccarat_value(banker_hand)
+
+    if player_value > banker_value:
+        result = "Player"
+    elif banker_value > player_value:
+        result = "Banker"
+    else:
+        result = "Tie"
+
+    return BaccaratRound(player_hand, banker_hand, player_value, banker_value, result)
+
+
+def baccarat_multiplier(result: str, rng=random) -> float:
+    if result == "Tie":
+        return BACCARAT_TIE_MULTIPLIER
+    return game_multiplier("baccarat", rng)
+
+
+def deal_indian_poker(rng=random) -> Tuple[int, int]:
+    """(플레이어 카드, JEE6 카드). 플레이어는 상대 카드만 보고 콜/다이를 고른다."""
+    return rng.randint(1, 10), rng.randint(1, 10)
+
+
+def indian_die_loss(bet: int) -> int:
+    return bet // 2
+
+
+def jackpot_hit(rng=_system_random) -> bool:
+    return rng.randrange(JACKPOT_WIN_ODDS) == 0
+
+
+def jackpot_payout(jackpot: int) -> int:
+    return jackpot // JACKPOT_PAYOUT_DIVISOR
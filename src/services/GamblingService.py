@@ -1,48 +1,40 @@
 import logging
-import time
 import asyncio
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
 
 from src.repositories.UserBalanceRepository import UserBalanceRepository
 from src.repositories.JackpotRepository import JackpotRepository
 from src.repositories.CooldownRepository import CooldownRepository
+from src.repositories.LedgerRepository import LedgerRepository
+from src.services.BalanceLedger import BalanceLedger
+from src.services.Leaderboard import LeaderboardIndex
+from src.services.CooldownIndex import CooldownIndex
+from src.services import GamblingEngine
+from src.config.settings.Base import BaseConfig
+from src.utils.cache.ttlCache import TTLCache
+from src.utils.concurrency.stripedLock import StripedLock
 from src.config.settings.gamblingSettings import (
     INCOME_TAX_BRACKETS,
     SECURITIES_TRANSACTION_TAX_BRACKETS,
     GIFT_TAX_BRACKETS,
     MIN_BET,
     MAX_BET,
+    RANKING_DEPTH,
+    RANKING_FETCH_CONCURRENCY,
+    LOCK_STRIPES,
 )
 
 logger = logging.getLogger(__name__)
 
 
-class GamblingManager:
-    def __init__(self):
-        self.active_games: Dict[int, str] = {}
-        self.lock = asyncio.Lock()
-
-    async def start_game(self, user_id: int, game_type: str) -> bool:
-        async with self.lock:
-            if user_id in self.active_games:
-                return False
-            self.active_games[user_id] = game_type
-            return True
-
-    async def end_game(self, user_id: int) -> None:
-        async with self.lock:
-            if user_id in self.active_games:
-                del self.active_games[user_id]
-
-
 class GamblingService:
 
     _instance = None
-    _locks: Dict[int, asyncio.Lock] = {}
-    _rankings_cache: Dict[int, List[Tuple[int, str, int]]] = {}
-    _rankings_cache_time: Dict[int, float] = {}
+    _locks = StripedLock(LOCK_STRIPES)
     CACHE_EXPIRATION = 300
+    _rankings_cache: TTLCache[List[Tuple[int, str, int]]] = TTLCache(
+        maxsize=512, ttl=CACHE_EXPIRATION, name="gambling.rankings"
+    )
 
     def __new__(cls):
         if cls._instance is None:
@@ -50,12 +42,33 @@ class GamblingService:
             cls._instance.user_balance_repo = UserBalanceRepository()
             cls._instance.jackpot_repo = JackpotRepository()
             cls._instance.cooldown_repo = CooldownRepository()
+            cls._instance.ledger = (
+                BalanceLedger(
+                    cls._instance.user_balance_repo,
+                    cls._instance.jackpot_repo,
+                    LedgerRepository(),
+                    BaseConfig.GAMBLING_LEDGER_DIR,
+                )
+                if BaseConfig.GAMBLING_LEDGER_ENABLED
+                else None
+            )
+            cls._instance.leaderboards = LeaderboardIndex(
+                cls._instance._load_leaderboard
+            )
+            cls._instance.cooldowns = CooldownIndex(cls._instance.cooldown_repo)
         return cls._instance
 
-    async def _get_lock(self, user_id: int) -> asyncio.Lock:
-        if user_id not in self._locks:
-            self._locks[user_id] = asyncio.Lock()
-        return self._locks[user_id]
+    async def close(self) -> None:
+        await self.cooldowns.close()
+        if self.ledger:
+            await self.ledger.close()
+
+    def user_lock(self, *user_ids: int):
+        """유저 잔액을 바꾸는 구간을 감싼다. 송금처럼 여러 명이면 한 번에 넘긴다."""
+        return self._locks.hold(*user_ids)
+
+    def lock_stats(self) -> Dict:
+        return self._locks.stats()
 
     def validate_bet(
         self, bet_amount: Optional[int], min_bet: int = MIN_BET, max_bet: int = MAX_BET
@@ -69,136 +82,185 @@ class GamblingService:
         return None
 
     async def get_balance(self, user_id: int, server_id: int) -> int:
-        return await self.user_balance_repo.get_user_balance(user_id, server_id)
-
-    async def add_balance(self, user_id: int, server_id: int, amount: int) -> None:
-        await self.user_balance_repo.add_user_balance(user_id, server_id, amount)
-
-    async def subtract_balance(self, user_id: int, server_id: int, amount: int) -> None:
-        await self.user_balance_repo.subtract_user_balance(user_id, server_id, amount)
+        if self.ledger:
+            balance = await self.ledger.get_balance(user_id, server_id)
+        else:
+            balance = await self.user_balance_repo.get_user_balance(user_id, server_id)
+        # 처음 조회한 유저는 잔액 행이 새로 생기므로 순위표에도 넣는다
+        self.leaderboards.update(server_id, user_id, balance)
+        return balance
+
+    async def add_balance(self, user_id: int, server_id: int, amount: int) -> int:
+        if self.ledger:
+            balance = await self.ledger.add_balance(user_id, server_id, amount)
+        else:
+            balance = await self.user_balance_repo.add_user_balance(
+                user_id, server_id, amount
+            )
+        self.leaderboards.update(server_id, user_id, balance)
+        return balance
+
+    async def subtract_balance(self, user_id: int, server_id: int, amount: int) -> int:
+        if self.ledger:
+            balance = await self.ledger.subtract_balance(user_id, server_id, amount)
+        else:
+            balance = await self.user_balance_repo.subtract_user_balance(
+                user_id, server_id, amount
+            )
+        self.leaderboards.update(server_id, user_id, balance)
+        return balance
+
+    async def transfer(
+        self, sender_id: int, recipient_id: int, server_id: int, amount: int, tax: int
+    ) -> Optional[Tuple[int, int]]:
+        if self.ledger:
+            result = await self.ledger.transfer(
+                sender_id, recipient_id, server_id, amount, tax
+            )
+        else:
+            result = await self.user_balance_repo.transfer(
+                sender_id, recipient_id, server_id, amount, tax
+            )
+        if result:
+            self.leaderboards.update(server_id, sender_id, result[0])
+            self.leaderboards.update(server_id, recipient_id, result[1])
+        return result
 
     async def get_jackpot(self, server_id: int) -> int:
+        if self.ledger:
+            return await self.ledger.get_jackpot(server_id)
         return await self.jackpot_repo.get_jackpot(server_id)
 
     async def add_jackpot(self, server_id: int, amount: int) -> None:
+        if self.ledger:
+            await self.ledger.add_jackpot(server_id, amount)
+            return
         await self.jackpot_repo.add_jackpot(server_id, amount)
 
     async def subtract_jackpot(self, server_id: int, amount: int) -> None:
+        if self.ledger:
+            await self.ledger.subtract_jackpot(server_id, amount)
+            return
         await self.jackpot_repo.subtract_jackpot(server_id, amount)
 
-    async def set_cooldown(self, user_id: int, action_type: str) -> None:
-        await self.cooldown_repo.set_cooldown(user_id, action_type)
-
-    async def check_cooldown(
-        self, user_id: int, action_type: str, cooldown_seconds: int
-    ) -> int:
-        last_used = await self.cooldown_repo.get_cooldown(user_id, action_type)
-        if not last_used:
-            return 0
+    async def set_cooldown(
+        self, user_id: int, action_type: str, seconds: Optional[int] = None
+    ) -> None:
+        """쿨다운을 건다. seconds 를 생략하면 gamblingSettings.COOLDOWNS 의 값을 쓴다."""
+        await self.cooldowns.start()
+        self.cooldowns.set(user_id, action_type, seconds)
 
-        now = datetime.utcnow()
-        cooldown_end = last_used + timedelta(seconds=cooldown_seconds)
-
-        if now < cooldown_end:
-            remaining = (cooldown_end - now).total_seconds()
-            return int(remaining)
-        return 0
+    async def check_cooldown(self, user_id: int, action_type: str) -> int:
+        await self.cooldowns.start()
+        return self.cooldowns.remaining(user_id, action_type)
 
     def calculate_tax(self, amount: int, tax_type: str = "income") -> int:
-        if tax_type == "securities" or tax_type in [
-            "coin",
-            "dice",
-            "blackjack",
-            "baccarat",
-            "indian_poker",
-        ]:
-            return self.calculate_securities_transaction_tax(amount)
-        elif tax_type == "gift":
-            return self.calculate_gift_tax(amount)
-        else:
-            return self.calculate_income_tax(amount)
+        return GamblingEngine.calculate_tax(amount, tax_type)
 
     def calculate_income_tax(self, amount: int) -> int:
-        for threshold, rate in INCOME_TAX_BRACKETS:
-            if amount > threshold:
-                return int(amount * rate)
-        return 0
+        return GamblingEngine.bracket_tax(amount, INCOME_TAX_BRACKETS)
 
     def calculate_securities_transaction_tax(self, amount: int) -> int:
-        for threshold, rate in SECURITIES_TRANSACTION_TAX_BRACKETS:
-            if amount > threshold:
-                return int(amount * rate)
-        return 0
+        return GamblingEngine.bracket_tax(amount, SECURITIES_TRANSACTION_TAX_BRACKETS)
 
     def calculate_gift_tax(self, amount: int) -> int:
-        for threshold, rate in GIFT_TAX_BRACKETS:
-            if amount > threshold:
-                return int(amount * rate)
-        return 0
+        return GamblingEngine.bracket_tax(amount, GIFT_TAX_BRACKETS)
 
     async def get_rankings(
         self, server_id: int, limit: int = 10
     ) -> List[Tuple[int, int]]:
+        board = await self.leaderboards.get(server_id)
+        if board is not None:
+            return board.top(limit)
+        if self.ledger:
+            await self.ledger.flush()
         return await self.user_balance_repo.get_rankings(server_id, limit)
 
+    async def _load_leaderboard(self, server_id: int) -> Optional[List[Tuple[int, int]]]:
+        # 원장에 쌓인 변경분을 먼저 반영해야 DB 스캔 결과가 메모리 잔액과 맞는다
+        if self.ledger:
+            await self.ledger.flush()
+        return await self.user_balance_repo.get_all_balances(server_id)
+
     async def get_cached_rankings(
         self, server_id: int, bot, limit: int = 10
     ) -> List[Tuple[int, str, int]]:
-        current_time = time.time()
-
-        if (
-            server_id in self._rankings_cache
-            and server_id in self._rankings_cache_time
-            and current_time - self._rankings_cache_time[server_id]
-            < self.CACHE_EXPIRATION
-        ):
-            return self._rankings_cache[server_id][:limit]
-
-        rankings = await self.get_rankings(server_id, limit)
-        result = []
+        # 같은 서버의 재계산은 하나로 합쳐지고, 캐시에는 항상 전체 목록이 들어간다
+        rankings = await self._rankings_cache.get_or_load(
+            server_id, lambda: self._build_rankings(server_id, bot)
+        )
+        return rankings[:limit]
+
+    async def _build_rankings(self, server_id: int, bot) -> List[Tuple[int, str, int]]:
+        rankings = await self.get_rankings(server_id, RANKING_DEPTH)
+        names = await self._resolve_names(
+            server_id, bot, [user_id for user_id, _ in rankings]
+        )
+        return [(user_id, names[user_id], balance) for user_id, balance in rankings]
+
+    async def get_rank_info(
+        self, server_id: int, user_id: int, bot, radius: int = 2
+    ) -> Optional[Dict]:
+        """내 순위, 상위 몇 %인지, 위아래 radius 명. 순위표를 만들 수 없으면 None."""
+        board = await self.leaderboards.get(server_id)
+        if board is None:
+            return None
+        if user_id not in board:
+            # 잔액 행이 없던 유저는 조회하면서 0원으로 생성되고 순위표에도 들어간다
+            await self.get_balance(user_id, server_id)
+
+        rank = board.rank(user_id)
+        neighbors = board.around(user_id, radius)
+        names = await self._resolve_names(
+            server_id, bot, [neighbor_id for _, neighbor_id, _ in neighbors]
+        )
+        return {
+            "rank": rank,
+            "total": len(board),
+            "balance": board.balance(user_id),
+            "percentile": rank / len(board) * 100,
+            "neighbors": [
+                (neighbor_rank, neighbor_id, names[neighbor_id], balance)
+                for neighbor_rank, neighbor_id, balance in neighbors
+            ],
+        }
+
+    async def _resolve_names(
+        self, server_id: int, bot, user_ids: List[int]
+    ) -> Dict[int, str]:
+        guild = bot.get_guild(server_id)
+
+        names: Dict[int, str] = {}
+        missing = []
+        for user_id in user_ids:
+            user = (guild.get_member(user_id) if guild else None) or bot.get_user(user_id)
+            if user is not None:
+                names[user_id] = user.name
+            else:
+                missing.append(user_id)
 
-        for user_id, balance in rankings:
-            try:
-                user = await bot.fetch_user(user_id)
-                username = user.name
-            except Exception:
-                username = f"누구세요({user_id})"
+        if missing:
+            semaphore = asyncio.Semaphore(RANKING_FETCH_CONCURRENCY)
 
-            result.append((user_id, username, balance))
+            async def fetch(user_id: int) -> None:
+                async with semaphore:
+                    try:
+                        names[user_id] = (await bot.fetch_user(user_id)).name
+                    except Exception:
+                        pass
 
-        self._rankings_cache[server_id] = result
-        self._rankings_cache_time[server_id] = current_time
+            await asyncio.gather(*(fetch(user_id) for user_id in missing))
+            logger.debug(
+                f"랭킹 이름 조회 (서버 {server_id}): 캐시 {len(user_ids) - len(missing)}명, "
+                f"API {len(missing)}명"
+            )
 
-        return result[:limit]
+        for user_id in missing:
+            names.setdefault(user_id, f"누구세요({user_id})")
+        return names
 
     def calculate_hand_value(self, cards: List[str]) -> int:
-        value = 0
-        aces = 0
-
-        for card in cards:
-            if card in ["J", "Q", "K"]:
-                value += 10
-            elif card == "A":
-                aces += 1
-                value += 11
-            else:
-                value += int(card)
-
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-
-        return value
+        return GamblingEngine.calculate_hand_value(cards)
 
     def calculate_baccarat_value(self, cards: List[str]) -> int:
-        value = 0
-
-        for card in cards:
-            if card in ["J", "Q", "K", "10"]:
-                value += 0
-            elif card == "A":
-                value += 1
-            else:
-                value += int(card)
-
-        return value % 10
+        return GamblingEngine.calculate_baccarat_value(cards)
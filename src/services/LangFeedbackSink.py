@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from src.config.settings.Base import BaseConfig
+from src.repositories.LangFeedbackRepository import LangFeedbackRepository
+
+logger = logging.getLogger(__name__)
+
+# 한 건씩 다시 저장할 때 이만큼 연달아 실패하면 그만둔다
+ROW_RETRY_FAILURE_LIMIT = 3
+
+COLUMNS = (
+    "guild_id",
+    "channel_id",
+    "user_id",
+    "user_message",
+    "llm_raw_response",
+    "parsed_action",
+    "tool_name",
+    "tool_args",
+    "tool_success",
+    "tool_error",
+    "result_type",
+    "signal",
+    "signal_detail",
+    "label",
+    "correct_response",
+)
+
+
+class LangFeedbackSink:
+    """lang_feedback 행을 메시지 처리 경로 밖에서 모아 저장하는 백그라운드 writer.
+
+    submit 은 큐에 넣기만 하고 바로 반환한다. 큐가 가득 차면 행을 버리고 dropped 를 센다.
+    워커는 batch_size 개가 모이거나 flush_interval 이 지나면 한 번의 INSERT 로 저장한다.
+    """
+
+    _instance = None
+
+    def __init__(
+        self,
+        repo: Optional[LangFeedbackRepository] = None,
+        maxsize: int = BaseConfig.LANG_FEEDBACK_QUEUE_SIZE,
+        batch_size: int = BaseConfig.LANG_FEEDBACK_BATCH_SIZE,
+        flush_interval: float = BaseConfig.LANG_FEEDBACK_FLUSH_INTERVAL,
+    ):
+        self.repo = repo or LangFeedbackRepository()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.counters: Counter = Counter()
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._batch: List[Dict[str, Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._closed = False
+
+    @classmethod
+    def instance(cls) -> "LangFeedbackSink":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, **fields) -> bool:
+        if self._closed:
+            self.counters["dropped"] += 1
+            return False
+
+        row = {column: fields.get(column) for column in COLUMNS}
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.counters["dropped"] += 1
+            if self.counters["dropped"] % 100 == 1:
+                logger.warning(
+                    f"피드백 큐가 가득 차 행을 버립니다 (누적 {self.counters['dropped']}건)"
+                )
+            return False
+
+        self.counters["submitted"] += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return True
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._inflight:
+            await self._inflight
+
+        rows, self._batch = self._batch, []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        for i in range(0, len(rows), self.batch_size):
+            await self._write(rows[i : i + self.batch_size])
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counters, "pending": self._queue.qsize() + len(self._batch)}
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            batch, self._batch = self._batch, []
+            # 종료 중 취소되더라도 이미 시작한 INSERT 는 끝까지 기다린다
+            self._inflight = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._inflight)
+            self._inflight = None
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            await self.repo.add_many(batch)
+            self.counters["written"] += len(batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                self.counters["failed"] += 1
+                logger.warning(f"피드백 1건 저장 실패: {e}")
+                return
+            logger.warning(f"피드백 {len(batch)}건 일괄 저장 실패, 한 건씩 다시 저장합니다: {e}")
+
+        # 잘못된 행 하나 때문에 배치 전체를 버리지 않도록 한 건씩 넣는다.
+        # 연달아 실패하면 DB 자체의 문제로 보고 나머지는 버린다
+        failures = 0
+        for i, row in enumerate(batch):
+            try:
+                await self.repo.add_many([row])
+                self.counters["written"] += 1
+                failures = 0
+            except Exception as e:
+                self.counters["failed"] += 1
+                failures += 1
+                logger.warning(f"피드백 1건 저장 실패: {e}")
+                if failures >= ROW_RETRY_FAILURE_LIMIT:
+                    rest = len(batch) - i - 1
+                    self.counters["failed"] += rest
+                    logger.warning(f"피드백 저장이 {failures}번 연달아 실패해 나머지 {rest}건을 버립니다")
+                    return
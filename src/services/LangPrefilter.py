@@ -0,0 +1,107 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+
+from src.utils.text.messageNormalizer import normalize_message
+
+# 도구/봇 호출로 거의 확실한 표현은 모델 점수와 관계없이 LLM으로 보낸다
+TOOL_KEYWORDS = re.compile(
+    r"급식|아침|점심|저녁|석식|중식|조식|밥|메뉴|수온|한강|몇\s?시|시간|노래|음악|"
+    r"추천|기상\s?음악|플러딩|봇|jee6|상태|뭐\s?할\s?수|자살|자해|죽고\s?싶"
+)
+# 자모/숫자/기호/공백만으로 된 메시지 ("ㅋㅋㅋ", "ㄹㅇ", "?!", "ㅠㅠ")
+CHATTER = re.compile(r"^[\sㄱ-ㅎㅏ-ㅣᄀ-ᇿ0-9\W_]*$")
+
+NGRAM_SIZES = (2, 3)
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    padded = f" {text} "
+    for n in NGRAM_SIZES:
+        for i in range(len(padded) - n + 1):
+            yield padded[i : i + n]
+
+
+class LangPrefilter:
+    """LLM 앞단의 가벼운 1차 분류기.
+
+    lang_feedback 에서 도구/응답으로 처리된 메시지와 무시된 메시지의 문자 n-gram 으로
+    나이브 베이즈 점수를 계산한다. 학습 데이터가 부족하면 키워드와 잡담 패턴만 사용한다.
+    """
+
+    def __init__(self, threshold: float = 0.2, min_samples: int = 50):
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self._log_ratio: Dict[str, float] = {}
+        self._default_ratio = 0.0
+        self._prior = 0.0
+        self._trained = False
+        self.counters: Counter = Counter()
+
+    @property
+    def trained(self) -> bool:
+        return self._trained
+
+    def train(self, samples: Iterable[Tuple[str, bool]]) -> int:
+        positive: Counter = Counter()
+        negative: Counter = Counter()
+        pos_docs = neg_docs = 0
+
+        for text, is_request in samples:
+            grams = set(_ngrams(normalize_message(text)))
+            if is_request:
+                positive.update(grams)
+                pos_docs += 1
+            else:
+                negative.update(grams)
+                neg_docs += 1
+
+        if min(pos_docs, neg_docs) < self.min_samples:
+            self._trained = False
+            return pos_docs + neg_docs
+
+        vocab = len(set(positive) | set(negative))
+        pos_total = sum(positive.values()) + vocab
+        neg_total = sum(negative.values()) + vocab
+        self._log_ratio = {
+            gram: math.log((positive[gram] + 1) / pos_total)
+            - math.log((negative[gram] + 1) / neg_total)
+            for gram in set(positive) | set(negative)
+        }
+        self._default_ratio = math.log(neg_total / pos_total)
+        self._prior = math.log(pos_docs / neg_docs)
+        self._trained = True
+        return pos_docs + neg_docs
+
+    def score(self, text: str) -> float:
+        grams = list(_ngrams(normalize_message(text)))
+        if not grams:
+            return 0.0
+        # n-gram 들이 서로 독립이 아니므로 합 대신 평균을 써서 과신을 줄인다
+        mean = sum(self._log_ratio.get(g, self._default_ratio) for g in grams) / len(grams)
+        logit = self._prior + mean * math.sqrt(len(grams))
+        return 1 / (1 + math.exp(-max(-30.0, min(30.0, logit))))
+
+    def classify(self, text: str) -> Tuple[bool, str]:
+        self.counters["received"] += 1
+        normalized = normalize_message(text)
+
+        if TOOL_KEYWORDS.search(normalized):
+            stage = "keyword"
+            forward = True
+        elif CHATTER.match(normalized):
+            stage = "chatter"
+            forward = False
+        elif not self._trained:
+            stage = "untrained"
+            forward = True
+        else:
+            forward = self.score(text) >= self.threshold
+            stage = "model"
+
+        self.counters[f"{stage}_{'forward' if forward else 'drop'}"] += 1
+        return forward, stage
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.counters)
@@ -1,11 +1,20 @@
+import asyncio
 import json
 import logging
 import re
+import time
+from collections import Counter
 from datetime import datetime
+from typing import Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from src.config.settings.Base import BaseConfig
 from src.clients.ApiGatewayClient import ApiGatewayClient
+from src.repositories.LangFeedbackRepository import LangFeedbackRepository
+from src.services.LangFeedbackSink import LangFeedbackSink
+from src.services.LangPrefilter import LangPrefilter
+from src.utils.cache.ttlCache import TTLCache
+from src.utils.text.messageNormalizer import normalize_message
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +120,14 @@ SYSTEM_PROMPT = f"""너는 디스코드 봇 JEE6이야.
 {FEW_SHOT_EXAMPLES}"""
 
 
+class _UnparsedRoute(Exception):
+    """LLM 응답에서 JSON 을 읽지 못했을 때. 라우팅 캐시에 남지 않도록 예외로 넘긴다."""
+
+    def __init__(self, raw: str):
+        super().__init__(raw[:200])
+        self.raw = raw
+
+
 class LangService:
     def __init__(self):
         self.llm = ChatOpenAI(
@@ -123,12 +140,54 @@ class LangService:
 
         self.api = ApiGatewayClient()
 
+        self.feedback_repo = LangFeedbackRepository()
+        self.prefilter = LangPrefilter(
+            threshold=BaseConfig.LANG_PREFILTER_THRESHOLD,
+            min_samples=BaseConfig.LANG_PREFILTER_MIN_SAMPLES,
+        )
+        self._prefilter_trained_at = None
+        self._prefilter_task = None
+        self.counters: Counter = Counter()
+        self.route_cache: TTLCache[tuple] = TTLCache(
+            maxsize=BaseConfig.LANG_ROUTE_CACHE_SIZE,
+            ttl=BaseConfig.LANG_ROUTE_CACHE_TTL,
+            name="lang.route",
+        )
+
         self._gambling_service = None
         self._flooding_api_service = None
         self._flooding_auth_service = None
 
         logger.info(f"LangService 초기화: vLLM {BaseConfig.VLLM_BASE_URL}")
 
+    def stats(self) -> dict:
+        return {
+            "prefilter": self.prefilter.stats(),
+            "llm": dict(self.counters),
+            "route_cache": self.route_cache.stats(),
+            "feedback": LangFeedbackSink.instance().stats(),
+        }
+
+    def _schedule_prefilter_training(self):
+        now = time.monotonic()
+        if (
+            self._prefilter_trained_at is not None
+            and now - self._prefilter_trained_at < BaseConfig.LANG_PREFILTER_RETRAIN_INTERVAL
+        ):
+            return
+        if self._prefilter_task and not self._prefilter_task.done():
+            return
+        self._prefilter_trained_at = now
+        self._prefilter_task = asyncio.create_task(self._train_prefilter())
+
+    async def _train_prefilter(self):
+        samples = await self.feedback_repo.get_routing_samples()
+        count = self.prefilter.train(samples)
+        if self.prefilter.trained:
+            logger.info(f"자연어 1차 분류기 학습 완료 (샘플 {count}개)")
+        else:
+            logger.info(f"자연어 1차 분류기 학습 데이터 부족 (샘플 {count}개) - 키워드만 사용")
+
     def set_gambling_service(self, gambling_service):
         self._gambling_service = gambling_service
 
@@ -136,19 +195,19 @@ class LangService:
         self._flooding_api_service = api_service
         self._flooding_auth_service = auth_service
 
-    def _parse_llm_response(self, text: str) -> dict:
+    def _parse_llm_response(self, text: str) -> Optional[dict]:
         text = text.strip()
 
         json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text)
         if not json_match:
             logger.warning(f"JSON 파싱 실패, 원문: {text[:200]}")
-            return {"ignore": True}
+            return None
 
         try:
             return json.loads(json_match.group())
         except json.JSONDecodeError:
             logger.warning(f"JSON 디코딩 실패: {json_match.group()[:200]}")
-            return {"ignore": True}
+            return None
 
     async def _execute_tool(self, tool_name: str, tool_args: dict, context: dict = None) -> dict:
         try:
@@ -336,19 +395,17 @@ class LangService:
     def _save_feedback(self, context: dict, user_message: str,
                        llm_raw: str, parsed: dict, result: dict = None,
                        tool_error: str = None, signal: str = None,
-                       signal_detail: str = None):
+                       signal_detail: str = None, action: str = None):
         try:
-            from src.infrastructure.database.session import get_db_session
-            from src.domain.models.LangFeedback import LangFeedback
-
-            if parsed.get("ignore"):
-                action = "ignore"
-            elif "reply" in parsed:
-                action = "reply"
-            elif "tool" in parsed:
-                action = "tool"
-            else:
-                action = "parse_error"
+            if action is None:
+                if parsed.get("ignore"):
+                    action = "ignore"
+                elif "reply" in parsed:
+                    action = "reply"
+                elif "tool" in parsed:
+                    action = "tool"
+                else:
+                    action = "parse_error"
 
             tool_name = parsed.get("tool")
             tool_args_str = json.dumps(parsed.get("args", {}), ensure_ascii=False) if tool_name else None
@@ -361,7 +418,7 @@ class LangService:
             elif tool_error:
                 tool_success = False
 
-            feedback = LangFeedback(
+            LangFeedbackSink.instance().submit(
                 guild_id=context.get("server_id", 0),
                 channel_id=context.get("channel_id", 0),
                 user_id=context.get("user_id", 0),
@@ -377,9 +434,6 @@ class LangService:
                 signal_detail=signal_detail,
             )
 
-            with get_db_session() as db:
-                db.add(feedback)
-
         except Exception as e:
             logger.warning(f"피드백 저장 실패: {e}")
 
@@ -387,44 +441,82 @@ class LangService:
         llm_raw = None
         parsed = {}
 
-        try:
-            messages = [
-                SystemMessage(content=SYSTEM_PROMPT),
-                HumanMessage(content=user_message),
-            ]
+        if BaseConfig.LANG_PREFILTER_ENABLED:
+            self._schedule_prefilter_training()
+            forward, stage = self.prefilter.classify(user_message)
+            if not forward:
+                self._save_feedback(
+                    context or {}, user_message, None, {"ignore": True},
+                    signal_detail=stage, action="prefiltered",
+                )
+                return None
 
-            response = await self.llm.ainvoke(messages)
-            llm_raw = response.content
-            parsed = self._parse_llm_response(llm_raw)
+        signal = None
+
+        try:
+            llm_raw, parsed, cached = await self._route(user_message)
+            if cached:
+                self.counters["route_cache_hit"] += 1
+                signal = "cache_hit"
 
             if parsed.get("ignore"):
-                self._save_feedback(context or {}, user_message, llm_raw, parsed)
+                self.counters["llm_ignore"] += 1
+                self._save_feedback(context or {}, user_message, llm_raw, parsed, signal=signal)
                 return None
 
             if "reply" in parsed:
+                self.counters["llm_reply"] += 1
                 result = {"type": "text", "content": parsed["reply"]}
-                self._save_feedback(context or {}, user_message, llm_raw, parsed, result)
+                self._save_feedback(context or {}, user_message, llm_raw, parsed, result, signal=signal)
                 return result
 
             if "tool" in parsed:
+                self.counters["llm_tool"] += 1
                 tool_name = parsed["tool"]
                 tool_args = parsed.get("args", {})
                 try:
                     result = await self._execute_tool(tool_name, tool_args, context)
-                    self._save_feedback(context or {}, user_message, llm_raw, parsed, result)
+                    self._save_feedback(context or {}, user_message, llm_raw, parsed, result, signal=signal)
                     return result
                 except Exception as e:
-                    self._save_feedback(context or {}, user_message, llm_raw, parsed, tool_error=str(e))
+                    self._save_feedback(context or {}, user_message, llm_raw, parsed, tool_error=str(e), signal=signal)
                     raise
 
-            self._save_feedback(context or {}, user_message, llm_raw, parsed)
+            self._save_feedback(context or {}, user_message, llm_raw, parsed, signal=signal)
             return None
 
         except Exception as e:
             logger.error(f"LangService 처리 중 오류: {e}", exc_info=True)
-            self._save_feedback(context or {}, user_message, llm_raw, parsed, tool_error=str(e))
+            self._save_feedback(context or {}, user_message, llm_raw, parsed, tool_error=str(e), signal=signal)
             return {"type": "error", "message": f"처리 중 오류가 발생했습니다: {e}"}
 
+    async def _route(self, user_message: str) -> tuple:
+        loaded = False
+
+        async def _invoke():
+            nonlocal loaded
+            loaded = True
+            self.counters["llm_calls"] += 1
+            messages = [
+                SystemMessage(content=SYSTEM_PROMPT),
+                HumanMessage(content=user_message),
+            ]
+            response = await self.llm.ainvoke(messages)
+            parsed = self._parse_llm_response(response.content)
+            if parsed is None:
+                self.counters["llm_parse_errors"] += 1
+                raise _UnparsedRoute(response.content)
+            return response.content, parsed
+
+        try:
+            llm_raw, parsed = await self.route_cache.get_or_load(
+                normalize_message(user_message), _invoke
+            )
+        except _UnparsedRoute as e:
+            # 형식이 깨진 응답은 캐시하지 않고 이번 한 번만 무시한다
+            return e.raw, {"ignore": True}, False
+        return llm_raw, parsed, not loaded
+
     async def ask_question(self, question: str) -> str:
         try:
             messages = [
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+
+logger = logging.getLogger(__name__)
+
+
+class Leaderboard:
+    """한 서버의 잔액 순위표.
+
+    (-잔액, user_id) 순으로 정렬해 두므로 잔액이 바뀌면 그 항목 하나만 옮기면 되고,
+    순위 조회와 갱신은 O(log n), 상위 n명은 O(n) 이다.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[int, int]] = ()):
+        self._balances: Dict[int, int] = dict(rows)
+        self._order = SortedList(
+            (-balance, user_id) for user_id, balance in self._balances.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._balances)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._balances
+
+    def balance(self, user_id: int) -> Optional[int]:
+        return self._balances.get(user_id)
+
+    def update(self, user_id: int, balance: int) -> None:
+        old = self._balances.get(user_id)
+        if old == balance:
+            return
+        if old is not None:
+            self._order.remove((-old, user_id))
+        self._balances[user_id] = balance
+        self._order.add((-balance, user_id))
+
+    def remove(self, user_id: int) -> None:
+        old = self._balances.pop(user_id, None)
+        if old is not None:
+            self._order.remove((-old, user_id))
+
+    def rank(self, user_id: int) -> Optional[int]:
+        """1부터 시작하는 순위. 같은 잔액은 전체 랭킹 목록과 같은 순서(user_id 오름차순)로 센다."""
+        balance = self._balances.get(user_id)
+        if balance is None:
+            return None
+        return self._order.bisect_left((-balance, user_id)) + 1
+
+    def top(self, limit: int) -> List[Tuple[int, int]]:
+        return [(user_id, -neg) for neg, user_id in self._order.islice(0, limit)]
+
+    def around(self, user_id: int, radius: int) -> List[Tuple[int, int, int]]:
+        """user_id 의 위아래 radius 명을 (순위, user_id, 잔액) 으로. O(log n + radius)."""
+        rank = self.rank(user_id)
+        if rank is None:
+            return []
+        start = max(0, rank - 1 - radius)
+        return [
+            (start + offset + 1, neighbor_id, -neg)
+            for offset, (neg, neighbor_id) in enumerate(
+                self._order.islice(start, rank + radius)
+            )
+        ]
+
+
+class LeaderboardIndex:
+    """서버별 Leaderboard 를 처음 요청될 때 DB 한 번 훑어서 만들고, 이후로는 update 로만 유지한다.
+
+    만드는 도중 들어온 update 는 모아 두었다가 DB 결과 위에 덮어쓴다.
+    """
+
+    def __init__(self, load: Callable[[int], Awaitable[Optional[List[Tuple[int, int]]]]]):
+        self._load = load
+        self._boards: Dict[int, Leaderboard] = {}
+        self._pending: Dict[int, Dict[int, int]] = {}
+        self._loading: Dict[int, asyncio.Future] = {}
+
+    def loaded(self, server_id: int) -> bool:
+        return server_id in self._boards
+
+    async def get(self, server_id: int) -> Optional[Leaderboard]:
+        """순위표를 돌려준다. DB 를 읽지 못하면 None (캐시하지 않고 다음 요청에서 다시 시도)."""
+        board = self._boards.get(server_id)
+        if board is not None:
+            return board
+
+        loading = self._loading.get(server_id)
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[server_id] = future
+        self._pending[server_id] = {}
+        board = None
+        try:
+            rows = await self._load(server_id)
+            if rows is not None:
+                board = Leaderboard(rows)
+                for user_id, balance in self._pending[server_id].items():
+                    board.update(user_id, balance)
+                self._boards[server_id] = board
+                logger.info(f"랭킹 인덱스 생성 (서버 {server_id}): {len(board)}명")
+        finally:
+            del self._pending[server_id]
+            del self._loading[server_id]
+            future.set_result(board)
+        return board
+
+    def update(self, server_id: int, user_id: int, balance: int) -> None:
+        board = self._boards.get(server_id)
+        if board is not None:
+            board.update(user_id, balance)
+        elif server_id in self._pending:
+            self._pending[server_id][user_id] = balance
+
+    def invalidate(self, server_id: int) -> None:
+        self._boards.pop(server_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "servers": len(self._boards),
+            "entries": sum(len(board) for board in self._boards.values()),
+        }
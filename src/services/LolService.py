@@ -1,9 +1,9 @@
 import logging
 import aiohttp
 import asyncio
-import requests
-import time
 from typing import Dict, List, Tuple, Optional
+from src.services.ChampionDataStore import ChampionDataStore
+from src.utils.cache.ttlCache import TTLCache
 from src.config.settings.riotSettings import (
     LOL_BASE_URL,
     LOL_ASIA_URL,
@@ -15,58 +15,42 @@ logger = logging.getLogger(__name__)
 
 
 class LolService:
+    account_cache: TTLCache[Dict] = TTLCache(
+        maxsize=2048, ttl=600, name="lol.account", negative_ttl=60
+    )
+    tier_cache: TTLCache[Tuple[Optional[Dict], str]] = TTLCache(
+        maxsize=2048, ttl=600, name="lol.tier"
+    )
+    match_cache: TTLCache[Dict] = TTLCache(maxsize=1024, ttl=600, name="lol.match")
+    rotation_cache: TTLCache[List[Dict]] = TTLCache(
+        maxsize=1, ttl=3600, name="lol.rotation"
+    )
+
     def __init__(self):
         self.headers = RIOT_HEADERS
         self.base_url = LOL_BASE_URL
         self.asia_url = LOL_ASIA_URL
-        self.champions_data = self._get_champion_data()
+        self.champions = ChampionDataStore.instance()
         self.game_mode_kr = LOL_GAME_MODES
-        self.account_cache = {}
-        self.tier_cache = {}
-        self.match_cache = {}
-        self.rotation_cache = None
-        self.rotation_cache_time = 0.0
-        self.cache_timeout = 600
-        self.rotation_cache_timeout = 3600
-
-    def _get_champion_data(self) -> Dict:
-        try:
-            ddragon_version_url = (
-                "https://ddragon.leagueoflegends.com/api/versions.json"
-            )
-            version_response = requests.get(ddragon_version_url)
-            latest_version = version_response.json()[0]
-            champions_url = f"http://ddragon.leagueoflegends.com/cdn/{latest_version}/data/ko_KR/champion.json"
-            champions_response = requests.get(champions_url)
-            logger.info(f"롤 챔피언 데이터 로드 완료 (버전: {latest_version})")
-            return champions_response.json()
-        except Exception as e:
-            logger.error(f"롤 챔피언 데이터 로드 실패: {e}")
-            return {"data": {}}
 
     def _get_champion_name_kr(self, champion_id: str) -> str:
-        return next(
-            (
-                champ_info["name"]
-                for champ_name, champ_info in self.champions_data["data"].items()
-                if champ_name == champion_id
-            ),
-            champion_id,
-        )
+        return self.champions.kr_name(champion_id)
 
     async def get_account_info(
         self, session: aiohttp.ClientSession, riot_id: str
     ) -> Dict:
         logger.info(f"롤 계정 정보 요청: {riot_id}")
-        if riot_id in self.account_cache:
-            cache_time, cached_data = self.account_cache[riot_id]
-            if time.time() - cache_time < self.cache_timeout:
-                logger.debug(f"롤 계정 정보 캐시 사용: {riot_id}")
-                return cached_data
         if "#" not in riot_id:
             error_msg = "닉넴#태그 형식으로 입력하세요"
             logger.warning(f"잘못된 라이엇 ID 형식: {riot_id}, {error_msg}")
             raise ValueError(error_msg)
+        return await self.account_cache.get_or_load(
+            riot_id, lambda: self._fetch_account(session, riot_id)
+        )
+
+    async def _fetch_account(
+        self, session: aiohttp.ClientSession, riot_id: str
+    ) -> Dict:
         game_name, tag_line = riot_id.split("#")
         account_url = f"{self.asia_url}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
         try:
@@ -78,7 +62,6 @@ class LolService:
                     logger.warning(f"계정 정보 요청 실패: {error_msg}")
                     raise ValueError(error_msg)
                 account_data = await response.json()
-                self.account_cache[riot_id] = (time.time(), account_data)
                 logger.debug(f"계정 정보 요청 성공: {game_name}#{tag_line}")
                 return account_data
         except aiohttp.ClientError as e:
@@ -89,11 +72,10 @@ class LolService:
         self, session: aiohttp.ClientSession, puuid: str
     ) -> Tuple[Optional[Dict], str]:
         logger.info(f"롤 티어 정보 요청: {puuid}")
-        if puuid in self.tier_cache:
-            cache_time, cached_data = self.tier_cache[puuid]
-            if time.time() - cache_time < self.cache_timeout:
-                logger.debug(f"티어 정보 캐시 사용: {puuid}")
-                return cached_data
+        cached_data = self.tier_cache.get(puuid)
+        if cached_data is not None:
+            logger.debug(f"티어 정보 캐시 사용: {puuid}")
+            return cached_data
         try:
             summoner_url = f"{self.base_url}/lol/summoner/v4/summoners/by-puuid/{puuid}"
             async with session.get(summoner_url, headers=self.headers) as response:
@@ -120,7 +102,7 @@ class LolService:
                 )
                 if solo_rank:
                     tier = solo_rank["tier"]
-            self.tier_cache[puuid] = (time.time(), (solo_rank, tier))
+            self.tier_cache.set(puuid, (solo_rank, tier))
             return solo_rank, tier
         except Exception as e:
             logger.error(f"티어 정보 요청 중 오류: {e}")
@@ -140,22 +122,8 @@ class LolService:
             if not match_ids:
                 logger.warning(f"최근 게임 기록 없음: {puuid}")
                 raise ValueError("최근 게임 기록이 없습니다.")
-            tasks = []
-            for match_id in match_ids:
-                if match_id in self.match_cache:
-                    cache_time, data = self.match_cache[match_id]
-                    if time.time() - cache_time < self.cache_timeout:
-                        logger.debug(f"매치 정보 캐시 사용: {match_id}")
-                        tasks.append(asyncio.create_task(asyncio.sleep(0, result=data)))
-                        continue
-                url = f"{self.asia_url}/lol/match/v5/matches/{match_id}"
-                tasks.append(self._fetch_match_data(session, url, match_id))
-            match_data_list = await asyncio.gather(*tasks, return_exceptions=True)
-            match_data_list = [
-                data
-                for data in match_data_list
-                if data is not None and not isinstance(data, Exception)
-            ]
+            match_data_list = await self._fetch_matches(session, match_ids)
+            await self.champions.ensure_loaded()
             if not match_data_list:
                 logger.warning(f"유효한 매치 정보 없음: {puuid}")
                 raise ValueError("최근 게임 기록을 가져올 수 없습니다.")
@@ -186,12 +154,31 @@ class LolService:
             logger.error(f"전적 정보 요청 중 오류: {e}")
             raise ValueError(f"전적 정보를 가져오는 중 오류가 발생했습니다: {e}")
 
+    async def _fetch_matches(
+        self, session: aiohttp.ClientSession, match_ids: List[str]
+    ) -> List[Dict]:
+        tasks = []
+        for match_id in match_ids:
+            data = self.match_cache.get(match_id)
+            if data is not None:
+                logger.debug(f"매치 정보 캐시 사용: {match_id}")
+                tasks.append(asyncio.sleep(0, result=data))
+                continue
+            url = f"{self.asia_url}/lol/match/v5/matches/{match_id}"
+            tasks.append(self._fetch_match_data(session, url, match_id))
+        match_data_list = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            data
+            for data in match_data_list
+            if data is not None and not isinstance(data, Exception)
+        ]
+
     async def _fetch_match_data(self, session, url, match_id):
         try:
             async with session.get(url, headers=self.headers) as response:
                 if response.status == 200:
                     data = await response.json()
-                    self.match_cache[match_id] = (time.time(), data)
+                    self.match_cache.set(match_id, data)
                     return data
                 logger.warning(
                     f"매치 정보 요청 실패: {match_id}, 상태 코드: {response.status}"
@@ -203,9 +190,11 @@ class LolService:
 
     async def get_rotation(self, session: aiohttp.ClientSession) -> List[Dict]:
         logger.info("롤 로테이션 정보 요청")
-        if self.rotation_cache is not None and time.time() - self.rotation_cache_time < self.rotation_cache_timeout:
-            logger.debug("롤 로테이션 캐시 사용")
-            return self.rotation_cache
+        return await self.rotation_cache.get_or_load(
+            "rotation", lambda: self._fetch_rotation(session)
+        )
+
+    async def _fetch_rotation(self, session: aiohttp.ClientSession) -> List[Dict]:
         try:
             rotation_url = f"{self.base_url}/lol/platform/v3/champion-rotations"
             async with session.get(rotation_url, headers=self.headers) as response:
@@ -213,16 +202,12 @@ class LolService:
                     logger.warning(f"로테이션 정보 요청 실패: {response.status}")
                     raise ValueError("로테이션 정보를 가져올 수 없습니다.")
                 rotation_data = await response.json()
+            await self.champions.ensure_loaded()
             champion_info = []
             for champ_id in rotation_data["freeChampionIds"]:
-                for champ_name, champ_info in self.champions_data["data"].items():
-                    if int(champ_info["key"]) == champ_id:
-                        champion_info.append(
-                            {"kr_name": champ_info["name"], "en_name": champ_name}
-                        )
-                        break
-            self.rotation_cache = champion_info
-            self.rotation_cache_time = time.time()
+                names = self.champions.by_key(champ_id)
+                if names:
+                    champion_info.append({"kr_name": names[0], "en_name": names[1]})
             return champion_info
         except Exception as e:
             logger.error(f"로테이션 정보 요청 중 오류: {e}")
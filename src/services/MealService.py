@@ -2,9 +2,8 @@ import json
 import logging
 import asyncio
 import aiohttp
-import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple
 from sqlalchemy import select
 from src.config.settings.mealSettings import (
     MEAL_API_KEY,
@@ -15,6 +14,7 @@ from src.config.settings.mealSettings import (
 )
 from src.infrastructure.database.session import get_db_session
 from src.domain.models.Meal import Meal
+from src.utils.cache.ttlCache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +23,7 @@ CACHE_TTL = 3600
 
 
 class MealService:
-    _meal_cache: Dict[str, List] = {}
-    _meal_cache_time: Dict[str, float] = {}
+    _meal_cache: TTLCache[List] = TTLCache(maxsize=64, ttl=CACHE_TTL, name="meal")
 
     base_url = "https://open.neis.go.kr/hub/mealServiceDietInfo"
     params = {
@@ -48,12 +47,10 @@ class MealService:
             await MealService._session.close()
 
     async def get_meal_info(self, date: str) -> Optional[List]:
-        if (
-            date in MealService._meal_cache
-            and time.time() - MealService._meal_cache_time[date] < CACHE_TTL
-        ):
+        cached = MealService._meal_cache.get(date)
+        if cached is not None:
             logger.debug(f"메모리 캐시 hit for {date}")
-            return MealService._meal_cache[date]
+            return cached
 
         try:
             with get_db_session() as session:
@@ -69,8 +66,7 @@ class MealService:
                         }
                         for row in result
                     ]
-                    MealService._meal_cache[date] = meals
-                    MealService._meal_cache_time[date] = time.time()
+                    MealService._meal_cache.set(date, meals)
                     return meals
         except Exception as e:
             logger.error(f"DB Error: {e}")
@@ -146,8 +142,7 @@ class MealService:
                     for m in all_meals if m["MLSV_YMD"] == target_date
                 ]
                 if target_meals:
-                    MealService._meal_cache[target_date] = target_meals
-                    MealService._meal_cache_time[target_date] = time.time()
+                    MealService._meal_cache.set(target_date, target_meals)
                 return target_meals if target_meals else None
 
             logger.warning(f"No meal info returned for {target_date} (week search)")
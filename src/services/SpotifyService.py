@@ -1,19 +1,23 @@
 import random
 import logging
 import asyncio
-import time
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
 from spotipy.cache_handler import MemoryCacheHandler
 from src.config.settings.Base import BaseConfig
+from src.utils.cache.ttlCache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
 class SpotifyService:
-    _playlist_total_cache: dict[str, tuple[float, int]] = {}
-    _artist_genres_cache: dict[str, tuple[float, list]] = {}
     CACHE_TTL = 3600
+    _playlist_total_cache: TTLCache[int] = TTLCache(
+        maxsize=256, ttl=CACHE_TTL, name="spotify.playlist_total"
+    )
+    _artist_genres_cache: TTLCache[list] = TTLCache(
+        maxsize=2048, ttl=CACHE_TTL, name="spotify.artist_genres"
+    )
 
     def __init__(self):
         self._sp = self._create_client()
@@ -51,19 +55,11 @@ class SpotifyService:
 
     def _fetch_random_track(self, playlist_id: str) -> dict | None:
         try:
-            now = time.time()
-            if playlist_id in SpotifyService._playlist_total_cache:
-                cache_time, cached_total = SpotifyService._playlist_total_cache[playlist_id]
-                if now - cache_time < SpotifyService.CACHE_TTL:
-                    total = cached_total
-                else:
-                    result = self._sp.playlist_tracks(playlist_id, limit=1, fields="total")
-                    total = result["total"]
-                    SpotifyService._playlist_total_cache[playlist_id] = (now, total)
-            else:
+            total = SpotifyService._playlist_total_cache.get(playlist_id)
+            if total is None:
                 result = self._sp.playlist_tracks(playlist_id, limit=1, fields="total")
                 total = result["total"]
-                SpotifyService._playlist_total_cache[playlist_id] = (now, total)
+                SpotifyService._playlist_total_cache.set(playlist_id, total)
 
             if total == 0:
                 return None
@@ -93,18 +89,11 @@ class SpotifyService:
             genres = []
             if track["artists"]:
                 artist_id = track["artists"][0]["id"]
-                if artist_id in SpotifyService._artist_genres_cache:
-                    cache_time, cached_genres = SpotifyService._artist_genres_cache[artist_id]
-                    if time.time() - cache_time < SpotifyService.CACHE_TTL:
-                        genres = cached_genres
-                    else:
-                        artist_info = self._sp.artist(artist_id)
-                        genres = artist_info.get("genres", [])
-                        SpotifyService._artist_genres_cache[artist_id] = (time.time(), genres)
-                else:
+                genres = SpotifyService._artist_genres_cache.get(artist_id)
+                if genres is None:
                     artist_info = self._sp.artist(artist_id)
                     genres = artist_info.get("genres", [])
-                    SpotifyService._artist_genres_cache[artist_id] = (time.time(), genres)
+                    SpotifyService._artist_genres_cache.set(artist_id, genres)
 
             return {
                 "name": track["name"],
@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+_registry: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+
+
+def registered_caches() -> Dict[str, "TTLCache"]:
+    """이름을 붙여 만든 캐시들을 이름순으로 반환한다."""
+    return dict(sorted(_registry.items()))
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class TTLCache(Generic[V]):
+    """TTL + LRU 크기 제한 캐시.
+
+    name 을 주면 registered_caches() 에 등록된다. negative_ttl 을 주면 get_or_load 의
+    loader 가 던진 예외도 그 시간 동안 캐시해서 같은 실패를 반복 요청하지 않는다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        name: Optional[str] = None,
+        negative_ttl: Optional[float] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.negative_ttl = negative_ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # clear() 마다 올린다. 그 전에 시작한 로드는 결과를 캐시에 쓰지 않는다
+        self._generation = 0
+        # 스레드 풀에서 동기 get/set 을 쓰는 서비스도 있다 (SpotifyService)
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.negative_hits = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.load_seconds = 0.0
+
+        if name:
+            _registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        value = self._lookup(key)
+        if value is _MISSING or isinstance(value, _Failure):
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._inflight.clear()
+            self._generation += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        value = self._lookup(key)
+        if isinstance(value, _Failure):
+            self.negative_hits += 1
+            raise value.error
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 먼저 부른 쪽이 취소된 것뿐이면 이 요청이 다시 불러온다
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.get_or_load(key, loader)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        started = time.perf_counter()
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self._record_load(started, error=True)
+            if self.negative_ttl and generation == self._generation:
+                self.set(key, _Failure(e), ttl=self.negative_ttl)
+            future.set_exception(e)
+            # 기다리는 쪽이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            self._record_load(started)
+            if generation == self._generation:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _record_load(self, started: float, error: bool = False) -> None:
+        self.loads += 1
+        self.load_seconds += time.perf_counter() - started
+        if error:
+            self.load_errors += 1
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "negative_hits": self.negative_hits,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            # get_or_load 로 채운 경우만 잰다 (get/set 을 직접 쓰는 캐시는 0)
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "avg_load_ms": self.load_seconds / self.loads * 1000 if self.loads else 0.0,
+            "inflight": len(self._inflight),
+        }
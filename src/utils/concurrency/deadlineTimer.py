@@ -0,0 +1,96 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import List, Optional, Protocol, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Expirable(Protocol):
+    # loop.time() 기준 만료 시각. 연장하려면 값을 늘리기만 하면 된다
+    deadline: float
+
+    @property
+    def finished(self) -> bool:
+        ...
+
+    async def expire(self) -> None:
+        ...
+
+
+class DeadlineTimer:
+    """여러 대상의 만료를 태스크 하나로 처리하는 타이머.
+
+    대상마다 sleep 하는 코루틴을 두지 않고 만료 시각 힙만 유지한다. deadline 이 늘어난 대상은
+    꺼낼 때 다시 넣고, 이미 끝난 대상은 그냥 버린다.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Expirable]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # 루프는 태스크를 약하게만 참조하므로 만료 처리 중인 태스크를 붙잡아 둔다
+        self._expiring: Set[asyncio.Task] = set()
+
+    @classmethod
+    def instance(cls) -> "DeadlineTimer":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, target: Expirable) -> None:
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (target.deadline, next(self._seq), target))
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        elif earliest is None or target.deadline < earliest:
+            self._wakeup.set()
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._expiring:
+            await asyncio.gather(*self._expiring, return_exceptions=True)
+        self._heap.clear()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._heap:
+            deadline, _, target = self._heap[0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            if target.finished:
+                continue
+            if target.deadline > deadline:
+                heapq.heappush(self._heap, (target.deadline, next(self._seq), target))
+                continue
+            task = loop.create_task(self._expire(target))
+            self._expiring.add(task)
+            task.add_done_callback(self._expiring.discard)
+
+    @staticmethod
+    async def _expire(target: Expirable) -> None:
+        try:
+            await target.expire()
+        except Exception as e:
+            logger.error(f"세션 만료 처리 중 오류: {e}", exc_info=True)
@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Priority:
+    # 사용자가 기다리는 명령(!롤, !발로)이 백그라운드 갱신보다 먼저 토큰을 받는다
+    INTERACTIVE = 0
+    BACKGROUND = 10
+
+
+def parse_rate_limits(header: Optional[str]) -> List[Tuple[int, int]]:
+    """라이엇 한도 헤더(예: 20:1,100:120)를 [(20, 1), (100, 120)] 으로 바꾼다."""
+    limits = []
+    for part in (header or "").split(","):
+        count, _, seconds = part.strip().partition(":")
+        if count.isdigit() and seconds.isdigit():
+            limits.append((int(count), int(seconds)))
+    return limits
+
+
+class _Bucket:
+    __slots__ = ("limit", "period", "tokens", "updated")
+
+    def __init__(self, limit: int, period: int, now: float):
+        self.limit = limit
+        self.period = period
+        self.tokens = float(limit)
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        rate = self.limit / self.period
+        self.tokens = min(self.limit, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) * self.period / self.limit
+
+
+class RateLimiter:
+    """라이엇 요청 한도용 토큰 버킷 스케줄러.
+
+    X-App-Rate-Limit 의 각 구간마다 버킷을 두고, 모든 버킷에 토큰이 있을 때만 요청을 내보낸다.
+    대기 중인 요청은 우선순위 → 도착 순서로 깨운다. 429 의 Retry-After 동안은 아무것도 보내지 않는다.
+    """
+
+    def __init__(self, limits: List[Tuple[int, int]]):
+        self._spec = list(limits)
+        now = time.monotonic()
+        self._buckets = [_Bucket(count, seconds, now) for count, seconds in limits]
+        self._blocked_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def acquire(
+        self, priority: int = Priority.INTERACTIVE, timeout: Optional[float] = None
+    ) -> None:
+        """토큰을 받을 때까지 기다린다. timeout 이 지나면 asyncio.TimeoutError 를 던진다."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._pump()
+        # 시간이 지나 취소된 대기자는 _pump 가 건너뛴다
+        await asyncio.wait_for(future, timeout)
+
+    def update(self, headers, status: int) -> None:
+        limits = parse_rate_limits(headers.get("X-App-Rate-Limit"))
+        if limits and limits != self._spec:
+            logger.info(f"라이엇 요청 한도 갱신: {headers.get('X-App-Rate-Limit')}")
+            self._spec = limits
+            now = time.monotonic()
+            self._buckets = [_Bucket(count, seconds, now) for count, seconds in limits]
+
+        # 서버가 센 사용량이 더 많으면 (다른 프로세스와 키를 공유하는 경우 등) 그쪽에 맞춘다
+        counts = dict(
+            (seconds, count)
+            for count, seconds in parse_rate_limits(headers.get("X-App-Rate-Limit-Count"))
+        )
+        for bucket in self._buckets:
+            if bucket.period in counts:
+                bucket.tokens = min(bucket.tokens, bucket.limit - counts[bucket.period])
+
+        if status == 429:
+            retry_after = float(headers.get("Retry-After", 1))
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            logger.warning(
+                f"라이엇 요청 한도 초과 ({headers.get('X-Rate-Limit-Type', 'unknown')}) - "
+                f"{retry_after:.0f}초 대기"
+            )
+
+    def _wait_time(self, now: float) -> float:
+        wait = self._blocked_until - now
+        for bucket in self._buckets:
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time())
+        return wait
+
+    def _pump(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            if self._waiters[0][2].cancelled():
+                heapq.heappop(self._waiters)
+                continue
+
+            now = time.monotonic()
+            wait = self._wait_time(now)
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._pump)
+                return
+
+            _, _, future = heapq.heappop(self._waiters)
+            for bucket in self._buckets:
+                bucket.tokens -= 1
+            future.set_result(None)
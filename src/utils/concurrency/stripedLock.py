@@ -0,0 +1,67 @@
+import asyncio
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List
+
+from src.utils.metrics.latencyTracker import LatencyTracker
+
+HOT_KEYS_LIMIT = 1000
+
+
+class StripedLock:
+    """키를 해시로 고정 개수의 asyncio.Lock 에 나눠 거는 락 관리자.
+
+    키마다 락을 만들지 않으므로 메모리가 stripes 개로 고정된다. 여러 키를 잡을 때는
+    stripe 번호 순서로 잡아서 반대 순서로 잡는 두 작업이 서로 기다리며 멈추지 않게 한다.
+    """
+
+    def __init__(self, stripes: int = 256):
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(stripes)]
+        self.wait_stats = LatencyTracker()
+        self.counters: Counter = Counter()
+        self._contended_keys: Counter = Counter()
+
+    def _stripe(self, key: Hashable) -> int:
+        return hash(key) % len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, *keys: Hashable) -> AsyncIterator[None]:
+        # 같은 stripe 에 걸린 키는 한 번만 잡는다 (asyncio.Lock 은 재진입이 안 된다)
+        stripes = sorted({self._stripe(key) for key in keys})
+        contended = [key for key in keys if self._locks[self._stripe(key)].locked()]
+
+        started = time.perf_counter()
+        acquired = []
+        try:
+            for stripe in stripes:
+                await self._locks[stripe].acquire()
+                acquired.append(stripe)
+            self._record(time.perf_counter() - started, contended)
+            yield
+        finally:
+            for stripe in reversed(acquired):
+                self._locks[stripe].release()
+
+    def _record(self, waited: float, contended: List[Hashable]) -> None:
+        self.counters["acquired"] += 1
+        self.wait_stats.record("wait", waited)
+        if contended:
+            self.counters["contended"] += 1
+            self._contended_keys.update(contended)
+            if len(self._contended_keys) > HOT_KEYS_LIMIT:
+                self._contended_keys = Counter(
+                    dict(self._contended_keys.most_common(HOT_KEYS_LIMIT // 10))
+                )
+
+    def stats(self) -> Dict:
+        acquired = self.counters["acquired"]
+        return {
+            "stripes": len(self._locks),
+            "held": sum(lock.locked() for lock in self._locks),
+            "acquired": acquired,
+            "contended": self.counters["contended"],
+            "contention_ratio": self.counters["contended"] / acquired if acquired else 0.0,
+            "wait": self.wait_stats.snapshot().get("wait", {}),
+            "hot_keys": self._contended_keys.most_common(5),
+        }
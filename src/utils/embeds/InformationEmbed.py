@@ -1,9 +1,12 @@
 import discord
+from typing import Dict, Optional
 
 
 class InformationEmbed:
     @staticmethod
-    def create_info_embed(latency: int, db_status: str) -> discord.Embed:
+    def create_info_embed(
+        latency: int, db_status: str, cache: Optional[Dict[str, float]] = None
+    ) -> discord.Embed:
         embed = discord.Embed(
             title="💬 JEE6",
             description=(
@@ -17,4 +20,9 @@ class InformationEmbed:
             ),
             color=discord.Color.yellow(),
         )
+        if cache and cache["caches"]:
+            embed.description += (
+                f"\n- 캐시: {cache['caches']}개 · 적중률 {cache['hit_ratio']:.0%} · "
+                f"항목 {cache['size']}개"
+            )
         return embed
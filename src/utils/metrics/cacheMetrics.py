@@ -0,0 +1,53 @@
+from typing import Dict, List
+
+from src.utils.cache.ttlCache import registered_caches
+
+# Prometheus 로 내보낼 카운터/게이지 (stats 키, 타입, 설명)
+_PROMETHEUS_FIELDS = (
+    ("size", "gauge", "Entries currently stored"),
+    ("maxsize", "gauge", "Maximum number of entries"),
+    ("inflight", "gauge", "Loads currently in flight"),
+    ("hits", "counter", "Lookups served from the cache"),
+    ("misses", "counter", "Lookups that went to the loader"),
+    ("coalesced", "counter", "Lookups that joined an in-flight load"),
+    ("negative_hits", "counter", "Lookups served from a cached failure"),
+    ("evictions", "counter", "Entries evicted by the size limit"),
+    ("loads", "counter", "Loader calls"),
+    ("load_errors", "counter", "Loader calls that raised"),
+)
+
+
+def cache_snapshot() -> Dict[str, Dict[str, float]]:
+    return {name: cache.stats() for name, cache in registered_caches().items()}
+
+
+def cache_summary() -> Dict[str, float]:
+    """등록된 캐시 전체의 합계. 정보 임베드에 한 줄로 보여줄 때 쓴다."""
+    snapshot = cache_snapshot()
+    hits = sum(s["hits"] + s["coalesced"] for s in snapshot.values())
+    lookups = hits + sum(s["misses"] for s in snapshot.values())
+    return {
+        "caches": len(snapshot),
+        "size": sum(s["size"] for s in snapshot.values()),
+        "inflight": sum(s["inflight"] for s in snapshot.values()),
+        "hit_ratio": hits / lookups if lookups else 0.0,
+    }
+
+
+def render_prometheus() -> str:
+    snapshot = cache_snapshot()
+    lines: List[str] = []
+    for field, kind, help_text in _PROMETHEUS_FIELDS:
+        metric = f"jee6_cache_{field}" + ("_total" if kind == "counter" else "")
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, stats in snapshot.items():
+            lines.append(f'{metric}{{cache="{name}"}} {stats[field]}')
+
+    lines.append("# HELP jee6_cache_load_seconds_avg Average loader latency")
+    lines.append("# TYPE jee6_cache_load_seconds_avg gauge")
+    for name, stats in snapshot.items():
+        lines.append(
+            f'jee6_cache_load_seconds_avg{{cache="{name}"}} {stats["avg_load_ms"] / 1000:.6f}'
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator
+
+
+class _Series:
+    __slots__ = ("count", "errors", "total", "max", "samples")
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+
+
+def _percentile(sorted_values, ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * ratio))
+    return sorted_values[index]
+
+
+class LatencyTracker:
+    def __init__(self, sample_size: int = 256):
+        self._sample_size = sample_size
+        self._series: Dict[str, _Series] = defaultdict(lambda: _Series(sample_size))
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            series = self._series[key]
+            series.count += 1
+            series.total += seconds
+            series.max = max(series.max, seconds)
+            series.samples.append(seconds)
+            if error:
+                series.errors += 1
+
+    @contextmanager
+    def measure(self, key: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(key, time.perf_counter() - started, error=True)
+            raise
+        self.record(key, time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            result = {}
+            for key, series in self._series.items():
+                samples = sorted(series.samples)
+                result[key] = {
+                    "count": series.count,
+                    "errors": series.errors,
+                    "avg_ms": series.total / series.count * 1000 if series.count else 0.0,
+                    "p50_ms": _percentile(samples, 0.5) * 1000,
+                    "p95_ms": _percentile(samples, 0.95) * 1000,
+                    "max_ms": series.max * 1000,
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
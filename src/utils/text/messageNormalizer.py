@@ -0,0 +1,12 @@
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+_REPEATED = re.compile(r"(.)\1{3,}")
+
+
+def normalize_message(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text).strip().lower()
+    text = _WHITESPACE.sub(" ", text)
+    # "ㅋㅋㅋㅋㅋㅋ" 와 "ㅋㅋㅋ" 가 같은 키가 되도록 4번 이상 반복은 3번으로 줄인다
+    return _REPEATED.sub(r"\1\1\1", text)
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.clients import ApiGatewayClient as gateway_module
+from src.clients.ApiGatewayClient import ApiGatewayClient
+from src.utils.concurrency.rateLimiter import RateLimiter
+from src.utils.cache.ttlCache import TTLCache
+
+
+class FakeGateway(ApiGatewayClient):
+    def __init__(self, responses):
+        self.base_url = "http://gateway"
+        self.responses = list(responses)
+        self.calls = 0
+        self._riot_limiter = RateLimiter([])
+        self._riot_cache = TTLCache(maxsize=16, ttl=30)
+
+    async def _request(self, path, params=None, endpoint=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.responses.pop(0)
+
+
+class TestApiGatewayRiot:
+    async def test_same_lookup_is_sent_once(self):
+        gateway = FakeGateway([(200, {}, {"tier": "GOLD"})])
+        results = await asyncio.gather(
+            *(gateway.get_lol_tier("hide#kr1") for _ in range(5))
+        )
+        assert results == [{"tier": "GOLD"}] * 5
+        assert gateway.calls == 1
+
+    async def test_retries_after_429(self):
+        gateway = FakeGateway(
+            [(429, {"Retry-After": "0"}, {}), (200, {}, {"matches": []})]
+        )
+        assert await gateway.get_valo_history("hide#kr1") == {"matches": []}
+        assert gateway.calls == 2
+
+    async def test_failures_are_not_cached(self):
+        gateway = FakeGateway(
+            [(503, {}, {"error": "down"}), (200, {}, {"tier": "GOLD"})]
+        )
+        with pytest.raises(ValueError):
+            await gateway.get_lol_tier("hide#kr1")
+        assert await gateway.get_lol_tier("hide#kr1") == {"tier": "GOLD"}
+
+    async def test_long_retry_after_fails_fast(self, monkeypatch):
+        monkeypatch.setattr(gateway_module, "RIOT_GATEWAY_ACQUIRE_TIMEOUT", 0.05)
+        gateway = FakeGateway([])
+        gateway._riot_limiter.update({"Retry-After": "60"}, 429)
+        with pytest.raises(ValueError, match="요청이 많아요"):
+            await gateway.get_lol_tier("hide#kr1")
+        assert gateway.calls == 0
@@ -0,0 +1,60 @@
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.database.pool import ConnectionPool, PoolTimeoutError
+
+
+def make_pool(**kwargs):
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    kwargs.setdefault("size", 2)
+    kwargs.setdefault("acquire_timeout", 0.05)
+    return ConnectionPool(factory=factory, **kwargs), factory
+
+
+class TestConnectionPool:
+    def test_reuses_released_connection(self):
+        pool, factory = make_pool()
+        conn = pool.acquire()
+        pool.release(conn)
+        assert pool.acquire() is conn
+        assert factory.call_count == 1
+
+    def test_acquire_timeout_is_counted(self):
+        pool, _ = make_pool(size=1)
+        pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+        assert pool.stats()["timeouts"] == 1
+
+    def test_waiter_gets_released_connection(self):
+        pool, _ = make_pool(size=1, acquire_timeout=1.0)
+        conn = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(conn,)).start()
+        assert pool.acquire() is conn
+
+    def test_idle_connection_is_recycled(self):
+        pool, factory = make_pool(max_idle=10)
+        conn = pool.acquire()
+        with patch("src.infrastructure.database.pool.time.monotonic", return_value=0):
+            pool.release(conn)
+        assert pool.acquire() is not conn
+        conn.close.assert_called_once()
+        assert pool.stats()["recycled"] == 1
+
+    def test_dead_connection_is_replaced(self):
+        pool, _ = make_pool(health_check_interval=0, is_alive=lambda c: c.alive)
+        conn = pool.acquire()
+        conn.alive = False
+        pool.release(conn)
+        fresh = pool.acquire()
+        assert fresh is not conn
+        assert pool.stats()["health_failures"] == 1
+        assert pool.stats()["open"] == 1
+
+    def test_broken_connection_is_discarded_on_error(self):
+        pool, _ = make_pool(is_alive=lambda c: False)
+        with pytest.raises(ValueError):
+            with pool.connection():
+                raise ValueError
+        assert pool.stats()["open"] == 0
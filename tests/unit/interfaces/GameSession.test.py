@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from src.interfaces.views.GameSession import ChoiceSession
+from src.utils.concurrency.deadlineTimer import DeadlineTimer
+
+
+def make_interaction(user_id):
+    interaction = MagicMock()
+    interaction.user.id = user_id
+    interaction.response.send_message = AsyncMock()
+    interaction.response.edit_message = AsyncMock()
+    interaction.response.defer = AsyncMock()
+    return interaction
+
+
+def make_session(handler, on_timeout=None, timeout=30.0):
+    session = ChoiceSession(
+        1, [("🔼", "up"), ("🔽", "down")], handler, on_timeout, timeout
+    )
+    session.message = MagicMock()
+    session.message.edit = AsyncMock()
+    session._touch()
+    return session
+
+
+class TestGameSession:
+    async def test_other_users_cannot_press_buttons(self):
+        session = make_session(AsyncMock())
+        interaction = make_interaction(2)
+
+        assert await session.interaction_check(interaction) is False
+        interaction.response.send_message.assert_awaited_once()
+        assert interaction.response.send_message.await_args.kwargs["ephemeral"] is True
+        assert await session.interaction_check(make_interaction(1)) is True
+
+    async def test_finished_move_closes_the_session(self):
+        embed = discord.Embed(title="끝")
+        session = make_session(AsyncMock(return_value=(embed, True)))
+        closed = []
+        session.on_close(lambda: closed.append(True))
+        interaction = make_interaction(1)
+
+        await session._handle(interaction, "up")
+
+        interaction.response.edit_message.assert_awaited_once_with(embed=embed, view=None)
+        assert session.finished and not session.running
+        assert closed == [True]
+
+    async def test_expire_waiting_on_a_click_does_not_end_the_game(self):
+        clicked = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_handler(action):
+            clicked.set()
+            await release.wait()
+            return discord.Embed(title="진행 중"), False
+
+        on_timeout = AsyncMock(return_value=discord.Embed(title="시간 초과"))
+        session = make_session(slow_handler, on_timeout, timeout=30.0)
+        session.deadline = asyncio.get_running_loop().time() - 1
+
+        click = asyncio.create_task(session._handle(make_interaction(1), "up"))
+        await clicked.wait()
+        expire = asyncio.create_task(session.expire())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(click, expire)
+
+        on_timeout.assert_not_awaited()
+        session.message.edit.assert_not_awaited()
+        assert session.running
+        assert len(DeadlineTimer.instance()) == 1
+        await DeadlineTimer.instance().close()
+        DeadlineTimer._instance = None
@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+from src.services.ActiveGameRegistry import ActiveGameRegistry
+
+
+class TestActiveGameRegistry:
+    def test_one_game_per_user(self):
+        registry = ActiveGameRegistry()
+        game = registry.start(1, 100, "blackjack")
+        assert game is not None
+        assert registry.start(1, 100, "coin") is None
+        assert registry.get(1).display_name == "블랙잭"
+
+        registry.end(game)
+        assert registry.get(1) is None
+        assert registry.start(1, 100, "coin") is not None
+
+    def test_abandoned_game_is_reaped(self):
+        registry = ActiveGameRegistry(max_age=60)
+        with patch("src.services.ActiveGameRegistry.time.monotonic", return_value=0):
+            stale = registry.start(1, 100, "dice")
+        with patch("src.services.ActiveGameRegistry.time.monotonic", return_value=61):
+            fresh = registry.start(1, 100, "coin")
+            assert fresh is not None
+            # 늦게 도착한 이전 게임의 end 가 새 게임을 지우면 안 된다
+            registry.end(stale)
+            assert registry.get(1) is fresh
+        assert registry.counters["reaped"] == 1
+
+    def test_counts_per_server(self):
+        registry = ActiveGameRegistry()
+        registry.start(1, 100, "dice")
+        registry.start(2, 100, "coin")
+        registry.start(3, 200, "coin")
+        assert registry.count_by_server() == {100: 2, 200: 1}
+        assert registry.stats()["peak_server"] == 2
@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock
+
+from src.services.BalanceLedger import BalanceLedger
+
+
+class FakeLedgerRepository:
+    def __init__(self):
+        self.checkpoint = 0
+        self.balances = {}
+        self.jackpots = {}
+        self.fail = False
+
+    async def get_checkpoint(self, name):
+        return self.checkpoint
+
+    async def apply_batch(self, name, seq, balance_deltas, jackpot_deltas):
+        if self.fail:
+            return False
+        for key, delta in balance_deltas.items():
+            self.balances[key] = max(0, self.balances.get(key, 0) + delta)
+        for server_id, delta in jackpot_deltas.items():
+            self.jackpots[server_id] = self.jackpots.get(server_id, 0) + delta
+        self.checkpoint = max(self.checkpoint, seq)
+        return True
+
+
+def make_ledger(tmp_path, ledger_repo, balance=1000, jackpot=1_000_000):
+    user_balance_repo = AsyncMock()
+    user_balance_repo.get_user_balance.return_value = balance
+    jackpot_repo = AsyncMock()
+    jackpot_repo.get_jackpot.return_value = jackpot
+    return BalanceLedger(
+        user_balance_repo,
+        jackpot_repo,
+        ledger_repo,
+        str(tmp_path),
+        flush_interval=60,
+    )
+
+
+class TestBalanceLedger:
+    async def test_reads_are_served_from_memory(self, tmp_path):
+        ledger = make_ledger(tmp_path, FakeLedgerRepository())
+        assert await ledger.add_balance(1, 10, 500) == 1500
+        assert await ledger.subtract_balance(1, 10, 2000) == 0
+        assert await ledger.get_balance(1, 10) == 0
+        ledger.user_balance_repo.get_user_balance.assert_awaited_once()
+        await ledger.close()
+
+    async def test_flush_applies_net_deltas(self, tmp_path):
+        repo = FakeLedgerRepository()
+        ledger = make_ledger(tmp_path, repo)
+        await ledger.add_balance(1, 10, 500)
+        await ledger.add_balance(1, 10, 250)
+        await ledger.add_jackpot(10, 100)
+        assert await ledger.flush()
+        assert repo.balances == {(1, 10): 750}
+        assert repo.jackpots == {10: 100}
+        assert repo.checkpoint == 3
+        assert len(list(tmp_path.glob("journal-*.jsonl"))) == 1
+        await ledger.close()
+
+    async def test_transfer_rejects_insufficient_balance(self, tmp_path):
+        ledger = make_ledger(tmp_path, FakeLedgerRepository(), balance=100)
+        assert await ledger.transfer(1, 2, 10, 500, 25) is None
+        assert await ledger.transfer(1, 2, 10, 100, 5) == (0, 195)
+        await ledger.close()
+
+    async def test_journal_is_replayed_after_crash(self, tmp_path):
+        repo = FakeLedgerRepository()
+        repo.fail = True
+        crashed = make_ledger(tmp_path, repo)
+        await crashed.add_balance(1, 10, 500)
+        await crashed.subtract_jackpot(10, 10)
+        assert not await crashed.flush()
+
+        repo.fail = False
+        restarted = make_ledger(tmp_path, repo)
+        await restarted.start()
+        assert repo.balances == {(1, 10): 500}
+        assert repo.checkpoint == 1
+
+        again = make_ledger(tmp_path, repo)
+        await again.start()
+        assert repo.balances == {(1, 10): 500}
+        await restarted.close()
+        await again.close()
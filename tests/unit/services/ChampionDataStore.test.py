@@ -0,0 +1,28 @@
+from unittest.mock import AsyncMock
+
+from src.services.ChampionDataStore import ChampionDataStore
+
+
+class TestChampionDataStore:
+    async def test_starts_offline_from_cached_version(self, tmp_path):
+        ChampionDataStore(str(tmp_path))._write_cache("14.1.1", {"Ahri": {"key": "103", "name": "아리"}})
+        ChampionDataStore(str(tmp_path))._write_cache("14.2.1", {"Ahri": {"key": "103", "name": "아리"}, "Zed": {"key": "238", "name": "제드"}})
+        assert [p.name for p in tmp_path.glob("champion-*.json")] == ["champion-14.2.1.json"]
+
+        store = ChampionDataStore(str(tmp_path))
+        store.refresh = AsyncMock(return_value=False)
+        await store.ensure_loaded()
+        assert store.version == "14.2.1"
+        assert store.data["Zed"]["name"] == "제드"
+        await store.close()
+
+    def test_indexes_follow_applied_version(self, tmp_path):
+        store = ChampionDataStore(str(tmp_path))
+        store._apply("14.1.1", {"Ahri": {"key": "103", "name": "아리"}})
+        assert store.kr_name("Ahri") == "아리"
+        assert store.by_key(103) == ("아리", "Ahri")
+        assert store.kr_name("Unknown") == "Unknown"
+
+        store._apply("14.2.1", {"Zed": {"key": "238", "name": "제드"}})
+        assert store.by_key(103) is None
+        assert store.by_key(238) == ("제드", "Zed")
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from src.services.ChannelFeatureRegistry import ChannelFeatureRegistry
+
+
+class FakeChannelFeatureRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+        self.fail = False
+
+    async def get_changes(self, since):
+        self.calls.append(since)
+        if self.fail:
+            return None
+        return [row for row in self.rows if since is None or row[4] >= since]
+
+
+def at(minute):
+    return datetime(2025, 1, 1, 12, minute)
+
+
+class TestChannelFeatureRegistry:
+    async def test_incremental_refresh_applies_changes(self):
+        repo = FakeChannelFeatureRepository([
+            ("lang", 1, 100, True, at(0)),
+            ("slow_mode", 1, 200, True, at(0)),
+        ])
+        registry = ChannelFeatureRegistry(repo)
+        assert await registry.refresh()
+        assert registry.is_enabled("lang", 100)
+        assert not registry.is_enabled("filter", 100)
+
+        repo.rows = [("lang", 1, 100, False, at(10)), ("slow_mode", 1, 201, True, at(10))]
+        assert await registry.refresh()
+        assert repo.calls[-1] == at(0) - ChannelFeatureRegistry.OVERLAP
+        assert not registry.is_enabled("lang", 100)
+        assert registry.channels("slow_mode") == {201}
+
+    async def test_failed_load_backs_off(self):
+        repo = FakeChannelFeatureRepository([("filter", 1, 100, True, at(0))])
+        repo.fail = True
+        registry = ChannelFeatureRegistry(repo, base_backoff=60)
+        assert not await registry.refresh()
+        assert not await registry.refresh()
+        assert len(repo.calls) == 1
+
+        repo.fail = False
+        assert await registry.refresh(force=True)
+        assert registry.is_enabled("filter", 100)
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.CooldownIndex import CooldownIndex
+
+DURATIONS = {"coin": 5, "jackpot_win": 1800}
+
+
+def make_index(**kwargs):
+    repo = MagicMock()
+    repo.get_cooldowns_since = AsyncMock(return_value=[])
+    repo.set_cooldowns = AsyncMock(return_value=True)
+    return CooldownIndex(repo, durations=DURATIONS, persist_min=300, **kwargs), repo
+
+
+class TestCooldownIndex:
+    def test_remaining_counts_down_without_io(self):
+        index, repo = make_index()
+        with patch("src.services.CooldownIndex.time.monotonic", return_value=100.0):
+            index.set(1, "coin")
+        with patch("src.services.CooldownIndex.time.monotonic", return_value=102.0):
+            assert index.remaining(1, "coin") == 3
+        with patch("src.services.CooldownIndex.time.monotonic", return_value=106.0):
+            assert index.remaining(1, "coin") == 0
+        assert index.remaining(2, "coin") == 0
+        repo.get_cooldowns_since.assert_not_called()
+
+    async def test_only_long_cooldowns_are_flushed_in_one_batch(self):
+        index, repo = make_index()
+        index.set(1, "coin")
+        index.set(1, "jackpot_win")
+        index.set(2, "jackpot_win")
+
+        assert await index.flush()
+        rows = repo.set_cooldowns.await_args.args[0]
+        assert sorted((user_id, action) for user_id, action, _ in rows) == [
+            (1, "jackpot_win"),
+            (2, "jackpot_win"),
+        ]
+        assert index.stats()["pending"] == 0
+
+    async def test_failed_flush_is_retried(self):
+        index, repo = make_index()
+        repo.set_cooldowns.return_value = False
+        index.set(1, "jackpot_win")
+
+        assert not await index.flush()
+        assert index.stats()["pending"] == 1
+
+    def test_wheel_prunes_expired_entries(self):
+        with patch("src.services.CooldownIndex.time.monotonic", return_value=100.0):
+            index, _ = make_index(slots=8, tick=1.0)
+            index.set(1, "coin")
+            index.set(2, "coin", seconds=20)
+
+        assert index.prune(now=104.0) == 0
+        assert index.prune(now=106.0) == 1
+        assert len(index) == 1
+        # 슬롯 한 바퀴(8초)보다 긴 쿨다운도 만료된 뒤에 지워진다
+        assert index.prune(now=115.0) == 0
+        assert index.prune(now=121.5) == 1
+        assert len(index) == 0
+
+    async def test_start_restores_unexpired_long_cooldowns(self):
+        index, repo = make_index()
+        used = datetime.utcnow() - timedelta(seconds=1700)
+        repo.get_cooldowns_since.return_value = [(1, "jackpot_win", used)]
+
+        await index.start()
+        try:
+            assert 90 <= index.remaining(1, "jackpot_win") <= 100
+            assert repo.get_cooldowns_since.await_args.args[0] == ["jackpot_win"]
+        finally:
+            await index.close()
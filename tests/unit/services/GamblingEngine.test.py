@@ -0,0 +1,49 @@
+import random
+
+from src.services import GamblingEngine
+
+
+class StackedDeck:
+    """shuffle 결과를 정해 두는 rng. pop() 이 뒤에서부터 꺼내므로 뒤집어서 넣는다."""
+
+    def __init__(self, top_cards):
+        self.top_cards = top_cards
+
+    def shuffle(self, deck):
+        deck[-len(self.top_cards):] = reversed(self.top_cards)
+
+
+class TestGamblingEngine:
+    def test_baccarat_third_card_rules(self):
+        # 플레이어 2+3=5 → 한 장 더(4) = 9, 뱅커 K+7=7 → 멈춤
+        round_ = GamblingEngine.play_baccarat(StackedDeck(["2", "3", "K", "7", "4"]))
+        assert round_.player_hand == ["2", "3", "4"]
+        assert round_.banker_hand == ["K", "7"]
+        assert (round_.player_value, round_.banker_value, round_.result) == (9, 7, "Player")
+
+    def test_dealer_draws_to_seventeen(self):
+        deck = ["9", "5"]
+        dealer_hand = ["2", "3"]
+        assert GamblingEngine.play_dealer(deck, dealer_hand) == 19
+        assert dealer_hand == ["2", "3", "5", "9"]
+
+    def test_blackjack_push_and_bust_lose(self):
+        assert GamblingEngine.blackjack_wins(20, 19)
+        assert GamblingEngine.blackjack_wins(18, 22)
+        assert not GamblingEngine.blackjack_wins(19, 19)
+        assert not GamblingEngine.blackjack_wins(22, 23)
+
+    def test_settle_keeps_stake_on_win(self):
+        assert GamblingEngine.settle(10_000, False, 1.5, "coin") == (-10_000, 0)
+        net, tax = GamblingEngine.settle(10_000, True, 1.5, "coin")
+        assert tax == 75  # 15,000원의 증권거래세 0.5%
+        assert net == 15_000 - 75
+
+    def test_seeded_rounds_are_reproducible(self):
+        first = [GamblingEngine.roll_dice(random.Random(7)) for _ in range(3)]
+        second = [GamblingEngine.roll_dice(random.Random(7)) for _ in range(3)]
+        assert first == second
+        assert GamblingEngine.flip_coin(random.Random(1)) in GamblingEngine.COIN_SIDES
+
+    def test_jackpot_payout_is_a_tenth(self):
+        assert GamblingEngine.jackpot_payout(1_234_567) == 123_456
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 @pytest.fixture
@@ -91,3 +92,46 @@ class TestCalculateBaccaratValue:
 
     def test_ace_worth_one(self, gambling_service):
         assert gambling_service.calculate_baccarat_value(["A", "9"]) == 0  # 10 % 10
+
+
+class TestCachedRankings:
+    async def test_resolves_members_locally_and_caches_full_list(self, gambling_service):
+        gambling_service._rankings_cache.clear()
+        gambling_service.ledger = None
+        gambling_service.user_balance_repo.get_all_balances = AsyncMock(
+            return_value=[(3, 100), (1, 300), (2, 200)]
+        )
+        guild = MagicMock()
+        guild.get_member.side_effect = lambda uid: (
+            None if uid == 3 else SimpleNamespace(name=f"멤버{uid}")
+        )
+        bot = MagicMock()
+        bot.get_guild.return_value = guild
+        bot.get_user.return_value = None
+        bot.fetch_user = AsyncMock(side_effect=Exception("not found"))
+
+        top = await gambling_service.get_cached_rankings(10, bot, 1)
+        full = await gambling_service.get_cached_rankings(10, bot, 100)
+
+        assert top == [(1, "멤버1", 300)]
+        assert full[2] == (3, "누구세요(3)", 100)
+        bot.fetch_user.assert_awaited_once_with(3)
+        gambling_service.user_balance_repo.get_all_balances.assert_awaited_once()
+        gambling_service._rankings_cache.clear()
+
+    async def test_rank_info_reports_percentile_and_neighbors(self, gambling_service):
+        gambling_service.ledger = None
+        gambling_service.user_balance_repo.get_all_balances = AsyncMock(
+            return_value=[(uid, uid * 100) for uid in range(1, 101)]
+        )
+        bot = MagicMock()
+        bot.get_guild.return_value = None
+        bot.get_user.side_effect = lambda uid: SimpleNamespace(name=f"유저{uid}")
+
+        info = await gambling_service.get_rank_info(20, 91, bot, radius=1)
+
+        assert info["rank"] == 10
+        assert info["total"] == 100
+        assert info["percentile"] == 10
+        assert [n[0] for n in info["neighbors"]] == [9, 10, 11]
+        assert info["neighbors"][1] == (10, 91, "유저91", 9100)
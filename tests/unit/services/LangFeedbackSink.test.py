@@ -0,0 +1,47 @@
+import asyncio
+
+from src.services.LangFeedbackSink import LangFeedbackSink
+
+
+class FakeFeedbackRepository:
+    def __init__(self):
+        self.batches = []
+
+    async def add_many(self, rows):
+        if any(row["user_message"] == "bad" for row in rows):
+            raise ValueError("bad row")
+        self.batches.append(rows)
+        return len(rows)
+
+
+class TestLangFeedbackSink:
+    async def test_rows_are_written_in_batches(self):
+        repo = FakeFeedbackRepository()
+        sink = LangFeedbackSink(repo, maxsize=100, batch_size=3, flush_interval=0.01)
+        for i in range(5):
+            assert sink.submit(guild_id=1, user_message=f"msg {i}", parsed_action="ignore")
+        await asyncio.sleep(0.05)
+        assert [len(batch) for batch in repo.batches] == [3, 2]
+        assert repo.batches[0][0]["signal"] is None
+        await sink.close()
+
+    async def test_overflow_is_dropped_and_counted(self):
+        repo = FakeFeedbackRepository()
+        sink = LangFeedbackSink(repo, maxsize=2, batch_size=10, flush_interval=10)
+        results = [sink.submit(user_message=str(i)) for i in range(3)]
+        assert results == [True, True, False]
+        assert sink.stats()["dropped"] == 1
+
+        await sink.close()
+        assert sum(len(batch) for batch in repo.batches) == 2
+        assert sink.stats()["pending"] == 0
+        assert not sink.submit(user_message="late")
+
+    async def test_bad_row_does_not_drop_its_batch(self):
+        repo = FakeFeedbackRepository()
+        sink = LangFeedbackSink(repo, maxsize=100, batch_size=10, flush_interval=10)
+        await sink._write([{"user_message": m} for m in ["a", "bad", "b"]])
+
+        assert [row["user_message"] for batch in repo.batches for row in batch] == ["a", "b"]
+        assert sink.stats()["written"] == 2
+        assert sink.stats()["failed"] == 1
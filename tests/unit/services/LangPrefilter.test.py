@@ -0,0 +1,30 @@
+from src.services.LangPrefilter import LangPrefilter
+
+REQUESTS = ["내일 날씨 어때", "너 누구야", "날씨 알려줘", "지금 수업 언제 끝나"]
+CHATTER = ["그거 개웃기네", "아 진짜 짜증나", "아 배고프다", "야 너 어디야", "ㄹㅇ 개웃김"]
+
+
+def trained_prefilter():
+    prefilter = LangPrefilter(threshold=0.5, min_samples=3)
+    prefilter.train([(t, True) for t in REQUESTS] + [(t, False) for t in CHATTER])
+    return prefilter
+
+
+class TestLangPrefilter:
+    def test_keyword_is_always_forwarded(self):
+        assert LangPrefilter().classify("오늘 급식 뭐야") == (True, "keyword")
+
+    def test_jamo_only_chatter_is_dropped(self):
+        assert LangPrefilter().classify("ㅋㅋㅋㅋㅋ") == (False, "chatter")
+
+    def test_untrained_forwards_everything_else(self):
+        prefilter = LangPrefilter(min_samples=3)
+        prefilter.train([("날씨 알려줘", True)])
+        assert not prefilter.trained
+        assert prefilter.classify("아 배고프다") == (True, "untrained")
+
+    def test_model_separates_requests_from_chatter(self):
+        prefilter = trained_prefilter()
+        assert prefilter.classify("날씨 어때") == (True, "model")
+        assert prefilter.classify("개웃기네 진짜") == (False, "model")
+        assert prefilter.stats()["model_drop"] == 1
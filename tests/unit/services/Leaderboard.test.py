@@ -0,0 +1,61 @@
+import asyncio
+
+from src.services.Leaderboard import Leaderboard, LeaderboardIndex
+
+
+class TestLeaderboard:
+    def test_update_moves_only_the_changed_user(self):
+        board = Leaderboard([(1, 100), (2, 300), (3, 200)])
+        assert board.top(3) == [(2, 300), (3, 200), (1, 100)]
+
+        board.update(1, 400)
+        assert board.rank(1) == 1
+        assert board.rank(2) == 2
+        assert board.top(2) == [(1, 400), (2, 300)]
+
+    def test_ties_follow_user_id_order(self):
+        board = Leaderboard([(5, 100), (2, 100)])
+        assert board.rank(2) == 1
+        assert board.rank(5) == 2
+
+    def test_unknown_user_has_no_rank(self):
+        assert Leaderboard().rank(1) is None
+
+    def test_around_returns_neighbors_with_ranks(self):
+        board = Leaderboard([(uid, uid * 10) for uid in range(1, 11)])
+        assert board.around(5, 1) == [(5, 6, 60), (6, 5, 50), (7, 4, 40)]
+        assert board.around(10, 2) == [(1, 10, 100), (2, 9, 90), (3, 8, 80)]
+
+
+class TestLeaderboardIndex:
+    async def test_updates_during_load_are_kept(self):
+        release = asyncio.Event()
+        calls = 0
+
+        async def load(server_id):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [(1, 100), (2, 50)]
+
+        index = LeaderboardIndex(load)
+        first = asyncio.create_task(index.get(10))
+        second = asyncio.create_task(index.get(10))
+        await asyncio.sleep(0)
+        index.update(10, 2, 500)
+        release.set()
+
+        board = await first
+        assert await second is board
+        assert calls == 1
+        assert board.top(2) == [(2, 500), (1, 100)]
+
+    async def test_failed_load_is_retried(self):
+        results = [None, [(1, 10)]]
+
+        async def load(server_id):
+            return results.pop(0)
+
+        index = LeaderboardIndex(load)
+        assert await index.get(1) is None
+        assert (await index.get(1)).rank(1) == 1
@@ -0,0 +1,26 @@
+from src.utils.cache.ttlCache import TTLCache
+from src.utils.metrics.cacheMetrics import cache_summary, render_prometheus
+
+
+class TestCacheMetrics:
+    def test_prometheus_text_has_one_sample_per_cache(self):
+        cache = TTLCache(maxsize=4, ttl=60, name="test.metrics")
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        text = render_prometheus()
+        assert '# TYPE jee6_cache_hits_total counter' in text
+        assert 'jee6_cache_hits_total{cache="test.metrics"} 1' in text
+        assert 'jee6_cache_size{cache="test.metrics"} 1' in text
+        assert text.endswith("\n")
+
+    def test_summary_totals_registered_caches(self):
+        cache = TTLCache(maxsize=4, ttl=60, name="test.summary")
+        cache.set("a", 1)
+        cache.get("a")
+
+        summary = cache_summary()
+        assert summary["caches"] >= 1
+        assert summary["size"] >= 1
+        assert 0 < summary["hit_ratio"] <= 1
@@ -0,0 +1,53 @@
+import asyncio
+
+from src.utils.concurrency.deadlineTimer import DeadlineTimer
+
+
+class FakeSession:
+    def __init__(self, delay):
+        self.deadline = asyncio.get_running_loop().time() + delay
+        self.finished = False
+        self.expired = 0
+
+    async def expire(self):
+        self.expired += 1
+        self.finished = True
+
+
+class TestDeadlineTimer:
+    async def test_expires_in_deadline_order_with_one_task(self):
+        timer = DeadlineTimer()
+        late, early = FakeSession(0.05), FakeSession(0.01)
+        timer.schedule(late)
+        task = timer._task
+        timer.schedule(early)
+        assert timer._task is task
+
+        await asyncio.sleep(0.03)
+        assert early.expired == 1 and late.expired == 0
+        await asyncio.sleep(0.05)
+        assert late.expired == 1
+        await timer.close()
+
+    async def test_extended_deadline_is_rescheduled(self):
+        timer = DeadlineTimer()
+        session = FakeSession(0.02)
+        timer.schedule(session)
+        session.deadline += 0.05
+
+        await asyncio.sleep(0.04)
+        assert session.expired == 0
+        await asyncio.sleep(0.05)
+        assert session.expired == 1
+        await timer.close()
+
+    async def test_finished_sessions_are_dropped(self):
+        timer = DeadlineTimer()
+        session = FakeSession(0.01)
+        timer.schedule(session)
+        session.finished = True
+
+        await asyncio.sleep(0.03)
+        assert session.expired == 0
+        assert len(timer) == 0
+        await timer.close()
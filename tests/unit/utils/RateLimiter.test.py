@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.concurrency.rateLimiter import Priority, RateLimiter, parse_rate_limits
+
+
+class TestRateLimiter:
+    def test_parse_rate_limits(self):
+        assert parse_rate_limits("20:1,100:120") == [(20, 1), (100, 120)]
+        assert parse_rate_limits(None) == []
+
+    async def test_interactive_requests_are_served_first(self):
+        limiter = RateLimiter([(1, 1)])
+        await limiter.acquire()
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        background = asyncio.create_task(request("background", Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", Priority.INTERACTIVE))
+        await asyncio.wait_for(asyncio.gather(background, interactive), timeout=3)
+        assert order == ["interactive", "background"]
+
+    async def test_retry_after_blocks_requests(self):
+        limiter = RateLimiter([(100, 1)])
+        limiter.update({"Retry-After": "0.2"}, 429)
+        started = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - started >= 0.15
+
+    async def test_server_counts_reduce_tokens(self):
+        limiter = RateLimiter([(20, 1), (100, 120)])
+        limiter.update({"X-App-Rate-Limit-Count": "20:1,20:120"}, 200)
+        started = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - started >= 0.03
+
+    async def test_acquire_times_out_and_frees_its_slot(self):
+        limiter = RateLimiter([])
+        limiter.update({"Retry-After": "0.2"}, 429)
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire(timeout=0.05)
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
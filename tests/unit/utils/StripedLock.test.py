@@ -0,0 +1,39 @@
+import asyncio
+
+from src.utils.concurrency.stripedLock import StripedLock
+
+
+class TestStripedLock:
+    async def test_opposite_multi_key_holds_do_not_deadlock(self):
+        locks = StripedLock(stripes=8)
+        order = []
+
+        async def transfer(a, b):
+            async with locks.hold(a, b):
+                order.append((a, b))
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(
+            asyncio.gather(transfer(1, 2), transfer(2, 1)), timeout=1
+        )
+        assert len(order) == 2
+
+    async def test_keys_on_the_same_stripe_are_held_once(self):
+        locks = StripedLock(stripes=1)
+        async with locks.hold(1, 2, 3):
+            assert locks.stats()["held"] == 1
+        assert locks.stats()["held"] == 0
+
+    async def test_contention_is_counted(self):
+        locks = StripedLock(stripes=4)
+
+        async def worker():
+            async with locks.hold(7):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(worker(), worker())
+        stats = locks.stats()
+        assert stats["acquired"] == 2
+        assert stats["contended"] == 1
+        assert stats["hot_keys"] == [(7, 1)]
+        assert stats["wait"]["max_ms"] > 0
@@ -0,0 +1,130 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from src.utils.cache.ttlCache import TTLCache, registered_caches
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+        with patch("src.utils.cache.ttlCache.time.monotonic", return_value=0):
+            cache.set("a", 1)
+        with patch("src.utils.cache.ttlCache.time.monotonic", return_value=11):
+            assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+    async def test_concurrent_loads_share_one_call(self):
+        cache = TTLCache(maxsize=8, ttl=60)
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 4
+
+    async def test_failed_load_is_not_cached(self):
+        cache = TTLCache(maxsize=8, ttl=60)
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await cache.get_or_load("k", fail)
+        assert len(cache) == 0
+
+    async def test_failures_are_cached_for_negative_ttl(self):
+        cache = TTLCache(maxsize=8, ttl=60, negative_ttl=30)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            raise ValueError("없음")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await cache.get_or_load("k", loader)
+        assert calls == 1
+        assert cache.get("k") is None
+        assert cache.stats()["negative_hits"] == 1
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        cache = TTLCache(maxsize=8, ttl=60)
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_load("k", load))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_load("k", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.gather(*waiters) == ["value"] * 3
+        assert leader.cancelled()
+        assert calls == 2
+
+    async def test_clear_discards_loads_started_before_it(self):
+        cache = TTLCache(maxsize=8, ttl=60)
+        release = asyncio.Event()
+        versions = iter(["old", "new"])
+
+        async def load():
+            version = next(versions)
+            if version == "old":
+                await release.wait()
+            return version
+
+        stale = asyncio.create_task(cache.get_or_load("k", load))
+        await asyncio.sleep(0)
+        cache.clear()
+        assert await cache.get_or_load("k", load) == "new"
+
+        release.set()
+        assert await stale == "old"
+        assert cache.get("k") == "new"
+        assert cache.stats()["inflight"] == 0
+
+    def test_named_caches_are_registered(self):
+        cache = TTLCache(name="test.registry")
+        assert registered_caches()["test.registry"] is cache
+
+    async def test_load_latency_and_inflight_are_reported(self):
+        cache = TTLCache(maxsize=8, ttl=60)
+        started = asyncio.Event()
+
+        async def load():
+            started.set()
+            await asyncio.sleep(0.01)
+            return 1
+
+        task = asyncio.create_task(cache.get_or_load("k", load))
+        await started.wait()
+        assert cache.stats()["inflight"] == 1
+        await task
+
+        stats = cache.stats()
+        assert stats["inflight"] == 0
+        assert stats["loads"] == 1
+        assert stats["avg_load_ms"] > 0